@@ -0,0 +1,101 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# Compares the Newton iterations of a fixed step forward bias ramp with
+# devsim.python_packages.ramp.rampbias_adaptive on the diode_1d device.
+
+from devsim import set_parameter, solve
+
+import devsim.python_packages.simple_physics as simple_physics
+from devsim.python_packages.ramp import (
+    get_solution_names,
+    get_solution_snapshot,
+    rampbias_adaptive,
+    set_solution_snapshot,
+)
+import diode_common
+
+device = "MyDevice"
+region = "MyRegion"
+
+end_bias = 0.8
+step_size = 0.05
+
+diode_common.CreateMesh(device=device, region=region)
+
+diode_common.SetParameters(device=device, region=region)
+set_parameter(device=device, region=region, name="taun", value=1e-8)
+set_parameter(device=device, region=region, name="taup", value=1e-8)
+
+diode_common.SetNetDoping(device=device, region=region)
+
+diode_common.InitialSolution(device, region)
+
+solve(type="dc", absolute_error=1.0, relative_error=1e-10, maximum_iterations=30)
+
+diode_common.DriftDiffusionInitialSolution(device, region)
+
+solve(type="dc", absolute_error=1e10, relative_error=1e-10, maximum_iterations=30)
+
+bias_name = simple_physics.GetContactBiasName("top")
+equilibrium = get_solution_snapshot(device, get_solution_names(device))
+
+
+def no_callback(device):
+    pass
+
+
+def restore_equilibrium():
+    set_parameter(device=device, name=bias_name, value=0.0)
+    set_solution_snapshot(device, equilibrium)
+    solve(type="dc", absolute_error=1e10, relative_error=1e-10, maximum_iterations=30)
+
+
+####
+#### Fixed step ramp
+####
+fixed_iterations = 0
+fixed_points = 0
+v = 0.0
+while v < end_bias - 0.5 * step_size:
+    v += step_size
+    set_parameter(device=device, name=bias_name, value=v)
+    info = solve(
+        type="dc",
+        absolute_error=1e10,
+        relative_error=1e-10,
+        maximum_iterations=30,
+        info=True,
+    )
+    if not info["converged"]:
+        raise RuntimeError("Fixed step ramp failed at %g" % v)
+    fixed_iterations += len(info["iterations"])
+    fixed_points += 1
+simple_physics.PrintCurrents(device, "top")
+
+results = {}
+for extrapolation in ("none", "linear", "quadratic"):
+    restore_equilibrium()
+    results[extrapolation] = rampbias_adaptive(
+        device,
+        "top",
+        end_bias,
+        step_size,
+        min_step=1e-3,
+        max_iter=30,
+        rel_error=1e-10,
+        abs_error=1e10,
+        callback=no_callback,
+        max_step=0.2,
+        extrapolation=extrapolation,
+    )
+    simple_physics.PrintCurrents(device, "top")
+
+print("fixed step   %3d bias points %4d iterations" % (fixed_points, fixed_iterations))
+for extrapolation, statistics in results.items():
+    total = statistics["newton_iterations"] + statistics["failed_iterations"]
+    print(
+        "%-12s %3d bias points %4d iterations %4d saved"
+        % (extrapolation, statistics["bias_points"], total, fixed_iterations - total)
+    )
@@ -0,0 +1,96 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# Sweeps the lifetimes and doping of the diode_1d device with
+# devsim.python_packages.sweep.run_continuation_sweep, starting each point
+# from the nearest converged point instead of the potential only solution.
+
+from devsim import get_contact_current, set_node_values, set_parameter, solve
+
+import devsim.python_packages.simple_physics as simple_physics
+from devsim.python_packages.model_create import CreateNodeModel
+from devsim.python_packages.ramp import rampbias_adaptive
+from devsim.python_packages.sweep import (
+    parameter_grid,
+    run_continuation_sweep,
+    solve_counted,
+)
+import diode_common
+
+device = "MyDevice"
+region = "MyRegion"
+bias_name = simple_physics.GetContactBiasName("top")
+
+diode_common.CreateMesh(device=device, region=region)
+diode_common.SetParameters(device=device, region=region)
+diode_common.SetNetDoping(device=device, region=region)
+diode_common.InitialSolution(device, region)
+solve(type="dc", absolute_error=1.0, relative_error=1e-10, maximum_iterations=30)
+diode_common.DriftDiffusionInitialSolution(device, region)
+CreateNodeModel(device, region, "NeutralPotential", "V_t*asinh(NetDoping/(2*n_i))")
+
+
+def apply_point(point):
+    set_parameter(device=device, name=bias_name, value=0.0)
+    set_parameter(device=device, region=region, name="taun", value=point["tau"])
+    set_parameter(device=device, region=region, name="taup", value=point["tau"])
+    doping = "%g" % point["doping"]
+    CreateNodeModel(device, region, "Acceptors", doping + "*step(0.5e-5-x)")
+    CreateNodeModel(device, region, "Donors", doping + "*step(x-0.5e-5)")
+    # replacing the models above does not update NetDoping
+    CreateNodeModel(device, region, "NetDoping", "Donors-Acceptors")
+
+
+def drift_diffusion_solve(point):
+    return solve_counted(
+        type="dc", absolute_error=1e10, relative_error=1e-10, maximum_iterations=30
+    )
+
+
+def cold_start(point):
+    # charge neutral initial guess
+    set_node_values(
+        device=device, region=region, name="Potential", init_from="NeutralPotential"
+    )
+    for name in ("Electrons", "Holes"):
+        set_node_values(
+            device=device, region=region, name=name, init_from="Intrinsic" + name
+        )
+    return drift_diffusion_solve(point)
+
+
+def forward_current(point):
+    rampbias_adaptive(
+        device,
+        "top",
+        0.5,
+        0.1,
+        min_step=1e-3,
+        max_iter=30,
+        rel_error=1e-10,
+        abs_error=1e10,
+        callback=lambda device: None,
+    )
+    return sum(
+        get_contact_current(device=device, contact="top", equation=equation)
+        for equation in (simple_physics.ece_name, simple_physics.hce_name)
+    )
+
+
+points = parameter_grid(tau=[1e-8, 1e-7, 1e-6], doping=[1e16, 1e17, 1e18])
+results = run_continuation_sweep(
+    device, points, apply_point, cold_start, drift_diffusion_solve, forward_current
+)
+
+for r in results:
+    print(
+        "tau %g doping %g current %g iterations %d %s"
+        % (
+            r["point"]["tau"],
+            r["point"]["doping"],
+            r["result"],
+            r["iterations"],
+            "warm" if r["warm"] else "cold",
+        )
+    )
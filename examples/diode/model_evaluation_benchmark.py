@@ -0,0 +1,91 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# Compares the tree evaluation of the simple_physics drift-diffusion models with
+# the compiled evaluation enabled by the "compiled_models" parameter.
+#
+# usage: python model_evaluation_benchmark.py [nodes] [repeats]
+
+import sys
+import time
+
+import devsim
+import diode_common
+
+device = "MyDevice"
+region = "MyRegion"
+
+nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+devsim.create_1d_mesh(mesh="dio")
+devsim.add_1d_mesh_line(mesh="dio", pos=0, ps=1e-5 / nodes, tag="top")
+devsim.add_1d_mesh_line(mesh="dio", pos=1e-5, ps=1e-5 / nodes, tag="bot")
+devsim.add_1d_contact(mesh="dio", name="top", tag="top", material="metal")
+devsim.add_1d_contact(mesh="dio", name="bot", tag="bot", material="metal")
+devsim.add_1d_region(mesh="dio", material="Si", region=region, tag1="top", tag2="bot")
+devsim.finalize_mesh(mesh="dio")
+devsim.create_device(mesh="dio", device=device)
+
+diode_common.SetParameters(device=device, region=region)
+diode_common.SetNetDoping(device=device, region=region)
+diode_common.InitialSolution(device, region)
+devsim.solve(type="dc", absolute_error=1.0, relative_error=1e-10, maximum_iterations=30)
+diode_common.DriftDiffusionInitialSolution(device, region)
+devsim.solve(
+    type="dc", absolute_error=1e10, relative_error=1e-10, maximum_iterations=30
+)
+
+edge_models = [
+    m
+    for m in devsim.get_edge_model_list(device=device, region=region)
+    if m.startswith("ElectronCurrent") or m.startswith("HoleCurrent")
+]
+node_models = [
+    m
+    for m in devsim.get_node_model_list(device=device, region=region)
+    if m.startswith("USRH")
+]
+potential = devsim.get_node_model_values(device=device, region=region, name="Potential")
+
+
+def evaluate_models(compiled):
+    devsim.set_parameter(name="compiled_models", value=compiled)
+    values = {}
+    start = time.perf_counter()
+    for _ in range(repeats):
+        # marks the models depending on the potential as out of date
+        devsim.set_node_values(
+            device=device, region=region, name="Potential", values=potential
+        )
+        for m in edge_models:
+            values[m] = devsim.get_edge_model_values(
+                device=device, region=region, name=m
+            )
+        for m in node_models:
+            values[m] = devsim.get_node_model_values(
+                device=device, region=region, name=m
+            )
+    return time.perf_counter() - start, values
+
+
+t_tree, tree_values = evaluate_models(False)
+t_compiled, compiled_values = evaluate_models(True)
+
+max_difference = 0.0
+for m, v in tree_values.items():
+    for x, y in zip(v, compiled_values[m]):
+        if x != y:
+            max_difference = max(
+                max_difference, abs(x - y) / max(abs(x), abs(y), 1e-300)
+            )
+
+print(
+    "%d nodes, %d edge models, %d node models, %d repeats"
+    % (nodes, len(edge_models), len(node_models), repeats)
+)
+print("tree     %8.3f s" % t_tree)
+print("compiled %8.3f s" % t_compiled)
+print("speedup  %8.2f" % (t_tree / t_compiled))
+print("maximum relative difference %g" % max_difference)
@@ -0,0 +1,252 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# Compares devsim.python_packages.pythonmesh.read_gmsh_file with
+# stream_gmsh_file and read_gmsh4_file on a generated tetrahedral mesh.
+#
+# usage: python pythonmesh_benchmark.py [cubes_per_side] [max_workers]
+
+import array
+import os
+import struct
+import sys
+import tempfile
+import time
+
+from devsim.python_packages.pythonmesh import (
+    read_gmsh4_file,
+    read_gmsh_file,
+    stream_gmsh_file,
+)
+
+# Kuhn subdivision of a cube into 6 tetrahedra
+cube_tetrahedra = (
+    (0, 1, 3, 7),
+    (0, 1, 5, 7),
+    (0, 2, 3, 7),
+    (0, 2, 6, 7),
+    (0, 4, 5, 7),
+    (0, 4, 6, 7),
+)
+
+
+def create_mesh(n):
+    """returns gmsh nodes and (type, physical number, node list) elements"""
+    h = 1.0 / n
+
+    def node(i, j, k):
+        return 1 + i + (n + 1) * (j + (n + 1) * k)
+
+    nodes = []
+    for k in range(n + 1):
+        for j in range(n + 1):
+            for i in range(n + 1):
+                nodes.append((node(i, j, k), i * h, j * h, k * h))
+
+    elements = []
+    # contacts on the z faces
+    for k, pnum in ((0, 2), (n, 1)):
+        for j in range(n):
+            for i in range(n):
+                a, b = node(i, j, k), node(i + 1, j, k)
+                c, d = node(i, j + 1, k), node(i + 1, j + 1, k)
+                elements.append((2, pnum, (a, b, d)))
+                elements.append((2, pnum, (a, c, d)))
+    for k in range(n):
+        for j in range(n):
+            for i in range(n):
+                corners = [
+                    node(i + (c & 1), j + ((c >> 1) & 1), k + ((c >> 2) & 1))
+                    for c in range(8)
+                ]
+                for t in cube_tetrahedra:
+                    elements.append((4, 3, tuple(corners[x] for x in t)))
+    return nodes, elements
+
+
+def write_header(oh, binary):
+    oh.write(b"$MeshFormat\n")
+    if binary:
+        oh.write(b"2.2 1 8\n")
+        oh.write(struct.pack("<i", 1))
+        oh.write(b"\n")
+    else:
+        oh.write(b"2.2 0 8\n")
+    oh.write(b"$EndMeshFormat\n")
+    oh.write(b"$PhysicalNames\n3\n")
+    oh.write(b'2 1 "top"\n2 2 "bot"\n3 3 "Bulk"\n')
+    oh.write(b"$EndPhysicalNames\n")
+
+
+def write_gmsh_file(filename, nodes, elements, binary):
+    with open(filename, "wb") as oh:
+        write_header(oh, binary)
+        oh.write(b"$Nodes\n%d\n" % len(nodes))
+        if binary:
+            for n in nodes:
+                oh.write(struct.pack("<iddd", *n))
+            oh.write(b"\n")
+        else:
+            for n in nodes:
+                oh.write(b"%d %.17g %.17g %.17g\n" % n)
+        oh.write(b"$EndNodes\n")
+        oh.write(b"$Elements\n%d\n" % len(elements))
+        if binary:
+            # consecutive elements of the same type form one block
+            start = 0
+            while start < len(elements):
+                end = start
+                while end < len(elements) and elements[end][0] == elements[start][0]:
+                    end += 1
+                oh.write(struct.pack("<3i", elements[start][0], end - start, 2))
+                data = array.array("i")
+                for i in range(start, end):
+                    t, p, n = elements[i]
+                    data.extend((i + 1, p, p))
+                    data.extend(n)
+                oh.write(data.tobytes())
+                start = end
+            oh.write(b"\n")
+        else:
+            for i, (t, p, n) in enumerate(elements):
+                oh.write(b"%d %d 2 %d %d " % (i + 1, t, p, p))
+                oh.write(b" ".join(b"%d" % x for x in n))
+                oh.write(b"\n")
+        oh.write(b"$EndElements\n")
+
+
+def write_gmsh4_file(filename, nodes, elements, binary):
+    """one node block on the volume, and one element block per physical group"""
+    blocks = []
+    for t, p, n in elements:
+        if not blocks or blocks[-1][1] != p:
+            blocks.append((t, p))
+    # surface 1 is top, surface 2 is bot, volume 1 is Bulk
+    entity = {1: (2, 1), 2: (2, 2), 3: (3, 1)}
+    with open(filename, "wb") as oh:
+        oh.write(b"$MeshFormat\n")
+        if binary:
+            oh.write(b"4.1 1 8\n")
+            oh.write(struct.pack("<i", 1))
+            oh.write(b"\n")
+        else:
+            oh.write(b"4.1 0 8\n")
+        oh.write(b"$EndMeshFormat\n")
+        oh.write(b"$PhysicalNames\n3\n")
+        oh.write(b'2 1 "top"\n2 2 "bot"\n3 3 "Bulk"\n')
+        oh.write(b"$EndPhysicalNames\n")
+        oh.write(b"$Entities\n")
+        box = (0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+        if binary:
+            oh.write(struct.pack("<4q", 0, 0, 2, 1))
+            for tag in (1, 2):
+                oh.write(struct.pack("<i6dqiq", tag, *box, 1, tag, 0))
+            oh.write(struct.pack("<i6dqiqii", 1, *box, 1, 3, 2, 1, 2))
+            oh.write(b"\n")
+        else:
+            oh.write(b"0 0 2 1\n")
+            for tag in (1, 2):
+                oh.write(b"%d 0 0 0 1 1 1 1 %d 0\n" % (tag, tag))
+            oh.write(b"1 0 0 0 1 1 1 1 3 2 1 2\n")
+        oh.write(b"$EndEntities\n")
+
+        oh.write(b"$Nodes\n")
+        header = (1, len(nodes), 1, len(nodes))
+        if binary:
+            oh.write(struct.pack("<4q", *header))
+            oh.write(struct.pack("<3iq", 3, 1, 0, len(nodes)))
+            oh.write(array.array("q", (n[0] for n in nodes)).tobytes())
+            coordinates = array.array("d")
+            for n in nodes:
+                coordinates.extend(n[1:])
+            oh.write(coordinates.tobytes())
+            oh.write(b"\n")
+        else:
+            oh.write(b"%d %d %d %d\n" % header)
+            oh.write(b"3 1 0 %d\n" % len(nodes))
+            for n in nodes:
+                oh.write(b"%d\n" % n[0])
+            for n in nodes:
+                oh.write(b"%.17g %.17g %.17g\n" % n[1:])
+        oh.write(b"$EndNodes\n")
+
+        oh.write(b"$Elements\n")
+        header = (len(blocks), len(elements), 1, len(elements))
+        if binary:
+            oh.write(struct.pack("<4q", *header))
+        else:
+            oh.write(b"%d %d %d %d\n" % header)
+        start = 0
+        for t, p in blocks:
+            end = start
+            while end < len(elements) and elements[end][1] == p:
+                end += 1
+            dim, tag = entity[p]
+            if binary:
+                oh.write(struct.pack("<3iq", dim, tag, t, end - start))
+                data = array.array("q")
+                for i in range(start, end):
+                    data.append(i + 1)
+                    data.extend(elements[i][2])
+                oh.write(data.tobytes())
+            else:
+                oh.write(b"%d %d %d %d\n" % (dim, tag, t, end - start))
+                for i in range(start, end):
+                    oh.write(b"%d " % (i + 1))
+                    oh.write(b" ".join(b"%d" % x for x in elements[i][2]))
+                    oh.write(b"\n")
+            start = end
+        if binary:
+            oh.write(b"\n")
+        oh.write(b"$EndElements\n")
+
+
+def time_reader(reader, filename, **kwargs):
+    start = time.perf_counter()
+    data = reader(filename, **kwargs)
+    return time.perf_counter() - start, data
+
+
+def main():
+    # the process pool of read_gmsh4_file imports this file again in its workers
+    # when processes are spawned, so the benchmark only runs in the main process
+    cubes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    nodes, elements = create_mesh(cubes)
+    print("%d nodes %d elements" % (len(nodes), len(elements)))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ascii_file = os.path.join(tmpdir, "ascii.msh")
+        binary_file = os.path.join(tmpdir, "binary.msh")
+        write_gmsh_file(ascii_file, nodes, elements, binary=False)
+        write_gmsh_file(binary_file, nodes, elements, binary=True)
+        ascii4_file = os.path.join(tmpdir, "ascii4.msh")
+        binary4_file = os.path.join(tmpdir, "binary4.msh")
+        write_gmsh4_file(ascii4_file, nodes, elements, binary=False)
+        write_gmsh4_file(binary4_file, nodes, elements, binary=True)
+
+        t_read, reference = time_reader(read_gmsh_file, ascii_file)
+        t_ascii, streamed = time_reader(stream_gmsh_file, ascii_file)
+        t_binary, streamed_binary = time_reader(stream_gmsh_file, binary_file)
+        t_ascii4, gmsh4 = time_reader(
+            read_gmsh4_file, ascii4_file, max_workers=max_workers
+        )
+        t_binary4, gmsh4_binary = time_reader(
+            read_gmsh4_file, binary4_file, max_workers=max_workers
+        )
+
+    for data in (streamed, streamed_binary, gmsh4, gmsh4_binary):
+        for key in ("physical_names", "coordinates", "elements"):
+            if list(data[key]) != reference[key]:
+                raise RuntimeError("%s does not match read_gmsh_file" % key)
+
+    print("read_gmsh_file          %8.3f s" % t_read)
+    print("stream_gmsh_file ascii  %8.3f s" % t_ascii)
+    print("stream_gmsh_file binary %8.3f s" % t_binary)
+    print("read_gmsh4_file ascii   %8.3f s" % t_ascii4)
+    print("read_gmsh4_file binary  %8.3f s" % t_binary4)
+
+
+if __name__ == "__main__":
+    main()
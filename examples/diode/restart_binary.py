@@ -0,0 +1,54 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# Compares the devsim and devsim_binary restart formats, using the device written by
+# gmsh_diode3d.py.  The device restored from the devsim_binary file is written again in
+# the devsim format, which must be the same as the original.
+#
+# usage: python restart_binary.py [file]
+
+import filecmp
+import os
+import sys
+import time
+
+import devsim
+
+infile = sys.argv[1] if len(sys.argv) > 1 else "gmsh_diode3d_dd.msh"
+device = "diode3d"
+
+devsim.load_devices(file=infile)
+
+
+def timed_write(**kwargs):
+    start = time.perf_counter()
+    devsim.write_devices(device=device, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(
+        "write %-30s %8.3f s %12d bytes"
+        % (kwargs["file"], elapsed, os.path.getsize(kwargs["file"]))
+    )
+
+
+timed_write(file="restart_binary_ascii.msh", type="devsim")
+timed_write(file="restart_binary.dsb", type="devsim_binary")
+timed_write(file="restart_binary_compressed.dsb", type="devsim_binary", compress=True)
+
+for f in ("restart_binary.dsb", "restart_binary_compressed.dsb"):
+    devsim.delete_device(device=device)
+    devsim.delete_mesh(mesh=device)
+    start = time.perf_counter()
+    devsim.load_devices(file=f)
+    print("load  %-30s %8.3f s" % (f, time.perf_counter() - start))
+    devsim.write_devices(file="restart_binary_roundtrip.msh", device=device, type="devsim")
+    if not filecmp.cmp(
+        "restart_binary_ascii.msh", "restart_binary_roundtrip.msh", shallow=False
+    ):
+        raise RuntimeError("%s does not restore the same device" % f)
+
+devsim.delete_device(device=device)
+devsim.delete_mesh(mesh=device)
+start = time.perf_counter()
+devsim.load_devices(file="restart_binary_ascii.msh")
+print("load  %-30s %8.3f s" % ("restart_binary_ascii.msh", time.perf_counter() - start))
@@ -0,0 +1,68 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# tran_diode.py with the time step selected by solve(type="transient_adaptive")
+
+import devsim
+from devsim.python_packages.simple_physics import GetContactBiasName
+import diode_common
+
+
+def print_circuit_solution(time):
+    for node in devsim.get_circuit_node_list():
+        r = devsim.get_circuit_node_value(solution="dcop", node=node)
+        print("%1.5e\t%s\t%1.15e" % (time, node, r))
+
+
+device = "MyDevice"
+region = "MyRegion"
+
+devsim.set_parameter(name="extended_solver", value=True)
+devsim.set_parameter(name="extended_model", value=True)
+devsim.set_parameter(name="extended_equation", value=True)
+
+# This requires a circuit element to integrated current
+devsim.circuit_element(
+    name="V1", n1=GetContactBiasName("top"), n2=0, value=0.0, acreal=1.0, acimag=0.0
+)
+
+diode_common.CreateMesh2(device=device, region=region)
+diode_common.SetParameters(device=device, region=region)
+diode_common.SetNetDoping(device=device, region=region)
+diode_common.InitialSolution(device, region, circuit_contacts="top")
+
+devsim.solve(type="dc", absolute_error=1.0, relative_error=1e-12, maximum_iterations=30)
+
+diode_common.DriftDiffusionInitialSolution(device, region, circuit_contacts=["top"])
+
+devsim.solve(
+    type="transient_dc", absolute_error=1.0, relative_error=1e-14, maximum_iterations=30
+)
+
+print_circuit_solution(0.0)
+
+devsim.circuit_alter(name="V1", value=0.7)
+
+info = devsim.solve(
+    type="transient_adaptive",
+    absolute_error=1e10,
+    relative_error=1e-10,
+    maximum_iterations=30,
+    charge_error=1e-2,
+    tstart=0.0,
+    tstop=1e-2,
+    tdelta=1e-5,
+    minimum_tdelta=1e-12,
+    maximum_tdelta=1e-3,
+    callback=print_circuit_solution,
+    info=True,
+)
+
+if not info["converged"]:
+    raise RuntimeError("Convergence failure at time %g" % info["time"])
+
+print(
+    "%d accepted %d rejected %d diverged time steps"
+    % (info["accepted_steps"], info["rejected_steps"], info["failed_steps"])
+)
@@ -1,3 +1,9 @@
+import array
+import concurrent.futures
+import mmap
+import struct
+
+
 def parse_gmsh_file(file):
     sections = set(["$MeshFormat", "$PhysicalNames", "$Nodes", "$Elements"])
     lineno = 0
@@ -129,3 +135,637 @@ def read_gmsh_file(filename):
         "coordinates": coordinates,
         "elements": elements,
     }
+
+
+# gmsh element type: (devsim element type, dimension, number of nodes)
+_gmsh_element_types = {
+    15: (0, 0, 1),
+    1: (1, 1, 2),
+    2: (2, 2, 3),
+    4: (3, 3, 4),
+}
+
+
+def _get_physical_number_map(physical_names):
+    """maps (dimension, physical number) to the index of the sorted physical name"""
+    sorted_physical_names = sorted(physical_names, key=lambda x: x[0])
+    physical_number_map = {}
+    for i, j in enumerate(sorted_physical_names):
+        physical_number_map[(j[1], j[2])] = i
+    return [x[0] for x in sorted_physical_names], physical_number_map
+
+
+def _get_element_type(gmsh_type):
+    if gmsh_type not in _gmsh_element_types:
+        raise RuntimeError("Cannot handle element type %d" % gmsh_type)
+    return _gmsh_element_types[gmsh_type]
+
+
+def _section_text(cursor, section):
+    """returns the text of an ascii section, moving the cursor past its end"""
+    end = b"$End" + section[1:]
+    stop = cursor.mm.find(end, cursor.pos)
+    if stop == -1:
+        raise RuntimeError("Missing %s" % end.decode())
+    text = cursor.mm[cursor.pos : stop]
+    cursor.pos = stop
+    cursor.readline()
+    return text
+
+
+def _split_gmsh_element_lines(text, data, count):
+    """
+    splits the values of the ascii gmsh 2.2 element records in data, parsed from
+    text, into groups with the same element type and number of tags, returning
+    (gmsh type, ntags, record numbers, 2d array of values) for each group
+    """
+    import numpy
+
+    # a value starts at a character which is not whitespace following whitespace
+    space = numpy.frombuffer(text, dtype=numpy.uint8) <= ord(" ")
+    starts = ~space
+    starts[1:] &= space[:-1]
+    starts = numpy.flatnonzero(starts)
+    if len(starts) != len(data):
+        raise RuntimeError("Cannot read the values in $Elements")
+    # the line of each value, and the position of the first value of each record
+    newlines = numpy.flatnonzero(numpy.frombuffer(text, dtype=numpy.uint8) == ord("\n"))
+    lines = numpy.searchsorted(newlines, starts)
+    offsets = numpy.flatnonzero(numpy.diff(lines, prepend=-1))
+    if len(offsets) != count:
+        raise RuntimeError("Expected %d elements in $Elements" % count)
+    widths = numpy.diff(offsets, append=len(data))
+    if widths.min(initial=3) < 3:
+        raise RuntimeError("Cannot read the values in $Elements")
+    types = data[offsets + 1]
+    ntags = data[offsets + 2]
+
+    groups = []
+    for gmsh_type in numpy.unique(types).tolist():
+        _etype, _dimension, nnodes = _get_element_type(gmsh_type)
+        same_type = types == gmsh_type
+        for nt in numpy.unique(ntags[same_type]).tolist():
+            records = numpy.flatnonzero(same_type & (ntags == nt))
+            width = 3 + nt + nnodes
+            if numpy.any(widths[records] != width):
+                raise RuntimeError(
+                    "Element %d has the wrong number of values"
+                    % data[offsets[records[0]]]
+                )
+            rows = data[offsets[records, numpy.newaxis] + numpy.arange(width)]
+            groups.append((gmsh_type, nt, records, rows))
+    return groups
+
+
+def stream_gmsh_file(filename):
+    """
+    reads a gmsh 2.2 ascii or binary file in one pass
+
+    Each section is decoded in bulk with numpy.  The result has the same form as
+    read_gmsh_file, with the coordinates stored in a numpy array of doubles and
+    the elements stored in a numpy array of int64, so that they may be passed
+    directly to devsim.create_gmsh_mesh.
+    """
+    import numpy
+
+    physical_names = None
+    node_tags = None
+    node_coordinates = None
+    # (gmsh type, element numbers, physical numbers, gmsh node numbers)
+    element_blocks = []
+    nelements = 0
+    with open(filename, "rb") as ih:
+        with mmap.mmap(ih.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            cursor = _GmshCursor(mm)
+            while cursor.pos < len(mm):
+                section = cursor.readline()
+                if not section:
+                    continue
+                elif section == b"$MeshFormat":
+                    version, file_type, _data_size = cursor.readline().split()
+                    if version.startswith(b"4"):
+                        raise RuntimeError(
+                            "Unsupported gmsh format %s, use read_gmsh4_file"
+                            % version.decode()
+                        )
+                    elif not version.startswith(b"2"):
+                        raise RuntimeError(
+                            "Unsupported gmsh format %s" % version.decode()
+                        )
+                    cursor.binary = int(file_type) == 1
+                    if cursor.binary:
+                        if struct.unpack_from("<i", mm, cursor.pos)[0] != 1:
+                            cursor.endian = ">"
+                        cursor.pos += 4
+                        cursor.readline()
+                    cursor.skip_to(b"$EndMeshFormat")
+                elif section == b"$PhysicalNames":
+                    count = int(cursor.readline())
+                    physical_names = []
+                    for i in range(count):
+                        dim, num, name = cursor.readline().split(maxsplit=2)
+                        name = name.strip().decode("utf-8")[1:-1]
+                        physical_names.append((name, int(dim), int(num)))
+                    cursor.skip_to(b"$EndPhysicalNames")
+                elif section == b"$Nodes":
+                    count = int(cursor.readline())
+                    if cursor.binary:
+                        record = numpy.dtype(
+                            [
+                                ("tag", cursor.endian + "i4"),
+                                ("xyz", cursor.endian + "f8", (3,)),
+                            ]
+                        )
+                        if cursor.pos + count * record.itemsize > len(mm):
+                            raise RuntimeError("Unexpected end of $Nodes")
+                        records = numpy.frombuffer(
+                            mm, dtype=record, count=count, offset=cursor.pos
+                        )
+                        cursor.pos += count * record.itemsize
+                        node_tags = records["tag"].astype(numpy.int64)
+                        node_coordinates = records["xyz"].astype(numpy.float64)
+                        del records
+                        cursor.skip_to(b"$EndNodes")
+                    else:
+                        values = numpy.fromstring(
+                            _section_text(cursor, section), dtype=numpy.float64, sep=" "
+                        )
+                        if len(values) != 4 * count:
+                            raise RuntimeError("Expected %d nodes in $Nodes" % count)
+                        values = values.reshape(count, 4)
+                        node_tags = values[:, 0].astype(numpy.int64)
+                        node_coordinates = numpy.ascontiguousarray(values[:, 1:])
+                elif section == b"$Elements":
+                    count = int(cursor.readline())
+                    if cursor.binary:
+                        itype = numpy.dtype(cursor.endian + "i4")
+                        read = 0
+                        while read < count:
+                            gmsh_type, following, ntags = cursor.unpack("3i")
+                            _etype, _dimension, nnodes = _get_element_type(gmsh_type)
+                            if ntags == 0:
+                                raise RuntimeError(
+                                    "Elements of type %d have no physical number"
+                                    % gmsh_type
+                                )
+                            width = 1 + ntags + nnodes
+                            if cursor.pos + 4 * width * following > len(mm):
+                                raise RuntimeError("Unexpected end of $Elements")
+                            data = numpy.frombuffer(
+                                mm,
+                                dtype=itype,
+                                count=width * following,
+                                offset=cursor.pos,
+                            ).reshape(following, width)
+                            cursor.pos += 4 * width * following
+                            element_blocks.append(
+                                (
+                                    gmsh_type,
+                                    numpy.arange(
+                                        nelements + read, nelements + read + following
+                                    ),
+                                    data[:, 1].astype(numpy.int64),
+                                    data[:, 1 + ntags :].astype(numpy.int64),
+                                )
+                            )
+                            del data
+                            read += following
+                        cursor.skip_to(b"$EndElements")
+                    else:
+                        text = _section_text(cursor, section)
+                        data = numpy.fromstring(text, dtype=numpy.int64, sep=" ")
+                        for (
+                            gmsh_type,
+                            ntags,
+                            records,
+                            rows,
+                        ) in _split_gmsh_element_lines(text, data, count):
+                            if ntags == 0:
+                                raise RuntimeError(
+                                    "Element %d has no physical number" % rows[0, 0]
+                                )
+                            element_blocks.append(
+                                (
+                                    gmsh_type,
+                                    nelements + records,
+                                    rows[:, 3],
+                                    rows[:, 3 + ntags :],
+                                )
+                            )
+                    nelements += count
+                elif section.startswith(b"$"):
+                    cursor.skip_to(b"$End" + section[1:])
+                else:
+                    raise RuntimeError("Unexpected %s" % section.decode())
+
+    if physical_names is None:
+        raise RuntimeError("Missing $PhysicalNames")
+    if node_tags is None:
+        raise RuntimeError("Missing $Nodes")
+    names, physical_number_map = _get_physical_number_map(physical_names)
+
+    # gmsh node number to position in coordinates
+    coordinate_to_index = numpy.full(
+        int(node_tags.max(initial=0)) + 1, -1, dtype=numpy.int32
+    )
+    coordinate_to_index[node_tags] = numpy.arange(len(node_tags), dtype=numpy.int32)
+
+    # the records are grouped by element type, and placed in file order
+    widths = numpy.zeros(nelements, dtype=numpy.int64)
+    for gmsh_type, order, _physical_numbers, _nodes in element_blocks:
+        widths[order] = 2 + _get_element_type(gmsh_type)[2]
+    offsets = numpy.cumsum(widths) - widths
+    elements = numpy.empty(int(widths.sum()), dtype=numpy.int64)
+    for gmsh_type, order, physical_numbers, nodes in element_blocks:
+        etype, dimension, nnodes = _get_element_type(gmsh_type)
+        numbers, inverse = numpy.unique(physical_numbers, return_inverse=True)
+        pnums = []
+        for number in numbers.tolist():
+            if (dimension, number) not in physical_number_map:
+                raise RuntimeError(
+                    "Missing physical name for dimension %d number %d"
+                    % (dimension, number)
+                )
+            pnums.append(physical_number_map[(dimension, number)])
+        if nodes.size and (nodes.min() < 0 or nodes.max() >= len(coordinate_to_index)):
+            raise RuntimeError("Element references a missing node")
+        indexes = coordinate_to_index[nodes]
+        if nodes.size and indexes.min() < 0:
+            raise RuntimeError("Element references a missing node")
+        block = numpy.empty((len(nodes), 2 + nnodes), dtype=numpy.int64)
+        block[:, 0] = etype
+        block[:, 1] = numpy.asarray(pnums, dtype=numpy.int64)[inverse.ravel()]
+        block[:, 2:] = indexes
+        elements[offsets[order, numpy.newaxis] + numpy.arange(2 + nnodes)] = block
+
+    return {
+        "physical_names": names,
+        "coordinates": node_coordinates.ravel(),
+        "elements": elements,
+    }
+
+
+class _GmshCursor:
+    """sequential reader over a memory mapped gmsh file"""
+
+    def __init__(self, mm):
+        self.mm = mm
+        self.pos = 0
+        self.binary = False
+        self.endian = "<"
+        self.size_t = "q"
+
+    def readline(self):
+        end = self.mm.find(b"\n", self.pos)
+        if end == -1:
+            end = len(self.mm)
+        line = self.mm[self.pos : end]
+        self.pos = end + 1
+        return line.rstrip()
+
+    def unpack(self, fmt):
+        fmt = self.endian + fmt.replace("Z", self.size_t)
+        values = struct.unpack_from(fmt, self.mm, self.pos)
+        self.pos += struct.calcsize(fmt)
+        return values
+
+    def skip_lines(self, count):
+        """moves past count lines, counting newlines a window at a time"""
+        step = 1 << 20
+        while count > 0:
+            window = self.mm[self.pos : self.pos + step]
+            if not window:
+                raise RuntimeError("Unexpected end of file")
+            lines = window.count(b"\n")
+            if lines < count:
+                self.pos += len(window)
+                count -= lines
+            else:
+                for i in range(count):
+                    self.pos = self.mm.find(b"\n", self.pos) + 1
+                count = 0
+
+    def skip_to(self, marker):
+        end = self.mm.find(marker, self.pos)
+        if end == -1:
+            raise RuntimeError("Missing %s" % marker.decode())
+        self.pos = end
+        self.readline()
+
+
+def _read_gmsh4_entities(cursor):
+    """returns the physical tags of each (dimension, entity tag)"""
+    entity_physicals = {}
+    if cursor.binary:
+        counts = cursor.unpack("4Z")
+        for dim, count in enumerate(counts):
+            for i in range(count):
+                (tag,) = cursor.unpack("i")
+                # point coordinates or bounding box
+                cursor.pos += 8 * (3 if dim == 0 else 6)
+                (nphysicals,) = cursor.unpack("Z")
+                entity_physicals[(dim, tag)] = cursor.unpack("%di" % nphysicals)
+                if dim > 0:
+                    (nbounding,) = cursor.unpack("Z")
+                    cursor.pos += 4 * nbounding
+        cursor.readline()
+    else:
+        counts = [int(x) for x in cursor.readline().split()]
+        for dim, count in enumerate(counts):
+            for i in range(count):
+                line = cursor.readline().split()
+                offset = 4 if dim == 0 else 7
+                nphysicals = int(line[offset])
+                entity_physicals[(dim, int(line[0]))] = tuple(
+                    int(x) for x in line[offset + 1 : offset + 1 + nphysicals]
+                )
+    return entity_physicals
+
+
+def _decode_gmsh4_values(mm, start, end, binary, typecode, swap):
+    if binary:
+        values = array.array(typecode, mm[start:end])
+        if swap:
+            values.byteswap()
+        return values
+    if typecode == "d":
+        return array.array("d", map(float, mm[start:end].split()))
+    return array.array(typecode, map(int, mm[start:end].split()))
+
+
+def _decode_gmsh4_nodes(task):
+    """worker for a chunk of a node entity block"""
+    filename, binary, size_t, swap, tags, coords, stride = task
+    with open(filename, "rb") as ih:
+        with mmap.mmap(ih.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            node_tags = _decode_gmsh4_values(mm, *tags, binary, size_t, swap)
+            values = _decode_gmsh4_values(mm, *coords, binary, "d", swap)
+    if stride != 3:
+        # drop the parametric coordinates
+        xyz = array.array("d", [0.0]) * (3 * len(node_tags))
+        for k in range(3):
+            xyz[k::3] = values[k::stride]
+        values = xyz
+    return node_tags, values
+
+
+# gmsh node number to position in coordinates when the node numbers are sparse,
+# set once in each worker process
+_gmsh4_node_map = None
+
+
+def _set_gmsh4_node_map(node_map):
+    global _gmsh4_node_map
+    _gmsh4_node_map = node_map
+
+
+def _decode_gmsh4_elements(task):
+    """worker for a chunk of an element entity block"""
+    (
+        filename,
+        binary,
+        size_t,
+        swap,
+        data_range,
+        etype,
+        nnodes,
+        pnums,
+        node_offset,
+    ) = task
+    node_map = _gmsh4_node_map
+    with open(filename, "rb") as ih:
+        with mmap.mmap(ih.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = _decode_gmsh4_values(mm, *data_range, binary, size_t, swap)
+    length = 1 + nnodes
+    count = len(data) // length
+    width = 2 + nnodes
+    block = array.array("i", [etype]) * (width * count)
+    for k in range(nnodes):
+        if node_map is None:
+            nodes = array.array("i", (x - node_offset for x in data[1 + k :: length]))
+        else:
+            nodes = array.array("i", map(node_map.__getitem__, data[1 + k :: length]))
+        block[2 + k :: width] = nodes
+    # an element is repeated for each physical group of its entity
+    result = array.array("i")
+    for pnum in pnums:
+        block[1::width] = array.array("i", [pnum]) * count
+        result.extend(block)
+    return result
+
+
+def _split_gmsh4_records(cursor, count, record_size, chunk_size):
+    """byte ranges of up to chunk_size records, advancing the cursor past them"""
+    ranges = []
+    for first in range(0, count, chunk_size):
+        n = min(chunk_size, count - first)
+        start = cursor.pos
+        if cursor.binary:
+            cursor.pos += n * record_size
+        else:
+            cursor.skip_lines(n)
+        ranges.append((start, cursor.pos, n))
+    return ranges
+
+
+class _SerialExecutor:
+    """decodes in the calling process when max_workers is 1"""
+
+    def __init__(self, initializer=None, initargs=()):
+        self.initializer = initializer
+        self.initargs = initargs
+
+    def __enter__(self):
+        if self.initializer:
+            self.initializer(*self.initargs)
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def map(self, fn, iterable):
+        return map(fn, iterable)
+
+
+def _create_gmsh4_executor(max_workers, initializer=None, initargs=()):
+    if max_workers == 1:
+        return _SerialExecutor(initializer, initargs)
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers, initializer=initializer, initargs=initargs
+    )
+
+
+def read_gmsh4_file(filename, max_workers=None, chunk_size=100000):
+    """
+    reads a gmsh 4.1 ascii or binary file
+
+    Node and element entity blocks are split into chunks of chunk_size records,
+    which are decoded concurrently by max_workers processes reading the memory
+    mapped file.  When max_workers is 1, the chunks are decoded in the calling
+    process.  The result has the same values as stream_gmsh_file, stored in
+    array.array objects.
+    """
+    with open(filename, "rb") as ih:
+        with mmap.mmap(ih.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            cursor = _GmshCursor(mm)
+            physical_names = None
+            entity_physicals = None
+            node_tasks = []
+            element_blocks = []
+            total_nodes = None
+            while cursor.pos < len(mm):
+                section = cursor.readline()
+                if not section:
+                    continue
+                elif section == b"$MeshFormat":
+                    version, file_type, data_size = cursor.readline().split()
+                    if version != b"4.1":
+                        raise RuntimeError(
+                            "Unsupported gmsh format %s" % version.decode()
+                        )
+                    cursor.binary = int(file_type) == 1
+                    cursor.size_t = {4: "i", 8: "q"}[int(data_size)]
+                    if cursor.binary:
+                        if struct.unpack_from("<i", mm, cursor.pos)[0] != 1:
+                            cursor.endian = ">"
+                        cursor.pos += 4
+                        cursor.readline()
+                    cursor.skip_to(b"$EndMeshFormat")
+                elif section == b"$PhysicalNames":
+                    count = int(cursor.readline())
+                    physical_names = []
+                    for i in range(count):
+                        dim, num, name = cursor.readline().split(maxsplit=2)
+                        name = name.strip().decode("utf-8")[1:-1]
+                        physical_names.append((name, int(dim), int(num)))
+                    cursor.skip_to(b"$EndPhysicalNames")
+                elif section == b"$Entities":
+                    entity_physicals = _read_gmsh4_entities(cursor)
+                    cursor.skip_to(b"$EndEntities")
+                elif section == b"$Nodes":
+                    if cursor.binary:
+                        nblocks, total_nodes, min_tag, max_tag = cursor.unpack("4Z")
+                    else:
+                        nblocks, total_nodes, min_tag, max_tag = [
+                            int(x) for x in cursor.readline().split()
+                        ]
+                    for i in range(nblocks):
+                        if cursor.binary:
+                            dim, _tag, parametric = cursor.unpack("3i")
+                            (count,) = cursor.unpack("Z")
+                        else:
+                            dim, _tag, parametric, count = [
+                                int(x) for x in cursor.readline().split()
+                            ]
+                        stride = 3 + (dim if parametric else 0)
+                        tag_size = struct.calcsize(cursor.size_t)
+                        tags = _split_gmsh4_records(cursor, count, tag_size, chunk_size)
+                        coords = _split_gmsh4_records(
+                            cursor, count, 8 * stride, chunk_size
+                        )
+                        for t, c in zip(tags, coords):
+                            node_tasks.append((t[:2], c[:2], stride))
+                    cursor.skip_to(b"$EndNodes")
+                elif section == b"$Elements":
+                    if cursor.binary:
+                        nblocks = cursor.unpack("4Z")[0]
+                    else:
+                        nblocks = int(cursor.readline().split()[0])
+                    for i in range(nblocks):
+                        if cursor.binary:
+                            dim, tag, gmsh_type = cursor.unpack("3i")
+                            (count,) = cursor.unpack("Z")
+                        else:
+                            dim, tag, gmsh_type, count = [
+                                int(x) for x in cursor.readline().split()
+                            ]
+                        etype, dimension, nnodes = _get_element_type(gmsh_type)
+                        record_size = struct.calcsize(cursor.size_t) * (1 + nnodes)
+                        ranges = _split_gmsh4_records(
+                            cursor, count, record_size, chunk_size
+                        )
+                        element_blocks.append((dim, tag, etype, nnodes, ranges))
+                    cursor.skip_to(b"$EndElements")
+                elif section.startswith(b"$"):
+                    cursor.skip_to(b"$End" + section[1:])
+                else:
+                    raise RuntimeError("Unexpected %s" % section.decode())
+
+    if physical_names is None:
+        raise RuntimeError("Missing $PhysicalNames")
+    if entity_physicals is None:
+        raise RuntimeError("Missing $Entities")
+    if total_nodes is None:
+        raise RuntimeError("Missing $Nodes")
+    names, physical_number_map = _get_physical_number_map(physical_names)
+
+    binary = cursor.binary
+    size_t = cursor.size_t
+    swap = cursor.endian != "<"
+    with _create_gmsh4_executor(max_workers) as executor:
+        node_results = list(
+            executor.map(
+                _decode_gmsh4_nodes,
+                [(filename, binary, size_t, swap) + t for t in node_tasks],
+            )
+        )
+
+    # nodes are ordered by tag when the tags are contiguous
+    dense = (max_tag - min_tag + 1) == total_nodes
+    node_map = None
+    if dense:
+        coordinates = array.array("d", [0.0]) * (3 * total_nodes)
+        for node_tags, values in node_results:
+            if not node_tags:
+                continue
+            first = node_tags[0] - min_tag
+            if node_tags == array.array(
+                node_tags.typecode,
+                range(node_tags[0], node_tags[0] + len(node_tags)),
+            ):
+                coordinates[3 * first : 3 * (first + len(node_tags))] = values
+            else:
+                for i, t in enumerate(node_tags):
+                    j = t - min_tag
+                    coordinates[3 * j : 3 * j + 3] = values[3 * i : 3 * i + 3]
+    else:
+        coordinates = array.array("d")
+        node_map = array.array("i", [-1]) * (max_tag + 1)
+        for node_tags, values in node_results:
+            first = len(coordinates) // 3
+            for i, t in enumerate(node_tags):
+                node_map[t] = first + i
+            coordinates.extend(values)
+    del node_results
+
+    element_tasks = []
+    for dim, tag, etype, nnodes, ranges in element_blocks:
+        pnums = []
+        for p in entity_physicals.get((dim, tag), ()):
+            if (dim, p) not in physical_number_map:
+                raise RuntimeError(
+                    "Missing physical name for dimension %d number %d" % (dim, p)
+                )
+            pnums.append(physical_number_map[(dim, p)])
+        if not pnums:
+            continue
+        for r in ranges:
+            element_tasks.append(
+                (filename, binary, size_t, swap, r[:2], etype, nnodes, pnums, min_tag)
+            )
+    # the node map is sent once to each worker, instead of with each task
+    elements = array.array("i")
+    try:
+        with _create_gmsh4_executor(
+            max_workers, initializer=_set_gmsh4_node_map, initargs=(node_map,)
+        ) as executor:
+            for block in executor.map(_decode_gmsh4_elements, element_tasks):
+                elements.extend(block)
+    finally:
+        _set_gmsh4_node_map(None)
+
+    return {
+        "physical_names": names,
+        "coordinates": coordinates,
+        "elements": elements,
+    }
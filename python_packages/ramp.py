@@ -99,3 +99,196 @@ def printAllCurrents(device):
     """
     for c in ds.get_contact_list(device=device):
         PrintCurrents(device, c)
+
+
+def get_solution_names(device):
+    """
+    Returns the node solution variables of the equations on each region of a device
+    """
+    names = {}
+    for region in ds.get_region_list(device=device):
+        names[region] = [
+            ds.get_equation_command(device=device, region=region, name=e)[
+                "variable_name"
+            ]
+            for e in ds.get_equation_list(device=device, region=region)
+        ]
+    return names
+
+
+def get_solution_snapshot(device, solution_names):
+    """
+    Copies the node solution values for each region into a dictionary
+
+    The values of each region are a numpy array with one row for each name.
+    """
+    import numpy
+
+    return {
+        region: (
+            names,
+            numpy.asarray(
+                ds.get_model_values_table(device=device, region=region, names=names)
+            ),
+        )
+        for region, names in solution_names.items()
+        if names
+    }
+
+
+def set_solution_snapshot(device, snapshot):
+    """
+    Restores the node solution values saved by get_solution_snapshot
+    """
+    for region, (names, values) in snapshot.items():
+        ds.set_node_values_table(
+            device=device, region=region, names=names, values=values
+        )
+
+
+def extrapolate_snapshot(history, bias):
+    """
+    Extrapolates node solutions to a new bias from previous (bias, snapshot) pairs
+
+    Uses quadratic extrapolation from the last three points, linear from the last
+    two, or the last solution when there is only one.  Solutions which are
+    positive everywhere, such as carrier densities, are extrapolated in log space
+    so that they remain positive.
+    """
+    import numpy
+
+    points = history[-3:]
+    biases = [p[0] for p in points]
+    # Lagrange weights for the new bias
+    weights = []
+    for i, bi in enumerate(biases):
+        w = 1.0
+        for j, bj in enumerate(biases):
+            if i != j:
+                w *= (bias - bj) / (bi - bj)
+        weights.append(w)
+    result = {}
+    for region, (names, _values) in points[-1][1].items():
+        # (point, name, node)
+        columns = numpy.stack([p[1][region][1] for p in points])
+        positive = numpy.all(columns > 0.0, axis=(0, 2))
+        columns[:, positive] = numpy.log(columns[:, positive])
+        values = numpy.tensordot(weights, columns, axes=1)
+        values[positive] = numpy.exp(values[positive])
+        result[region] = (names, values)
+    return result
+
+
+def rampbias_adaptive(
+    device,
+    contact,
+    end_bias,
+    step_size,
+    min_step,
+    max_iter,
+    rel_error,
+    abs_error,
+    callback,
+    max_step=None,
+    fast_iterations=4,
+    growth=1.5,
+    extrapolation="linear",
+):
+    """
+    Ramps bias with step size control and solution extrapolation
+
+    Parameters:
+    -----------
+
+    device : name of the device
+    contact : contact name
+    end_bias : bias for last step
+    step_size : initial step size
+    min_step : minimum step size
+    max_iter : maximum number of iterations
+    rel_error : required relative error for convergence
+    abs_error : required absolute error for convergence
+    callback : callback function that should be called on success.
+               See printAllCurrents for an example.
+    max_step : maximum step size, defaults to no limit
+    fast_iterations : the step grows when a bias point converges in this
+                      many Newton iterations or fewer
+    growth : factor for growing the step size
+    extrapolation : "none", "linear", or "quadratic" initial guess from the
+                    previous bias points
+
+    Description:
+    ------------
+
+    Like rampbias, the step size is halved on a convergence failure.  The step
+    grows after a bias point converges in at most fast_iterations Newton
+    iterations, as reported by solve(info=True).
+
+    Each new bias point starts from the node solutions extrapolated from the
+    previous converged bias points.  If the solve fails, the last converged
+    solution is restored before retrying.
+
+    Returns a dictionary with the number of bias points, the total Newton
+    iterations of the converged points, the iterations spent in failed
+    attempts, and the number of failures.
+    """
+    history_length = {"none": 1, "linear": 2, "quadratic": 3}
+    if extrapolation not in history_length:
+        raise ValueError("Unknown extrapolation %s" % extrapolation)
+
+    solution_names = get_solution_names(device)
+    bias_name = GetContactBiasName(contact)
+
+    start_bias = ds.get_parameter(device=device, name=bias_name)
+    if start_bias < end_bias:
+        step_sign = 1
+    else:
+        step_sign = -1
+    step_size = abs(step_size)
+
+    last_bias = start_bias
+    history = [(last_bias, get_solution_snapshot(device, solution_names))]
+    statistics = {
+        "bias_points": 0,
+        "newton_iterations": 0,
+        "failed_iterations": 0,
+        "failures": 0,
+    }
+    while abs(last_bias - end_bias) > min_step:
+        next_bias = last_bias + step_sign * step_size
+        if (next_bias - end_bias) * step_sign > 0:
+            next_bias = end_bias
+        print(("%s last next %e %e") % (contact, last_bias, next_bias))
+        if len(history) > 1:
+            set_solution_snapshot(device, extrapolate_snapshot(history, next_bias))
+        ds.set_parameter(device=device, name=bias_name, value=next_bias)
+        info = ds.solve(
+            type="dc",
+            absolute_error=abs_error,
+            relative_error=rel_error,
+            maximum_iterations=max_iter,
+            info=True,
+        )
+        iterations = len(info["iterations"])
+        if not info["converged"]:
+            statistics["failed_iterations"] += iterations
+            statistics["failures"] += 1
+            ds.set_parameter(device=device, name=bias_name, value=last_bias)
+            set_solution_snapshot(device, history[-1][1])
+            step_size *= 0.5
+            print("setting new step size %e" % (step_size))
+            if step_size < min_step:
+                raise RuntimeError("Minimum step size too small")
+            continue
+        print("Succeeded in %d iterations" % iterations)
+        statistics["bias_points"] += 1
+        statistics["newton_iterations"] += iterations
+        last_bias = next_bias
+        history.append((last_bias, get_solution_snapshot(device, solution_names)))
+        del history[: -history_length[extrapolation]]
+        if iterations <= fast_iterations:
+            step_size *= growth
+            if max_step is not None:
+                step_size = min(step_size, max_step)
+        callback(device)
+    return statistics
@@ -0,0 +1,306 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import itertools
+import json
+import multiprocessing
+import os
+import traceback
+
+
+def parameter_grid(**axes):
+    """
+    Returns the cartesian product of the parameter values as a list of dictionaries
+
+    parameter_grid(taun=[1e-8, 1e-7], doping=[1e16, 1e17]) gives four points,
+    with the last parameter varying fastest.
+    """
+    names = list(axes.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+def point_key(point):
+    """
+    Returns a string identifying a parameter point in the checkpoint file
+    """
+    return json.dumps(point, sort_keys=True)
+
+
+def load_checkpoint(filename):
+    """
+    Returns the results saved in a checkpoint file, indexed by point_key
+    """
+    results = {}
+    if not filename or not os.path.exists(filename):
+        return results
+    with open(filename, "r") as ih:
+        for line in ih:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # an interrupted write leaves a partial last line
+                continue
+            results[point_key(entry["point"])] = entry
+    return results
+
+
+def _open_checkpoint(filename):
+    """
+    Opens a checkpoint file for appending, ending a partial last line first
+    """
+    partial = False
+    if os.path.exists(filename) and os.path.getsize(filename) > 0:
+        with open(filename, "rb") as ih:
+            ih.seek(-1, os.SEEK_END)
+            partial = ih.read(1) != b"\n"
+    oh = open(filename, "a")
+    if partial:
+        # otherwise the next entry is lost with the partial line
+        oh.write("\n")
+    return oh
+
+
+def _run_point(task):
+    """
+    Runs one parameter point in a worker process
+    """
+    builder, point, threads_available = task
+    import devsim
+
+    if threads_available is not None:
+        devsim.set_parameter(name="threads_available", value=threads_available)
+    try:
+        return {"point": point, "result": builder(**point), "error": None}
+    except Exception:
+        return {"point": point, "result": None, "error": traceback.format_exc()}
+
+
+def run_sweep(
+    builder,
+    points,
+    processes=None,
+    threads_available=1,
+    checkpoint=None,
+    start_method="spawn",
+):
+    """
+    Runs a device simulation for each parameter point in a pool of processes
+
+    Parameters:
+    -----------
+
+    builder : function called as builder(**point) in a worker process.  It
+              creates the device, solves it, and returns the results.  It must be
+              picklable, so it should be defined at module level, and its return
+              value must be serializable with json when checkpoint is used.
+    points : list of parameter dictionaries, see parameter_grid
+    processes : number of worker processes, defaults to os.cpu_count()
+    threads_available : value of the "threads_available" parameter in each worker
+    checkpoint : file name for saving completed points
+    start_method : multiprocessing start method for the workers
+
+    Description:
+    ------------
+
+    Each point runs in a new worker process, so that the global DEVSIM state of
+    one point cannot affect another.  There is no need to call delete_device or
+    delete_mesh in builder.
+
+    This is a generator yielding dictionaries with the "point", its "result",
+    and the "error" traceback if builder raised an exception.  Results are
+    yielded in the order they finish.  Points found in the checkpoint file are
+    yielded first, with "checkpoint" set to True, and are not run again.
+    Failed points are not saved, so they are retried when the sweep is resumed.
+    """
+    completed = load_checkpoint(checkpoint)
+    pending = []
+    for point in points:
+        entry = completed.get(point_key(point))
+        if entry is None:
+            pending.append((builder, point, threads_available))
+        else:
+            yield dict(entry, error=None, checkpoint=True)
+
+    if not pending:
+        return
+
+    context = multiprocessing.get_context(start_method)
+    # maxtasksperchild=1 gives each point a fresh interpreter
+    with context.Pool(processes=processes, maxtasksperchild=1) as pool:
+        oh = _open_checkpoint(checkpoint) if checkpoint else None
+        try:
+            for entry in pool.imap_unordered(_run_point, pending):
+                if oh and entry["error"] is None:
+                    oh.write(
+                        json.dumps({"point": entry["point"], "result": entry["result"]})
+                    )
+                    oh.write("\n")
+                    oh.flush()
+                entry["checkpoint"] = False
+                yield entry
+        finally:
+            if oh:
+                oh.close()
+
+
+def _grid_indexes(points):
+    """
+    Returns the index of each parameter value among the sorted values on its axis
+    """
+    names = sorted(points[0].keys()) if points else []
+    axes = {n: sorted(set(p[n] for p in points)) for n in names}
+    indexes = [tuple(axes[n].index(p[n]) for n in names) for p in points]
+    sizes = tuple(len(axes[n]) for n in names)
+    return indexes, sizes
+
+
+def snake_order(points):
+    """
+    Orders parameter points along a boustrophedon path through the grid
+
+    Consecutive points differ by one step along one axis whenever the points form
+    a full grid, so each point is next to the previous one.
+    """
+    indexes, sizes = _grid_indexes(points)
+
+    def position(index):
+        p = 0
+        for i, n in zip(index, sizes):
+            # reverse direction on odd lines of the previous axes
+            p = p * n + (n - 1 - i if p % 2 else i)
+        return p
+
+    order = sorted(range(len(points)), key=lambda k: position(indexes[k]))
+    return [points[k] for k in order]
+
+
+class ConvergenceFailure(RuntimeError):
+    """
+    Raised by solve_counted, with the number of Newton "iterations" taken
+    """
+
+    def __init__(self, iterations):
+        super().__init__("Convergence failure!")
+        self.iterations = iterations
+
+
+def solve_counted(**kwargs):
+    """
+    Calls devsim.solve with info=True and returns the number of Newton iterations
+
+    Raises ConvergenceFailure when the solve does not converge.
+    """
+    import devsim
+
+    info = devsim.solve(info=True, **kwargs)
+    if not info["converged"]:
+        raise ConvergenceFailure(len(info["iterations"]))
+    return len(info["iterations"])
+
+
+def run_continuation_sweep(
+    device,
+    points,
+    apply_point,
+    cold_start,
+    warm_solve,
+    solve_point=None,
+):
+    """
+    Runs a sweep in one process, starting each point from a neighbour solution
+
+    Parameters:
+    -----------
+
+    device : name of the device, which is created before the sweep
+    points : list of parameter dictionaries, see parameter_grid
+    apply_point : function called as apply_point(point) to set the parameters
+                  and models for a point
+    cold_start : function called as cold_start(point) to solve the starting
+                 state from scratch, for example the equilibrium potential only
+                 solve followed by the drift diffusion solve.  It returns the
+                 number of Newton iterations, see solve_counted.
+    warm_solve : function called as warm_solve(point) to solve the starting
+                 state from the node solutions of the nearest converged point.
+                 It returns the number of Newton iterations, and raises an
+                 exception on failure.  The iterations of a failed attempt are
+                 counted when the exception has an "iterations" attribute, as
+                 ConvergenceFailure does.
+    solve_point : optional function called as solve_point(point) after the
+                  starting state is solved, for example to ramp the bias and
+                  extract currents.  Its return value is the point "result".
+
+    Description:
+    ------------
+
+    The points are visited in snake_order.  A point restores the node solutions
+    of the nearest earlier point in the parameter grid and calls warm_solve.  If
+    that fails, the point falls back to cold_start.  The node solutions of a
+    starting state are kept in memory only until the last point starting from
+    them.
+
+    Returns a list with a dictionary for each point containing the "point",
+    the "result", the Newton "iterations" for the starting state, including a
+    failed warm start, whether it was "warm" started, and the "neighbour" it
+    started from.
+    """
+    from devsim.python_packages.ramp import (
+        get_solution_names,
+        get_solution_snapshot,
+        set_solution_snapshot,
+    )
+
+    ordered = snake_order(points)
+    indexes, _sizes = _grid_indexes(ordered)
+
+    def distance(a, b):
+        return sum(abs(i - j) for i, j in zip(a, b))
+
+    # the earlier point each point starts from, ties going to the most recent
+    sources = [None]
+    for k in range(1, len(ordered)):
+        sources.append(
+            min(range(k - 1, -1, -1), key=lambda j: distance(indexes[k], indexes[j]))
+        )
+    last_use = {j: k for k, j in enumerate(sources) if j is not None}
+
+    snapshots = {}
+    results = []
+    for k, point in enumerate(ordered):
+        apply_point(point)
+        iterations = 0
+        neighbour = None
+        j = sources[k]
+        if j is not None:
+            neighbour = ordered[j]
+            if last_use[j] == k:
+                snapshot = snapshots.pop(j)
+            else:
+                snapshot = snapshots[j]
+            set_solution_snapshot(device, snapshot)
+            try:
+                iterations = warm_solve(point)
+            except Exception as msg:
+                print("warm start from %s failed: %s" % (neighbour, msg))
+                iterations = getattr(msg, "iterations", 0)
+                neighbour = None
+        if neighbour is None:
+            iterations += cold_start(point)
+        print("%s %d iterations" % (point, iterations))
+        if k in last_use:
+            snapshots[k] = get_solution_snapshot(device, get_solution_names(device))
+        result = solve_point(point) if solve_point else None
+        results.append(
+            {
+                "point": point,
+                "result": result,
+                "iterations": iterations,
+                "warm": neighbour is not None,
+                "neighbour": neighbour,
+            }
+        )
+    return results
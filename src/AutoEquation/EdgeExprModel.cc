@@ -73,7 +73,7 @@ void EdgeExprModel<DoubleType>::calcEdgeScalarValues() const
     typename MEE::ModelExprEval<DoubleType>::error_t errors;
     const Region *rp = &(this->GetRegion());
     MEE::ModelExprEval<DoubleType> mexp(rp, GetName(), errors);
-    MEE::ModelExprData<DoubleType> out = mexp.eval_function(equation);
+    MEE::ModelExprData<DoubleType> out = mexp.eval_function(equation, program);
 
     std::string output_errors;
     if (!errors.empty())
@@ -16,6 +16,11 @@ namespace Eqo {
 
 }
 
+namespace MEE {
+template <typename DoubleType>
+class ModelExprProgram;
+}
+
 EdgeModelPtr CreateEdgeExprModel(const std::string &, Eqo::EqObjPtr, RegionPtr, EdgeModel::DisplayType, ContactPtr);
 
 template <typename DoubleType>
@@ -37,6 +42,8 @@ class EdgeExprModel : public EdgeModel
         void calcEdgeScalarValues() const;
 
         const Eqo::EqObjPtr      equation;
+        //// created on first use when the "compiled_models" parameter is set
+        mutable std::shared_ptr<MEE::ModelExprProgram<DoubleType>> program;
 };
 
 #endif
@@ -7,6 +7,7 @@ SPDX-License-Identifier: Apache-2.0
 
 #include "ModelExprEval.hh"
 #include "ModelExprData.hh"
+#include "ModelExprProgram.hh"
 #include "NodeScalarData.hh"
 #include "EdgeScalarData.hh"
 #include "NodeModel.hh"
@@ -478,6 +479,52 @@ ModelExprData<DoubleType> ModelExprEval<DoubleType>::eval_function(Eqo::EqObjPtr
   return out;
 }
 
+template <typename DoubleType>
+ModelExprData<DoubleType> ModelExprEval<DoubleType>::eval_function(Eqo::EqObjPtr arg, ModelExprProgramPtr<DoubleType> &program)
+{
+  const Region *rp = data_ref;
+
+  //// contact models only evaluate their indexes
+  if ((!indexes.empty()) || ((etype != ExpectedType::NODE) && (etype != ExpectedType::EDGE)) || (!ModelExprProgram<DoubleType>::IsEnabled(*rp)))
+  {
+    return eval_function(arg);
+  }
+
+  if (!program)
+  {
+    program = std::make_shared<ModelExprProgram<DoubleType>>(arg);
+  }
+
+  if (!program->IsValid())
+  {
+    return eval_function(arg);
+  }
+
+  ModelExprDataCachePtr<DoubleType> cache = const_cast<Region *>(rp)->GetModelExprDataCache<DoubleType>();
+  if (!cache)
+  {
+    cache = ModelExprDataCachePtr<DoubleType>(new ModelExprDataCache<DoubleType>());
+    const_cast<Region *>(rp)->SetModelExprDataCache(cache);
+  }
+
+  const std::string &key = EngineAPI::getStringValue(arg);
+
+  ModelExprData<DoubleType> out(rp);
+  if (cache->GetEntry(key, out))
+  {
+  }
+  else if (program->Evaluate(*rp, etype, out))
+  {
+    cache->SetEntry(key, out);
+  }
+  else
+  {
+    out = eval_function(arg);
+  }
+
+  return out;
+}
+
 namespace {
 /// need to do a bunch of checks to find out what we are dealing with data-wise
 template <typename DoubleType>
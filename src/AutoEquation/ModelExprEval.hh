@@ -13,6 +13,7 @@ SPDX-License-Identifier: Apache-2.0
 #include <string>
 #include <list>
 #include <vector>
+#include <memory>
 class Region;
 typedef Region *RegionPtr;
 
@@ -23,6 +24,12 @@ namespace MEE {
 
 enum class ExpectedType {UNKNOWN = 0, NODE, EDGE, TRIANGLEEDGE, TETRAHEDRONEDGE};
 
+template <typename DoubleType>
+class ModelExprProgram;
+
+template <typename DoubleType>
+using ModelExprProgramPtr = std::shared_ptr<ModelExprProgram<DoubleType>>;
+
 template <typename DoubleType>
 class ModelExprEval {
     public:
@@ -36,6 +43,9 @@ class ModelExprEval {
         ~ModelExprEval();
 
         ModelExprData<DoubleType> eval_function(Eqo::EqObjPtr);
+        /// Uses the compiled program when the "compiled_models" parameter is set
+        /// The program is created on first use, and eval_function is the fallback
+        ModelExprData<DoubleType> eval_function(Eqo::EqObjPtr, ModelExprProgramPtr<DoubleType> &);
     private:
         ModelExprData<DoubleType> EvaluateAddType(Eqo::EqObjPtr);
         ModelExprData<DoubleType> EvaluateProductType(Eqo::EqObjPtr);
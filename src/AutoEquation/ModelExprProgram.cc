@@ -0,0 +1,929 @@
+/***
+DEVSIM
+Copyright 2026 DEVSIM LLC
+
+SPDX-License-Identifier: Apache-2.0
+***/
+
+#include "ModelExprProgram.hh"
+#include "NodeScalarData.hh"
+#include "EdgeScalarData.hh"
+#include "NodeModel.hh"
+#include "EdgeModel.hh"
+
+#include "GlobalData.hh"
+#include "NodeKeeper.hh"
+#include "Region.hh"
+#include "ObjectHolder.hh"
+#include "dsAssert.hh"
+
+#include "FPECheck.hh"
+#include "GetNumberOfThreads.hh"
+#include "ThreadPool.hh"
+#include "dsTimer.hh"
+
+#include "MathEval.hh"
+#include "MathWrapper.hh"
+
+#include "EngineAPI.hh"
+
+#include <algorithm>
+#include <memory>
+
+namespace MEE {
+
+namespace {
+bool GetBooleanParameter(const Region &region, const std::string &name, bool default_value)
+{
+  bool ret = default_value;
+  const GlobalData &gdata = GlobalData::GetInstance();
+  GlobalData::DBEntry_t dbent = gdata.GetDBEntryOnRegion(&region, name);
+  if (dbent.first)
+  {
+    const auto &x = dbent.second.GetBoolean();
+    if (x.first)
+    {
+      ret = x.second;
+    }
+  }
+  return ret;
+}
+
+size_t GetBlockSize(const Region &region)
+{
+  size_t ret = 256;
+  const GlobalData &gdata = GlobalData::GetInstance();
+  GlobalData::DBEntry_t dbent = gdata.GetDBEntryOnRegion(&region, "compiled_models_block_size");
+  if (dbent.first)
+  {
+    ObjectHolder::IntegerEntry_t ient = dbent.second.GetInteger();
+    if (ient.first && (ient.second > 0))
+    {
+      ret = static_cast<size_t>(ient.second);
+    }
+  }
+  return ret;
+}
+}
+
+template <typename DoubleType>
+bool ModelExprProgram<DoubleType>::IsEnabled(const Region &region)
+{
+  return GetBooleanParameter(region, "compiled_models", false);
+}
+
+template <typename DoubleType>
+bool ModelExprProgram<DoubleType>::IsSharingEnabled(const Region &region)
+{
+  return GetBooleanParameter(region, "shared_subexpressions", true);
+}
+
+template <typename DoubleType>
+ModelExprProgram<DoubleType>::ModelExprProgram(Eqo::EqObjPtr equation) : valid(true)
+{
+  //// identical subexpressions share one instruction
+  std::map<std::string, size_t> compiled;
+  Compile(equation, compiled);
+}
+
+template <typename DoubleType>
+ModelExprProgram<DoubleType>::~ModelExprProgram()
+{
+  ShareWith(std::shared_ptr<ModelExprSharedTerms<DoubleType>>());
+}
+
+//// The shared terms of the region count the subexpressions of each program
+template <typename DoubleType>
+void ModelExprProgram<DoubleType>::ShareWith(const std::shared_ptr<ModelExprSharedTerms<DoubleType>> &terms) const
+{
+  std::shared_ptr<ModelExprSharedTerms<DoubleType>> old = shared_with.lock();
+  if (old == terms)
+  {
+    return;
+  }
+
+  for (const Instruction &inst : instructions)
+  {
+    if (inst.leaves.empty())
+    {
+      continue;
+    }
+
+    if (old)
+    {
+      old->RemoveProgram(inst.key);
+    }
+
+    if (terms)
+    {
+      terms->AddProgram(inst.key);
+    }
+  }
+  shared_with = terms;
+}
+
+template <typename DoubleType>
+size_t ModelExprProgram<DoubleType>::Compile(Eqo::EqObjPtr arg, std::map<std::string, size_t> &compiled)
+{
+  const std::string key = EngineAPI::getStringValue(arg);
+
+  typename std::map<std::string, size_t>::const_iterator it = compiled.find(key);
+  if (it != compiled.end())
+  {
+    return it->second;
+  }
+
+  Instruction inst;
+  inst.op    = OpCode::CONSTANT;
+  inst.key   = key;
+  inst.value = 0.0;
+
+  bool has_args = true;
+  switch (EngineAPI::getEnumeratedType(arg))
+  {
+    case EngineAPI::MODEL_OBJ:
+      inst.op   = OpCode::MODEL;
+      inst.name = key;
+      has_args  = false;
+      break;
+    case EngineAPI::VARIABLE_OBJ:
+      inst.op   = OpCode::VARIABLE;
+      inst.name = EngineAPI::getName(arg);
+      has_args  = false;
+      break;
+    case EngineAPI::CONST_OBJ:
+      inst.op    = OpCode::CONSTANT;
+      inst.value = EngineAPI::getDoubleValue(arg);
+      has_args   = false;
+      break;
+    case EngineAPI::PRODUCT_OBJ:
+      inst.op = OpCode::PRODUCT;
+      break;
+    case EngineAPI::ADD_OBJ:
+      inst.op = OpCode::ADD;
+      break;
+    case EngineAPI::IF_OBJ:
+      inst.op = OpCode::IF;
+      break;
+    case EngineAPI::IFELSE_OBJ:
+      inst.op   = OpCode::IFELSE;
+      inst.name = "ifelse";
+      break;
+    case EngineAPI::USERFUNC_OBJ:
+    case EngineAPI::EXPONENT_OBJ:
+    case EngineAPI::POW_OBJ:
+    case EngineAPI::LOG_OBJ:
+    case EngineAPI::ULOGICAL_OBJ:
+    case EngineAPI::BLOGICAL_OBJ:
+      inst.op   = OpCode::FUNCTION;
+      inst.name = EngineAPI::getName(arg);
+      //// reductions over all of the entries cannot be done by block
+      if ((inst.name == "vec_sum") || (inst.name == "vec_max") || (inst.name == "vec_min"))
+      {
+        valid = false;
+      }
+      break;
+    default:
+      valid    = false;
+      has_args = false;
+      break;
+  }
+
+  if (has_args)
+  {
+    std::vector<Eqo::EqObjPtr> values = EngineAPI::getArgs(arg);
+    inst.args.reserve(values.size());
+    for (size_t i = 0; i < values.size(); ++i)
+    {
+      inst.args.push_back(Compile(values[i], compiled));
+    }
+
+    if (inst.args.empty()
+        || ((inst.op == OpCode::IF) && (inst.args.size() != 2))
+        || ((inst.op == OpCode::IFELSE) && (inst.args.size() != 3)))
+    {
+      valid = false;
+    }
+
+    //// ordered by name, so that the signature is the same in every program
+    for (size_t a : inst.args)
+    {
+      const Instruction &x = instructions[a];
+      if ((x.op == OpCode::MODEL) || (x.op == OpCode::VARIABLE))
+      {
+        inst.leaves.push_back(a);
+      }
+      else
+      {
+        inst.leaves.insert(inst.leaves.end(), x.leaves.begin(), x.leaves.end());
+      }
+    }
+    std::sort(inst.leaves.begin(), inst.leaves.end(), [this](size_t x, size_t y) {
+      return instructions[x].key < instructions[y].key;
+    });
+    inst.leaves.erase(std::unique(inst.leaves.begin(), inst.leaves.end()), inst.leaves.end());
+  }
+
+  instructions.push_back(inst);
+  const size_t index = instructions.size() - 1;
+  compiled[key] = index;
+  return index;
+}
+
+template <typename DoubleType>
+bool ModelExprProgram<DoubleType>::BindModel(size_t index, Binding &binding) const
+{
+  const Region &region = *binding.region;
+  RegisterState &state = binding.states[index];
+  const std::string &name = instructions[index].name;
+
+  //// same search order as ModelExprEval, and only the expected data type
+  size_t length = 0;
+  if (ConstNodeModelPtr nm = region.GetNodeModel(name))
+  {
+    if ((binding.etype != ExpectedType::NODE) || nm->IsInProcess())
+    {
+      return false;
+    }
+
+    if (nm->IsUniform())
+    {
+      state.scalar = nm->template GetUniformValue<DoubleType>();
+    }
+    else
+    {
+      state.values    = nm->template GetScalarValues<DoubleType>().data();
+      state.is_vector = true;
+    }
+    length        = nm->GetLength();
+    state.version = nm->GetVersion();
+  }
+  else if (ConstEdgeModelPtr em = region.GetEdgeModel(name))
+  {
+    if ((binding.etype != ExpectedType::EDGE) || em->IsInProcess())
+    {
+      return false;
+    }
+
+    if (em->IsUniform())
+    {
+      state.scalar = em->template GetUniformValue<DoubleType>();
+    }
+    else
+    {
+      state.values    = em->template GetScalarValues<DoubleType>().data();
+      state.is_vector = true;
+    }
+    length        = em->GetLength();
+    state.version = em->GetVersion();
+  }
+  else
+  {
+    //// element edge models, and the substitutions for missing models
+    return false;
+  }
+
+  if ((binding.length != 0) && (binding.length != length))
+  {
+    return false;
+  }
+  binding.length = length;
+  state.has_data = true;
+
+  return true;
+}
+
+template <typename DoubleType>
+bool ModelExprProgram<DoubleType>::BindVariable(size_t index, Binding &binding) const
+{
+  RegisterState &state = binding.states[index];
+  const std::string &name = instructions[index].name;
+
+  GlobalData &gdata = GlobalData::GetInstance();
+  NodeKeeper &nk    = NodeKeeper::instance();
+
+  const GlobalData::DoubleDBEntry_t &gdbent = gdata.GetDoubleDBEntryOnRegion(binding.region, name);
+  if (gdbent.first)
+  {
+    state.scalar = gdbent.second;
+  }
+  else if (nk.IsCircuitNode(name))
+  {
+    state.scalar = nk.GetNodeValue("dcop", name);
+  }
+  else
+  {
+    return false;
+  }
+  return true;
+}
+
+template <typename DoubleType>
+bool ModelExprProgram<DoubleType>::BindFunction(size_t index, Binding &binding) const
+{
+  const Instruction &inst = instructions[index];
+
+  bool is_vector = false;
+  bool has_data  = false;
+  std::vector<DoubleType> dargs(inst.args.size());
+  for (size_t i = 0; i < inst.args.size(); ++i)
+  {
+    if (!Bind(inst.args[i], binding))
+    {
+      return false;
+    }
+    const RegisterState &x = binding.states[inst.args[i]];
+    is_vector = is_vector || x.is_vector;
+    has_data  = has_data || x.has_data;
+    dargs[i]  = x.scalar;
+  }
+
+  //// python functions are evaluated by ModelExprEval
+  const Eqomfp::MathWrapper<DoubleType> *func = MathEval<DoubleType>::GetInstance().GetMathWrapper(inst.name);
+  if ((!func) || (func->GetNumberArguments() != inst.args.size()))
+  {
+    return false;
+  }
+
+  RegisterState &state = binding.states[index];
+  state.has_data = has_data;
+  if (is_vector)
+  {
+    state.is_vector  = true;
+    state.func       = func;
+    binding.max_args = std::max(binding.max_args, inst.args.size());
+    binding.steps.push_back(index);
+  }
+  else
+  {
+    std::string error;
+    state.scalar = func->Evaluate(dargs, error);
+    if (!error.empty())
+    {
+      return false;
+    }
+  }
+  return true;
+}
+
+//// Binds a shared subexpression to the values stored by another program,
+//// when none of its models and parameters have changed since
+template <typename DoubleType>
+bool ModelExprProgram<DoubleType>::BindShared(size_t index, Binding &binding, Signature &signature, bool &shared) const
+{
+  const Instruction &inst = instructions[index];
+  shared = (binding.shared_terms != nullptr) && (!inst.leaves.empty()) && binding.shared_terms->IsShared(inst.key);
+  if (!shared)
+  {
+    return true;
+  }
+
+  for (size_t l : inst.leaves)
+  {
+    if (!Bind(l, binding))
+    {
+      return false;
+    }
+
+    const RegisterState &x = binding.states[l];
+    if (instructions[l].op == OpCode::MODEL)
+    {
+      signature.versions.push_back(x.version);
+    }
+    else
+    {
+      signature.parameters.push_back(x.scalar);
+    }
+  }
+
+  typename ModelExprSharedTerms<DoubleType>::Values_t values = binding.shared_terms->GetEntry(inst.key, signature);
+  if (values && (values->size() == binding.length))
+  {
+    RegisterState &state = binding.states[index];
+    state.bound     = true;
+    state.is_vector = true;
+    state.has_data  = true;
+    state.values    = values->data();
+    binding.reused.push_back(values);
+  }
+  return true;
+}
+
+//// Follows the evaluation order of ModelExprEval, including the terms it skips
+template <typename DoubleType>
+bool ModelExprProgram<DoubleType>::Bind(size_t index, Binding &binding) const
+{
+  if (binding.states[index].bound)
+  {
+    return true;
+  }
+
+  const Instruction &inst = instructions[index];
+  binding.states[index].source = index;
+
+  Signature signature;
+  bool shared = false;
+  if (!BindShared(index, binding, signature, shared))
+  {
+    return false;
+  }
+  else if (binding.states[index].bound)
+  {
+    return true;
+  }
+
+  bool ok = true;
+  switch (inst.op)
+  {
+    case OpCode::MODEL:
+      ok = BindModel(index, binding);
+      break;
+    case OpCode::VARIABLE:
+      ok = BindVariable(index, binding);
+      break;
+    case OpCode::CONSTANT:
+      binding.states[index].scalar = inst.value;
+      break;
+    case OpCode::ADD:
+    {
+      bool is_vector = false;
+      bool has_data  = false;
+      for (size_t i = 0; ok && (i < inst.args.size()); ++i)
+      {
+        ok = Bind(inst.args[i], binding);
+        const RegisterState &x = binding.states[inst.args[i]];
+        is_vector = is_vector || x.is_vector;
+        has_data  = has_data || x.has_data;
+      }
+
+      if (ok)
+      {
+        RegisterState &state = binding.states[index];
+        state.has_data = has_data;
+        if (is_vector)
+        {
+          state.is_vector = true;
+          binding.steps.push_back(index);
+        }
+        else
+        {
+          DoubleType sum = 0.0;
+          for (size_t i = 0; i < inst.args.size(); ++i)
+          {
+            sum += binding.states[inst.args[i]].scalar;
+          }
+          state.scalar = sum;
+        }
+      }
+      break;
+    }
+    case OpCode::PRODUCT:
+    {
+      bool is_vector = false;
+      bool has_data  = false;
+      bool is_zero   = false;
+      for (size_t i = 0; ok && (i < inst.args.size()); ++i)
+      {
+        ok = Bind(inst.args[i], binding);
+        const RegisterState &x = binding.states[inst.args[i]];
+        if (ok && !x.is_vector && !x.has_data && (x.scalar == 0.0))
+        {
+          //// short circuit multiplication
+          is_zero = true;
+          break;
+        }
+        is_vector = is_vector || x.is_vector;
+        has_data  = has_data || x.has_data;
+      }
+
+      if (ok)
+      {
+        RegisterState &state = binding.states[index];
+        if (is_zero)
+        {
+          state.scalar = 0.0;
+        }
+        else if (is_vector)
+        {
+          state.is_vector = true;
+          state.has_data  = has_data;
+          binding.steps.push_back(index);
+        }
+        else
+        {
+          DoubleType prod = 1.0;
+          for (size_t i = 0; i < inst.args.size(); ++i)
+          {
+            prod *= binding.states[inst.args[i]].scalar;
+          }
+          state.scalar   = prod;
+          state.has_data = has_data;
+        }
+      }
+      break;
+    }
+    case OpCode::IF:
+    case OpCode::IFELSE:
+    {
+      ok = Bind(inst.args[0], binding);
+      const RegisterState test = binding.states[inst.args[0]];
+      if (!ok)
+      {
+      }
+      else if (!test.is_vector && !test.has_data)
+      {
+        //// only the selected branch is evaluated
+        if ((inst.op == OpCode::IF) && (test.scalar == 0.0))
+        {
+          binding.states[index].scalar = 0.0;
+        }
+        else
+        {
+          const size_t branch = ((inst.op == OpCode::IFELSE) && (test.scalar == 0.0)) ? inst.args[2] : inst.args[1];
+          ok = Bind(branch, binding);
+          if (ok)
+          {
+            binding.states[index] = binding.states[branch];
+          }
+        }
+      }
+      else if (inst.op == OpCode::IFELSE)
+      {
+        ok = BindFunction(index, binding);
+      }
+      else
+      {
+        //// a product of the test and the value
+        ok = Bind(inst.args[1], binding);
+        const RegisterState &value = binding.states[inst.args[1]];
+        RegisterState &state = binding.states[index];
+        state.has_data = true;
+        if (!ok)
+        {
+        }
+        else if (test.is_vector || value.is_vector)
+        {
+          state.is_vector = true;
+          binding.steps.push_back(index);
+        }
+        else
+        {
+          state.scalar = test.scalar;
+          state.scalar *= value.scalar;
+        }
+      }
+      break;
+    }
+    case OpCode::FUNCTION:
+      ok = BindFunction(index, binding);
+      break;
+  }
+
+  if (ok && shared)
+  {
+    //// stored for the other programs while the blocks are evaluated
+    RegisterState &state = binding.states[index];
+    if (state.is_vector && (!state.values) && (state.source == index))
+    {
+      Store store;
+      store.index     = index;
+      store.signature = signature;
+      binding.stores.push_back(store);
+      state.store = binding.stores.size();
+    }
+  }
+
+  binding.states[index].bound = ok;
+  return ok;
+}
+
+template <typename DoubleType>
+void ModelExprProgram<DoubleType>::RunBlock(const Binding &binding, size_t beg, size_t len, std::vector<std::vector<DoubleType>> &registers, std::vector<DoubleType> &output) const
+{
+  const std::vector<RegisterState> &states = binding.states;
+
+  const auto get_values = [&](size_t r) -> const DoubleType * {
+    const RegisterState &s = states[states[r].source];
+    return (s.values) ? (s.values + beg) : registers[s.slot].data();
+  };
+
+  for (size_t i : binding.steps)
+  {
+    const Instruction   &inst  = instructions[i];
+    const RegisterState &state = states[i];
+    std::vector<DoubleType> &result = registers[state.slot];
+    DoubleType *dst = result.data();
+
+    switch (inst.op)
+    {
+      case OpCode::ADD:
+      {
+        std::fill(dst, dst + len, static_cast<DoubleType>(0.0));
+        for (size_t a : inst.args)
+        {
+          const RegisterState &x = states[a];
+          if (x.is_vector)
+          {
+            const DoubleType *v = get_values(a);
+            for (size_t k = 0; k < len; ++k)
+            {
+              dst[k] += v[k];
+            }
+          }
+          else
+          {
+            const DoubleType v = x.scalar;
+            for (size_t k = 0; k < len; ++k)
+            {
+              dst[k] += v;
+            }
+          }
+        }
+        break;
+      }
+      case OpCode::PRODUCT:
+      case OpCode::IF:
+      {
+        for (size_t j = 0; j < inst.args.size(); ++j)
+        {
+          const size_t a = inst.args[j];
+          const RegisterState &x = states[a];
+          if (j == 0)
+          {
+            if (x.is_vector)
+            {
+              const DoubleType *v = get_values(a);
+              std::copy(v, v + len, dst);
+            }
+            else
+            {
+              std::fill(dst, dst + len, x.scalar);
+            }
+          }
+          else if (x.is_vector)
+          {
+            const DoubleType *v = get_values(a);
+            for (size_t k = 0; k < len; ++k)
+            {
+              dst[k] *= v[k];
+            }
+          }
+          else
+          {
+            const DoubleType v = x.scalar;
+            for (size_t k = 0; k < len; ++k)
+            {
+              dst[k] *= v;
+            }
+          }
+        }
+        break;
+      }
+      case OpCode::IFELSE:
+      case OpCode::FUNCTION:
+      {
+        const size_t nargs = inst.args.size();
+        std::vector<DoubleType> dvals(nargs);
+        std::vector<const std::vector<DoubleType> *> vvals(nargs);
+        for (size_t j = 0; j < nargs; ++j)
+        {
+          const size_t a = inst.args[j];
+          const RegisterState &x = states[a];
+          const RegisterState &s = states[x.source];
+          dvals[j] = x.scalar;
+          if (!x.is_vector)
+          {
+          }
+          else if (s.values)
+          {
+            //// the functions take vectors indexed from the start of the block
+            std::vector<DoubleType> &copy = registers[binding.number_slots + j];
+            std::copy(s.values + beg, s.values + beg + len, copy.begin());
+            vvals[j] = &copy;
+          }
+          else
+          {
+            vvals[j] = &registers[s.slot];
+          }
+        }
+        std::string error;
+        state.func->Evaluate(dvals, vvals, error, result, 0, len);
+        break;
+      }
+      default:
+        dsAssert(false, "UNEXPECTED");
+        break;
+    }
+
+    if (state.store)
+    {
+      std::copy(dst, dst + len, binding.stores[state.store - 1].values->begin() + beg);
+    }
+  }
+
+  const size_t root = instructions.size() - 1;
+  if (states[root].is_vector)
+  {
+    const DoubleType *v = get_values(root);
+    std::copy(v, v + len, output.begin() + beg);
+  }
+}
+
+template <typename DoubleType>
+bool ModelExprProgram<DoubleType>::Evaluate(const Region &region, ExpectedType etype, ModelExprData<DoubleType> &out) const
+{
+  if (!valid)
+  {
+    return false;
+  }
+
+  FPECheck::ClearFPE();
+
+  std::shared_ptr<ModelExprSharedTerms<DoubleType>> shared_terms;
+  if (IsSharingEnabled(region))
+  {
+    Region &r = const_cast<Region &>(region);
+    shared_terms = r.GetModelExprSharedTerms<DoubleType>();
+    if (!shared_terms)
+    {
+      shared_terms = std::make_shared<ModelExprSharedTerms<DoubleType>>();
+      r.SetModelExprSharedTerms(shared_terms);
+    }
+    ShareWith(shared_terms);
+  }
+
+  Binding binding;
+  binding.region       = &region;
+  binding.etype        = etype;
+  binding.length       = 0;
+  binding.number_slots = 0;
+  binding.max_args     = 0;
+  binding.shared_terms = shared_terms.get();
+  binding.states.resize(instructions.size());
+
+  const size_t root = instructions.size() - 1;
+  if (!Bind(root, binding))
+  {
+    FPECheck::ClearFPE();
+    return false;
+  }
+
+  //// reuse the block storage of values no longer needed
+  {
+    std::vector<RegisterState> &states = binding.states;
+    const size_t nsteps = binding.steps.size();
+    const size_t never = nsteps;
+    std::vector<size_t> last_use(states.size(), 0);
+    for (size_t p = 0; p < nsteps; ++p)
+    {
+      for (size_t a : instructions[binding.steps[p]].args)
+      {
+        last_use[states[a].source] = p;
+      }
+    }
+    last_use[states[root].source] = never;
+
+    std::vector<size_t> free_slots;
+    std::vector<bool>   released(states.size(), false);
+    for (size_t p = 0; p < nsteps; ++p)
+    {
+      const size_t i = binding.steps[p];
+      if (free_slots.empty())
+      {
+        states[i].slot = binding.number_slots++;
+      }
+      else
+      {
+        states[i].slot = free_slots.back();
+        free_slots.pop_back();
+      }
+
+      for (size_t a : instructions[i].args)
+      {
+        const size_t s = states[a].source;
+        const bool computed = states[s].is_vector && !states[s].values;
+        if (computed && (last_use[s] == p) && !released[s])
+        {
+          released[s] = true;
+          free_slots.push_back(states[s].slot);
+        }
+      }
+    }
+  }
+
+  const RegisterState &result = binding.states[root];
+  const size_t length = binding.length;
+
+  if (result.is_vector)
+  {
+    const size_t block_size = GetBlockSize(region);
+    const size_t num_registers = binding.number_slots + binding.max_args;
+
+    std::vector<DoubleType> output(length);
+
+    for (Store &store : binding.stores)
+    {
+      store.values = std::make_shared<std::vector<DoubleType>>(length);
+    }
+
+    const size_t num_threads = ThreadInfo::GetNumberOfThreads();
+    const size_t task_size   = ThreadInfo::GetMinimumTaskSize();
+
+    if ((num_threads > 1) && (length > task_size))
+    {
+      //// the storage and the floating point exceptions of each worker
+      std::vector<std::vector<std::vector<DoubleType>>> registers(num_threads);
+      std::vector<FPECheck::FPEFlag_t> flags(num_threads, FPECheck::getClearedFlag());
+
+      size_t chunk_size = ThreadInfo::GetChunkSize(length, num_threads);
+      chunk_size = block_size * ((chunk_size + block_size - 1) / block_size);
+
+      ThreadInfo::ThreadPool::GetInstance().Run(num_threads, length, chunk_size,
+        [&](size_t worker, size_t b, size_t e) {
+          std::vector<std::vector<DoubleType>> &wregisters = registers[worker];
+          if (wregisters.empty())
+          {
+            wregisters.resize(num_registers, std::vector<DoubleType>(block_size));
+          }
+          FPECheck::ClearFPE();
+          for (size_t i = b; i < e; i += block_size)
+          {
+            RunBlock(binding, i, std::min(block_size, e - i), wregisters, output);
+          }
+          flags[worker] = FPECheck::combineFPEFlags(flags[worker], FPECheck::getFPEFlags());
+        });
+
+      FPECheck::FPEFlag_t flag = FPECheck::getClearedFlag();
+      for (auto f : flags)
+      {
+        flag = FPECheck::combineFPEFlags(flag, f);
+      }
+
+      if (FPECheck::CheckFPE(flag))
+      {
+        return false;
+      }
+    }
+    else
+    {
+      std::vector<std::vector<DoubleType>> registers(num_registers, std::vector<DoubleType>(block_size));
+      for (size_t i = 0; i < length; i += block_size)
+      {
+        RunBlock(binding, i, std::min(block_size, length - i), registers, output);
+      }
+    }
+
+    if (etype == ExpectedType::NODE)
+    {
+      out = ModelExprData<DoubleType>(NodeScalarData<DoubleType>(output), &region);
+    }
+    else
+    {
+      out = ModelExprData<DoubleType>(EdgeScalarData<DoubleType>(output), &region);
+    }
+  }
+  else if (result.has_data)
+  {
+    if (etype == ExpectedType::NODE)
+    {
+      out = ModelExprData<DoubleType>(NodeScalarData<DoubleType>(result.scalar, length), &region);
+    }
+    else
+    {
+      out = ModelExprData<DoubleType>(EdgeScalarData<DoubleType>(result.scalar, length), &region);
+    }
+  }
+  else
+  {
+    out = ModelExprData<DoubleType>(result.scalar, &region);
+  }
+
+  if (FPECheck::CheckFPE())
+  {
+    FPECheck::ClearFPE();
+    return false;
+  }
+
+  //// the stored values are only computed for a vector result
+  static dsCounterTotal &evaluations = dsCounterTotal::GetInstance("shared_subexpression_evaluations");
+  static dsCounterTotal &reuses      = dsCounterTotal::GetInstance("shared_subexpression_reuses");
+  if (result.is_vector)
+  {
+    for (const Store &store : binding.stores)
+    {
+      shared_terms->SetEntry(instructions[store.index].key, store.signature, store.values);
+    }
+    evaluations.Add(binding.stores.size());
+  }
+  reuses.Add(binding.reused.size());
+
+  return true;
+}
+
+template class ModelExprProgram<double>;
+#ifdef DEVSIM_EXTENDED_PRECISION
+#include "Float128.hh"
+template class ModelExprProgram<float128>;
+#endif
+}
+
@@ -0,0 +1,125 @@
+/***
+DEVSIM
+Copyright 2026 DEVSIM LLC
+
+SPDX-License-Identifier: Apache-2.0
+***/
+
+#ifndef MODEL_EXPR_PROGRAM_HH
+#define MODEL_EXPR_PROGRAM_HH
+#include "ModelExprEval.hh"
+#include "ModelExprSharedTerms.hh"
+#include <cstddef>
+#include <map>
+#include <memory>
+#include <string>
+#include <vector>
+
+namespace Eqomfp {
+template <typename DoubleType>
+class MathWrapper;
+}
+
+namespace MEE {
+
+//// The expression of a node or edge model lowered to a list of instructions.
+//// Each instruction writes one register, and the program is evaluated over
+//// blocks of entries, so that the intermediate results stay in cache.
+template <typename DoubleType>
+class ModelExprProgram {
+    public:
+        explicit ModelExprProgram(Eqo::EqObjPtr);
+        ~ModelExprProgram();
+
+        //// false when the expression has terms the program does not support
+        bool IsValid() const
+        {
+          return valid;
+        }
+
+        size_t GetNumberInstructions() const
+        {
+          return instructions.size();
+        }
+
+        //// Returns false when the expression must be evaluated by ModelExprEval instead,
+        //// including for floating point exceptions, so that it can report the errors
+        //// The subexpressions shared with other programs on the region are taken from
+        //// the region when their models and parameters have not changed
+        bool Evaluate(const Region &, ExpectedType, ModelExprData<DoubleType> &) const;
+
+        //// the "compiled_models" parameter
+        static bool IsEnabled(const Region &);
+
+        //// the "shared_subexpressions" parameter
+        static bool IsSharingEnabled(const Region &);
+
+    private:
+        enum class OpCode {MODEL, VARIABLE, CONSTANT, ADD, PRODUCT, IF, IFELSE, FUNCTION};
+
+        struct Instruction {
+          OpCode              op;
+          std::string         key;    // the expression
+          std::string         name;   // model, variable, or function
+          DoubleType          value;  // constant
+          std::vector<size_t> args;   // instructions for the arguments
+          std::vector<size_t> leaves; // models and variables in the expression, ordered by name
+        };
+
+        struct RegisterState {
+          bool                                   bound     = false;
+          bool                                   is_vector = false;
+          bool                                   has_data  = false; // depends on node or edge data
+          DoubleType                             scalar    = 0.0;
+          const DoubleType                      *values    = nullptr; // model values
+          const Eqomfp::MathWrapper<DoubleType> *func      = nullptr;
+          size_t                                 source    = 0; // register holding the result
+          size_t                                 slot      = 0; // block storage of a computed vector
+          size_t                                 version   = 0; // of the model
+          size_t                                 store     = 0; // one more than the index of the stored result
+        };
+
+        typedef typename ModelExprSharedTerms<DoubleType>::Signature Signature;
+
+        //// a shared subexpression computed by the program
+        struct Store {
+          size_t                                   index;
+          Signature                                signature;
+          std::shared_ptr<std::vector<DoubleType>> values;
+        };
+
+        struct Binding {
+          const Region              *region;
+          ExpectedType               etype;
+          size_t                     length;
+          std::vector<RegisterState> states;
+          std::vector<size_t>        steps; // registers computed for each block
+          size_t                     number_slots;
+          size_t                     max_args; // of the functions computed for each block
+          ModelExprSharedTerms<DoubleType>                    *shared_terms;
+          std::vector<Store>                                   stores;
+          std::vector<typename ModelExprSharedTerms<DoubleType>::Values_t> reused;
+        };
+
+        size_t Compile(Eqo::EqObjPtr, std::map<std::string, size_t> &);
+        bool   Bind(size_t, Binding &) const;
+        bool   BindModel(size_t, Binding &) const;
+        bool   BindVariable(size_t, Binding &) const;
+        bool   BindFunction(size_t, Binding &) const;
+        void   RunBlock(const Binding &, size_t, size_t, std::vector<std::vector<DoubleType>> &, std::vector<DoubleType> &) const;
+
+        ModelExprProgram();
+        ModelExprProgram(const ModelExprProgram &);
+        ModelExprProgram &operator=(const ModelExprProgram &);
+
+        void   ShareWith(const std::shared_ptr<ModelExprSharedTerms<DoubleType>> &) const;
+        bool   BindShared(size_t, Binding &, Signature &, bool &) const;
+
+        std::vector<Instruction> instructions;
+        bool                     valid;
+        //// the subexpressions of the program are counted by these
+        mutable std::weak_ptr<ModelExprSharedTerms<DoubleType>> shared_with;
+};
+}
+#endif
+
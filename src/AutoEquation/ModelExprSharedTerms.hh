@@ -0,0 +1,99 @@
+/***
+DEVSIM
+Copyright 2026 DEVSIM LLC
+
+SPDX-License-Identifier: Apache-2.0
+***/
+
+#ifndef MODEL_EXPR_SHARED_TERMS_HH
+#define MODEL_EXPR_SHARED_TERMS_HH
+#include <cstddef>
+#include <memory>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+namespace MEE {
+
+//// The values of the subexpressions found in more than one model program on a region.
+//// An entry is valid until a model or parameter it depends on changes, so that each
+//// shared subexpression is evaluated once for each update of its dependencies.
+template <typename DoubleType>
+class ModelExprSharedTerms {
+  public:
+    //// the versions of the models and the values of the parameters,
+    //// ordered by the name of the model or parameter
+    struct Signature {
+      std::vector<size_t>     versions;
+      std::vector<DoubleType> parameters;
+
+      bool operator==(const Signature &other) const
+      {
+        return (versions == other.versions) && (parameters == other.parameters);
+      }
+    };
+
+    typedef std::shared_ptr<const std::vector<DoubleType>> Values_t;
+
+    //// called once by each program containing the subexpression
+    void AddProgram(const std::string &key)
+    {
+      ++counts[key];
+    }
+
+    void RemoveProgram(const std::string &key)
+    {
+      typename std::unordered_map<std::string, size_t>::iterator it = counts.find(key);
+      if (it == counts.end())
+      {
+        return;
+      }
+
+      if (--(it->second) < 2)
+      {
+        entries.erase(key);
+      }
+
+      if (it->second == 0)
+      {
+        counts.erase(it);
+      }
+    }
+
+    bool IsShared(const std::string &key) const
+    {
+      typename std::unordered_map<std::string, size_t>::const_iterator it = counts.find(key);
+      return (it != counts.end()) && (it->second > 1);
+    }
+
+    //// null unless the values were stored for the same signature
+    Values_t GetEntry(const std::string &key, const Signature &signature) const
+    {
+      Values_t ret;
+      typename std::unordered_map<std::string, Entry>::const_iterator it = entries.find(key);
+      if ((it != entries.end()) && (it->second.signature == signature))
+      {
+        ret = it->second.values;
+      }
+      return ret;
+    }
+
+    void SetEntry(const std::string &key, const Signature &signature, const Values_t &values)
+    {
+      Entry &entry = entries[key];
+      entry.signature = signature;
+      entry.values    = values;
+    }
+
+  private:
+    struct Entry {
+      Signature signature;
+      Values_t  values;
+    };
+
+    std::unordered_map<std::string, size_t> counts;
+    std::unordered_map<std::string, Entry>  entries;
+};
+}
+#endif
+
@@ -16,6 +16,11 @@ namespace Eqo {
 
 }
 
+namespace MEE {
+template <typename DoubleType>
+class ModelExprProgram;
+}
+
 NodeModelPtr CreateNodeExprModel(const std::string &, Eqo::EqObjPtr, RegionPtr, NodeModel::DisplayType, ContactPtr cp);
 
 template <typename DoubleType>
@@ -37,6 +42,8 @@ class NodeExprModel : public NodeModel
         void calcNodeScalarValues() const;
         void setInitialValues();
         const Eqo::EqObjPtr      equation;
+        //// created on first use when the "compiled_models" parameter is set
+        mutable std::shared_ptr<MEE::ModelExprProgram<DoubleType>> program;
 };
 
 #endif
@@ -1040,6 +1040,7 @@ void Region::AddTetrahedronEdgeModel(TetrahedronEdgeModelPtr emp)
 void Region::RegisterCallback(const std::string &mod, const std::string &dep)
 {
     DependencyMap[mod].insert(dep);
+    ReverseDependencyMap[dep].insert(mod);
 }
 
 void Region::UnregisterCallback(const std::string &mod)
@@ -1048,73 +1049,62 @@ void Region::UnregisterCallback(const std::string &mod)
     DependencyMap_t::iterator it = DependencyMap.find(mod);
     if (it != DependencyMap.end())
     {
+        for (const std::string &dep : it->second)
+        {
+            DependencyMap_t::iterator rit = ReverseDependencyMap.find(dep);
+            if (rit != ReverseDependencyMap.end())
+            {
+                rit->second.erase(mod);
+                if (rit->second.empty())
+                {
+                    ReverseDependencyMap.erase(rit);
+                }
+            }
+        }
         DependencyMap.erase(it);
     }
 }
 
 /*
- * Does not yet handle cyclic dependencies
  * Does not mark the original dependency as being old
+ * Only the models depending on str are visited, and the models already out of date
+ * are not signalled again, so that each model is visited once.  The models are
+ * recalculated when their values are next requested.
  */
 void Region::SignalCallbacks(const std::string &str)
 {
-  typedef std::set<std::string> list_t;
-  list_t list;
-  DependencyMap_t::iterator it = DependencyMap.begin();
-  const DependencyMap_t::iterator end = DependencyMap.end();
-  for ( ; it != end; ++it)
-  {
-    // If this one has a dependency on str
-    if ((*it).second.count(str))
-    {
-      // put it in the set to be notified
-      list.insert(it->first);
-    }
-  }
-
-  list_t::iterator lit = list.begin();
-  const list_t::iterator lend = list.end();
-  for ( ; lit != lend; ++lit)
+  DependencyMap_t::const_iterator it = ReverseDependencyMap.find(str);
+  if (it != ReverseDependencyMap.end())
   {
-    dsAssert(!(nodeModels.count(*lit) && edgeModels.count(*lit) && triangleEdgeModels.count(*lit) && tetrahedronEdgeModels.count(*lit)), "UNEXPECTED");
-    if (nodeModels.count(*lit))
+    for (const std::string &name : it->second)
     {
-      NodeModelPtr nmp = nodeModels[*lit];
-      if ((nmp->IsUpToDate()))
+      if (auto nit = nodeModels.find(name); nit != nodeModels.end())
       {
-        nmp->MarkOld();
-//        This is what MarkOld does
-//        this->SignalCallbacks(*lit);
+        if (nit->second->IsUpToDate())
+        {
+          nit->second->MarkOld();
+        }
       }
-    }
-    else if (edgeModels.count(*lit))
-    {
-      EdgeModelPtr emp = edgeModels[*lit];
-      if ((emp->IsUpToDate()))
+      else if (auto eit = edgeModels.find(name); eit != edgeModels.end())
       {
-        emp->MarkOld();
-//        This is what MarkOld does
-//        this->SignalCallbacks(*lit);
+        if (eit->second->IsUpToDate())
+        {
+          eit->second->MarkOld();
+        }
       }
-    }
-    else if (triangleEdgeModels.count(*lit))
-    {
-      TriangleEdgeModelPtr temp = triangleEdgeModels[*lit];
-      if ((temp->IsUpToDate()))
+      else if (auto tit = triangleEdgeModels.find(name); tit != triangleEdgeModels.end())
       {
-        temp->MarkOld();
-//        This is what MarkOld does
-//        this->SignalCallbacks(*lit);
+        if (tit->second->IsUpToDate())
+        {
+          tit->second->MarkOld();
+        }
       }
-    }
-    else if (tetrahedronEdgeModels.count(*lit))
-    {
-      TetrahedronEdgeModelPtr temp = tetrahedronEdgeModels[*lit];
-      if ((temp->IsUpToDate()))
+      else if (auto hit = tetrahedronEdgeModels.find(name); hit != tetrahedronEdgeModels.end())
       {
-        temp->MarkOld();
-//        This is what MarkOld does
-//        this->SignalCallbacks(*lit);
+        if (hit->second->IsUpToDate())
+        {
+          hit->second->MarkOld();
+        }
       }
     }
   }
@@ -1611,6 +1601,32 @@ void Region::SetModelExprDataCache(ModelExprDataCachePtr<float128> p)
 }
 #endif
 
+template <>
+ModelExprSharedTermsPtr<double> Region::GetModelExprSharedTerms()
+{
+  return modelExprSharedTerms_double;
+}
+
+template <>
+void Region::SetModelExprSharedTerms(ModelExprSharedTermsPtr<double> p)
+{
+  modelExprSharedTerms_double = p;
+}
+
+#ifdef DEVSIM_EXTENDED_PRECISION
+template <>
+ModelExprSharedTermsPtr<float128> Region::GetModelExprSharedTerms()
+{
+  return modelExprSharedTerms_float128;
+}
+
+template <>
+void Region::SetModelExprSharedTerms(ModelExprSharedTermsPtr<float128> p)
+{
+  modelExprSharedTerms_float128 = p;
+}
+#endif
+
 
 ConstEdgePtr Region::FindEdge(ConstNodePtr nh, ConstNodePtr nt) const
 {
@@ -42,6 +42,8 @@ template <typename T> class ObjectCache;
 namespace MEE {
 template <typename DoubleType>
 class ModelExprData;
+template <typename DoubleType>
+class ModelExprSharedTerms;
 }
 
 template <typename DoubleType>
@@ -53,6 +55,9 @@ using WeakModelExprDataCachePtr = std::weak_ptr<ModelExprDataCache<DoubleType> >
 template <typename DoubleType>
 using ModelExprDataCachePtr = std::shared_ptr<ModelExprDataCache<DoubleType> >;
 
+template <typename DoubleType>
+using ModelExprSharedTermsPtr = std::shared_ptr<MEE::ModelExprSharedTerms<DoubleType> >;
+
 class Device;
 typedef Device *DevicePtr;
 typedef const Device *ConstDevicePtr;
@@ -280,6 +285,18 @@ class Region
       // unregister a model when it is destructed
       void UnregisterCallback(const std::string &);
 
+      //// the models each model depends on
+      const DependencyMap_t &GetDependencyMap() const
+      {
+        return DependencyMap;
+      }
+
+      //// the models depending on each model, which are signalled when it changes
+      const DependencyMap_t &GetReverseDependencyMap() const
+      {
+        return ReverseDependencyMap;
+      }
+
       // note that these can be used to alias the same model with multiple names
       void AddNodeModel(NodeModelPtr);
       void AddEdgeModel(EdgeModelPtr);
@@ -399,6 +416,13 @@ class Region
     template <typename DoubleType>
     void SetModelExprDataCache(ModelExprDataCachePtr<DoubleType>);
 
+    //// unlike the cache, this is kept between assemblies
+    template <typename DoubleType>
+    ModelExprSharedTermsPtr<DoubleType> GetModelExprSharedTerms();
+
+    template <typename DoubleType>
+    void SetModelExprSharedTerms(ModelExprSharedTermsPtr<DoubleType>);
+
     bool UseExtendedPrecisionModels() const;
     bool UseExtendedPrecisionEquations() const;
    private:
@@ -479,6 +503,7 @@ class Region
       TetrahedronEdgeModelList_t tetrahedronEdgeModels;
 
       DependencyMap_t DependencyMap;
+      DependencyMap_t ReverseDependencyMap;
 
       size_t baseeqnnum; // base equation number for this region
       size_t numequations;
@@ -502,6 +527,11 @@ class Region
 #ifdef DEVSIM_EXTENDED_PRECISION
       WeakModelExprDataCachePtr<float128> modelExprDataCache_float128;
 #endif
+
+      ModelExprSharedTermsPtr<double> modelExprSharedTerms_double;
+#ifdef DEVSIM_EXTENDED_PRECISION
+      ModelExprSharedTermsPtr<float128> modelExprSharedTerms_float128;
+#endif
 };
 
 #endif
@@ -184,12 +184,190 @@ DoubleType derBernoulli(DoubleType x)
   return ret;
 }
 
+//// Each branch of BernoulliImpl is computed with its argument set to 0 outside the range of
+//// the branch, so that the branches not selected are quick, and do not raise floating point
+//// exceptions.  The division replaces pow(ex1, -1), which may differ in the last bit.
+template <typename DoubleType>
+void BernoulliArray(const DoubleType *x, DoubleType *result, size_t n)
+{
+#if defined(__ANDROID__)
+  for (size_t i = 0; i < n; ++i)
+  {
+    result[i] = Bernoulli<DoubleType>(x[i]);
+  }
+#else
+  static const auto pleps = GetLogEpsilon<DoubleType>();
+  const DoubleType zero = 0.0;
+  const DoubleType one  = 1.0;
+
+  for (size_t i = 0; i < n; ++i)
+  {
+    const DoubleType xi = x[i];
+    const DoubleType fx = fabs(xi);
+    const bool in_range = fx < pleps;
+
+    const DoubleType xs  = in_range ? xi : zero;
+    const DoubleType ex1 = expm1(xs);
+    const DoubleType small = (xs != ex1) ? (xs / ex1) : (one / (one + 0.5 * xs));
+
+    //// x * exp(-x) when positive, -x when negative
+    const DoubleType emfx  = exp(in_range ? zero : -fx);
+    const DoubleType large = (xi > 0.0) ? (xi * emfx) : -xi;
+
+    result[i] = in_range ? small : large;
+  }
+#endif
+}
+
+template <typename DoubleType>
+void derBernoulliArray(const DoubleType *x, DoubleType *result, size_t n)
+{
+#if defined(__ANDROID__)
+  for (size_t i = 0; i < n; ++i)
+  {
+    result[i] = derBernoulli<DoubleType>(x[i]);
+  }
+#else
+  static const auto pleps = GetLogEpsilon<DoubleType>();
+  const DoubleType zero = 0.0;
+  const DoubleType one  = 1.0;
+
+  for (size_t i = 0; i < n; ++i)
+  {
+    const DoubleType xi = x[i];
+    const DoubleType fx = fabs(xi);
+    const bool in_range = fx < pleps;
+
+    const DoubleType xs  = in_range ? xi : zero;
+    //// exp(x) in range, and exp(-|x|) otherwise
+    const DoubleType ex  = exp(in_range ? xi : -fx);
+    const DoubleType ex1 = expm1(xs);
+    const DoubleType ex2 = ex1 - (xs * ex);
+    const DoubleType num = static_cast<DoubleType>(-0.5) - xs / static_cast<DoubleType>(3.);
+    const DoubleType small = (xs != ex1) ? (ex2 / (ex1 * ex1)) : (num / (one + xs));
+
+    //// exp(-x) * (1 - x) when positive, -1 - x * exp(x) when negative
+    const DoubleType large = (xi > 0.0) ? (ex * (one - xi)) : (-one - xi * ex);
+
+    result[i] = in_range ? small : large;
+  }
+#endif
+}
+
 template double Bernoulli<double>(double);
 template double derBernoulli<double>(double);
+template void BernoulliArray<double>(const double *, double *, size_t);
+template void derBernoulliArray<double>(const double *, double *, size_t);
 #ifdef DEVSIM_EXTENDED_PRECISION
 #include "Float128.hh"
 template float128 Bernoulli<float128>(float128);
 template float128 derBernoulli<float128>(float128);
+template void BernoulliArray<float128>(const float128 *, float128 *, size_t);
+template void derBernoulliArray<float128>(const float128 *, float128 *, size_t);
+#endif
+
+#ifdef DEVSIM_UNIT_TEST
+#include <iostream>
+#include <iomanip>
+#include <vector>
+#include <chrono>
+#include <algorithm>
+
+//// the largest difference from the scalar functions, in units of epsilon
+template <typename T>
+T max_error(const std::vector<T> &x, T (*scalar)(T), void (*array)(const T *, T *, size_t))
+{
+  std::vector<T> result(x.size());
+  array(x.data(), result.data(), x.size());
+
+  T ret = 0.0;
+  for (size_t i = 0; i < x.size(); ++i)
+  {
+    const T expected = scalar(x[i]);
+    const T scale    = std::max<T>(fabs(expected), std::numeric_limits<T>::min());
+    ret = std::max<T>(ret, fabs(result[i] - expected) / scale);
+  }
+  return ret / std::numeric_limits<T>::epsilon();
+}
+
+template <typename T>
+double benchmark_scalar(const std::vector<T> &x, T (*scalar)(T), size_t repeat)
+{
+  std::vector<T> result(x.size());
+  const auto tic = std::chrono::steady_clock::now();
+  for (size_t r = 0; r < repeat; ++r)
+  {
+    for (size_t i = 0; i < x.size(); ++i)
+    {
+      result[i] = scalar(x[i]);
+    }
+  }
+  return std::chrono::duration<double>(std::chrono::steady_clock::now() - tic).count();
+}
+
+template <typename T>
+double benchmark_array(const std::vector<T> &x, void (*array)(const T *, T *, size_t), size_t repeat)
+{
+  std::vector<T> result(x.size());
+  const auto tic = std::chrono::steady_clock::now();
+  for (size_t r = 0; r < repeat; ++r)
+  {
+    array(x.data(), result.data(), x.size());
+  }
+  return std::chrono::duration<double>(std::chrono::steady_clock::now() - tic).count();
+}
+
+//// the arguments cover each branch, and the breakpoints between them
+template <typename T>
+std::vector<T> test_arguments()
+{
+  std::vector<T> x;
+  x.push_back(0.0);
+  for (T v = 1e-20; v < 1000.0; v *= 1.01)
+  {
+    x.push_back(v);
+    x.push_back(-v);
+  }
+  const T pleps = GetLogEpsilon<T>();
+  for (int i = -4; i <= 4; ++i)
+  {
+    const T v = pleps + i * pleps * std::numeric_limits<T>::epsilon();
+    x.push_back(v);
+    x.push_back(-v);
+  }
+  return x;
+}
+
+template <typename T>
+bool unit(size_t repeat)
+{
+  const std::vector<T> x = test_arguments<T>();
+  const T e0 = max_error<T>(x, Bernoulli<T>, BernoulliArray<T>);
+  const T e1 = max_error<T>(x, derBernoulli<T>, derBernoulliArray<T>);
+  std::cout << std::setprecision(4);
+  std::cout << "B    maximum error " << e0 << " epsilon\n";
+  std::cout << "dBdx maximum error " << e1 << " epsilon\n";
+
+  std::vector<T> bx(1000);
+  for (size_t i = 0; i < bx.size(); ++i)
+  {
+    bx[i] = -50.0 + 0.1 * i;
+  }
+  std::cout << "B    scalar " << benchmark_scalar<T>(bx, Bernoulli<T>, repeat) << " s array " << benchmark_array<T>(bx, BernoulliArray<T>, repeat) << " s\n";
+  std::cout << "dBdx scalar " << benchmark_scalar<T>(bx, derBernoulli<T>, repeat) << " s array " << benchmark_array<T>(bx, derBernoulliArray<T>, repeat) << " s\n";
+
+  return (e0 <= 4.0) && (e1 <= 4.0);
+}
+
+int main()
+{
+  bool ok = unit<double>(10000);
+#ifdef DEVSIM_EXTENDED_PRECISION
+  ok = unit<float128>(10) && ok;
+#endif
+  std::cout << (ok ? "PASS" : "FAIL") << "\n";
+  return ok ? 0 : 1;
+}
 #endif
 
 
@@ -7,8 +7,16 @@ SPDX-License-Identifier: Apache-2.0
 
 #ifndef BERNOULLI_HH
 #define BERNOULLI_HH
+#include <cstddef>
 template <typename DoubleType>
 DoubleType Bernoulli(DoubleType x);
 template <typename DoubleType>
 DoubleType derBernoulli(DoubleType x);
+
+//// Evaluate n entries, choosing the range of each argument without branches,
+//// so that the loop may be vectorized
+template <typename DoubleType>
+void BernoulliArray(const DoubleType *x, DoubleType *result, size_t n);
+template <typename DoubleType>
+void derBernoulliArray(const DoubleType *x, DoubleType *result, size_t n);
 #endif
@@ -29,6 +29,7 @@ eprint = { https://doi.org/10.1063/1.89697 }
 #include <cmath>
 using std::abs;
 #include <cstdlib>
+#include <vector>
 namespace
 {
 // TODO: "These coefficients only worked out for amd64 in current configuration"
@@ -198,20 +199,109 @@ T dFermidx(T Eta)
     return 1.0/dInvFermidx(Fermi(Eta));
 }
 
+//// Both approximations are computed, with the argument of the one not selected set to the
+//// breakpoint, so that it does not raise floating point exceptions
+template <typename T>
+void InvFermiArray(const T *r, T *result, size_t n)
+{
+    const T bp = breakpoint;
+    for (size_t i = 0; i < n; ++i)
+    {
+        const T x = r[i];
+        const bool below = x < bp;
+        const T joyce     = Joyce(below ? x : bp);
+        const T expansion = Expansion(below ? bp : x);
+        result[i] = below ? joyce : expansion;
+    }
+}
+
+template <typename T>
+void dInvFermidxArray(const T *r, T *result, size_t n)
+{
+    const T bp = breakpoint;
+    for (size_t i = 0; i < n; ++i)
+    {
+        const T x = r[i];
+        const bool below = x < bp;
+        const T joyce     = dJoycedx(below ? x : bp);
+        const T expansion = dExpansiondx(below ? bp : x);
+        result[i] = below ? joyce : expansion;
+    }
+}
+
+//// The same Newton iteration as Fermi for every entry, and an entry is no longer updated
+//// once it has converged, so the results are the same
+template <typename T>
+void FermiArray(const T *Eta, T *result, size_t n)
+{
+    std::vector<T> f(n);
+    std::vector<T> fp(n);
+    std::vector<char> active(n, 1);
+
+    for (size_t i = 0; i < n; ++i)
+    {
+        result[i] = exp(Eta[i]);
+    }
+
+    bool any_active = (n != 0);
+    for (size_t iteration = 0; any_active && (iteration < 20); ++iteration)
+    {
+        InvFermiArray(result, f.data(), n);
+        dInvFermidxArray(result, fp.data(), n);
+
+        any_active = false;
+        for (size_t i = 0; i < n; ++i)
+        {
+            const T r = result[i];
+            T upd = -(f[i] - Eta[i]) / fp[i];
+            while ((upd + r) <= 0.0)
+            {
+                upd *= 0.5;
+            }
+            const T rnew = r + upd;
+            const T rerr = abs(upd)/(abs(rnew)+good_relerror<T>());
+            result[i] = active[i] ? rnew : r;
+            active[i] = active[i] && (rerr > good_relerror<T>());
+            any_active = any_active || active[i];
+        }
+    }
+}
+
+template <typename T>
+void dFermidxArray(const T *Eta, T *result, size_t n)
+{
+    FermiArray(Eta, result, n);
+    dInvFermidxArray(result, result, n);
+    for (size_t i = 0; i < n; ++i)
+    {
+        result[i] = 1.0 / result[i];
+    }
+}
+
 template double InvFermi<double>(double);
 template double dInvFermidx<double>(double);
 template double Fermi<double>(double);
 template double dFermidx<double>(double);
+template void InvFermiArray<double>(const double *, double *, size_t);
+template void dInvFermidxArray<double>(const double *, double *, size_t);
+template void FermiArray<double>(const double *, double *, size_t);
+template void dFermidxArray<double>(const double *, double *, size_t);
 #ifdef DEVSIM_EXTENDED_PRECISION
 template float128 InvFermi<float128>(float128);
 template float128 dInvFermidx<float128>(float128);
 template float128 Fermi<float128>(float128);
 template float128 dFermidx<float128>(float128);
+template void InvFermiArray<float128>(const float128 *, float128 *, size_t);
+template void dInvFermidxArray<float128>(const float128 *, float128 *, size_t);
+template void FermiArray<float128>(const float128 *, float128 *, size_t);
+template void dFermidxArray<float128>(const float128 *, float128 *, size_t);
 #endif
 
 #ifdef DEVSIM_UNIT_TEST
 #include <iostream>
 #include <iomanip>
+#include <chrono>
+#include <algorithm>
 template <typename T>
 T pdiff(T x1, T x2)
 {
@@ -238,12 +328,87 @@ void unit()
     }
 }
 
+//// the largest relative difference from the scalar functions
+template <typename T>
+T max_error(const std::vector<T> &x, T (*scalar)(T), void (*array)(const T *, T *, size_t))
+{
+    std::vector<T> result(x.size());
+    array(x.data(), result.data(), x.size());
+
+    T ret = 0.0;
+    for (size_t i = 0; i < x.size(); ++i)
+    {
+        const T expected = scalar(x[i]);
+        ret = std::max<T>(ret, abs(result[i] - expected) / abs(expected));
+    }
+    return ret;
+}
+
+template <typename T>
+void benchmark(const char *name, const std::vector<T> &x, T (*scalar)(T), void (*array)(const T *, T *, size_t), size_t repeat)
+{
+    std::vector<T> result(x.size());
+    auto tic = std::chrono::steady_clock::now();
+    for (size_t r = 0; r < repeat; ++r)
+    {
+        for (size_t i = 0; i < x.size(); ++i)
+        {
+            result[i] = scalar(x[i]);
+        }
+    }
+    const double scalar_time = std::chrono::duration<double>(std::chrono::steady_clock::now() - tic).count();
+
+    tic = std::chrono::steady_clock::now();
+    for (size_t r = 0; r < repeat; ++r)
+    {
+        array(x.data(), result.data(), x.size());
+    }
+    const double array_time = std::chrono::duration<double>(std::chrono::steady_clock::now() - tic).count();
+
+    std::cout << name << " scalar " << scalar_time << " s array " << array_time << " s\n";
+}
+
+template <typename T>
+bool unit_array(size_t repeat)
+{
+    std::vector<T> r;
+    std::vector<T> eta;
+    for (size_t i = 0; i <= 2000; ++i)
+    {
+        r.push_back(1.0e-3 + 0.01 * i);
+        eta.push_back(-20.0 + 0.02 * i);
+    }
+    r.push_back(breakpoint);
+
+    const T e0 = max_error<T>(r, InvFermi<T>, InvFermiArray<T>);
+    const T e1 = max_error<T>(r, dInvFermidx<T>, dInvFermidxArray<T>);
+    const T e2 = max_error<T>(eta, Fermi<T>, FermiArray<T>);
+    const T e3 = max_error<T>(eta, dFermidx<T>, dFermidxArray<T>);
+    std::cout << std::setprecision(4);
+    std::cout << "InvFermi    maximum error " << e0 << "\n";
+    std::cout << "dInvFermidx maximum error " << e1 << "\n";
+    std::cout << "Fermi       maximum error " << e2 << "\n";
+    std::cout << "dFermidx    maximum error " << e3 << "\n";
+
+    benchmark<T>("InvFermi   ", r, InvFermi<T>, InvFermiArray<T>, repeat);
+    benchmark<T>("dInvFermidx", r, dInvFermidx<T>, dInvFermidxArray<T>, repeat);
+    benchmark<T>("Fermi      ", eta, Fermi<T>, FermiArray<T>, repeat);
+    benchmark<T>("dFermidx   ", eta, dFermidx<T>, dFermidxArray<T>, repeat);
+
+    //// the same expressions are evaluated for the same arguments
+    return (e0 == 0.0) && (e1 == 0.0) && (e2 == 0.0) && (e3 == 0.0);
+}
+
 int main()
 {
   unit<double>();
+  bool ok = unit_array<double>(1000);
 #ifdef DEVSIM_EXTENDED_PRECISION
   unit<float128>();
+  ok = unit_array<float128>(1) && ok;
 #endif
+  std::cout << (ok ? "PASS" : "FAIL") << "\n";
+  return ok ? 0 : 1;
 }
 #endif
 
@@ -7,6 +7,7 @@ SPDX-License-Identifier: Apache-2.0
 
 #ifndef FERMI_HH
 #define FERMI_HH
+#include <cstddef>
 template <typename T>
 T InvFermi(T /*r*/);
 template <typename T>
@@ -15,4 +16,15 @@ template <typename T>
 T Fermi(T /*n*/);
 template <typename T>
 T dFermidx(T /*n*/);
+
+//// Evaluate n entries, choosing the range of each argument without branches,
+//// so that the loops may be vectorized
+template <typename T>
+void InvFermiArray(const T * /*r*/, T * /*result*/, size_t /*n*/);
+template <typename T>
+void dInvFermidxArray(const T * /*r*/, T * /*result*/, size_t /*n*/);
+template <typename T>
+void FermiArray(const T * /*n*/, T * /*result*/, size_t /*n*/);
+template <typename T>
+void dFermidxArray(const T * /*n*/, T * /*result*/, size_t /*n*/);
 #endif
@@ -17,6 +17,9 @@ using std::abs;
 #ifdef DEVSIM_UNIT_TEST
 #include <iostream>
 #include <iomanip>
+#include <chrono>
+#include <vector>
+#include <algorithm>
 #endif
 
 /*
@@ -146,6 +149,63 @@ T dgfidx(T zeta, T s)
     return dvalue;
 }
 
+namespace {
+//// K is only needed when an argument is below -S
+template <typename T>
+T calcKArray(const T *zeta, const T &s, const T &S, const T &H, size_t n)
+{
+    bool low = false;
+    for (size_t i = 0; i < n; ++i)
+    {
+        low = low || (zeta[i] < -S);
+    }
+    return low ? calcK(s, S, H) : 0.0;
+}
+}
+
+//// Both expressions are computed, with the argument of the one not selected set to -S,
+//// so that it does not raise floating point exceptions
+template <typename T>
+void gfiArray(const T *zeta, T s, T *result, size_t n)
+{
+    const T &sqrt2 = MC<T>::sqrt2;
+    const T S = s * s;
+    const T H = calcH(s, S);
+    const T K = calcKArray(zeta, s, S, H, n);
+
+    for (size_t i = 0; i < n; ++i)
+    {
+        const T z = zeta[i];
+        const bool low = z < -S;
+        const T zl = low ? z : -S;
+        const T zh = low ? -S : z;
+        const T vl = exp(0.5 * S + zl) / (exp(K*(zl+S)) + 1);
+        const T vh = 0.5 * erfc(-zh / (s*sqrt2) * H);
+        result[i] = low ? vl : vh;
+    }
+}
+
+template <typename T>
+void dgfidxArray(const T *zeta, T s, T *result, size_t n)
+{
+    const T &one_div_root_two_pi = MC<T>::one_div_root_two_pi;
+    const T S = s * s;
+    const T H = calcH(s, S);
+    const T K = calcKArray(zeta, s, S, H, n);
+
+    for (size_t i = 0; i < n; ++i)
+    {
+        const T z = zeta[i];
+        const bool low = z < -S;
+        const T zl = low ? z : -S;
+        const T zh = low ? -S : z;
+        const T den_inv = 1. / (exp(K * (S + zl)) + 1.);
+        const T vl = exp(0.5 * S + zl) * den_inv * (1. - K*exp(K * (S+zl)) * den_inv);
+        const T vh = one_div_root_two_pi * H / s * exp(-0.5 * pow(H*zh,2)/S);
+        result[i] = low ? vl : vh;
+    }
+}
+
 //### inverse function for Gaussian Fermi Integral
 
 namespace {
@@ -240,12 +300,16 @@ template double gfi<double>(double, double);
 template double dgfidx<double>(double, double);
 template double igfi<double>(double, double);
 template double digfidx<double>(double, double);
+template void gfiArray<double>(const double *, double, double *, size_t);
+template void dgfidxArray<double>(const double *, double, double *, size_t);
 
 #ifdef DEVSIM_EXTENDED_PRECISION
 template float128 gfi<float128>(float128, float128);
 template float128 dgfidx<float128>(float128, float128);
 template float128 igfi<float128>(float128, float128);
 template float128 digfidx<float128>(float128, float128);
+template void gfiArray<float128>(const float128 *, float128, float128 *, size_t);
+template void dgfidxArray<float128>(const float128 *, float128, float128 *, size_t);
 #endif
 
 #ifdef DEVSIM_UNIT_TEST
@@ -298,11 +362,86 @@ void unit()
 #endif
 }
 
+//// the largest relative difference from the scalar functions
+template <typename T>
+T max_error(const std::vector<T> &zeta, T s, T (*scalar)(T, T), void (*array)(const T *, T, T *, size_t))
+{
+    std::vector<T> result(zeta.size());
+    array(zeta.data(), s, result.data(), zeta.size());
+
+    T ret = 0.0;
+    for (size_t i = 0; i < zeta.size(); ++i)
+    {
+        const T expected = scalar(zeta[i], s);
+        ret = std::max<T>(ret, abs(result[i] - expected) / abs(expected));
+    }
+    return ret;
+}
+
+template <typename T>
+void benchmark(const char *name, const std::vector<T> &zeta, T s, T (*scalar)(T, T), void (*array)(const T *, T, T *, size_t), size_t repeat)
+{
+    std::vector<T> result(zeta.size());
+    auto tic = std::chrono::steady_clock::now();
+    for (size_t r = 0; r < repeat; ++r)
+    {
+        for (size_t i = 0; i < zeta.size(); ++i)
+        {
+            result[i] = scalar(zeta[i], s);
+        }
+    }
+    const double scalar_time = std::chrono::duration<double>(std::chrono::steady_clock::now() - tic).count();
+
+    tic = std::chrono::steady_clock::now();
+    for (size_t r = 0; r < repeat; ++r)
+    {
+        array(zeta.data(), s, result.data(), zeta.size());
+    }
+    const double array_time = std::chrono::duration<double>(std::chrono::steady_clock::now() - tic).count();
+
+    std::cout << name << " scalar " << scalar_time << " s array " << array_time << " s\n";
+}
+
+template <typename T>
+bool unit_array(size_t repeat)
+{
+  bool ok = true;
+  for (size_t j = 2; j <= 8; j += 2)
+  {
+    const T s = static_cast<T>(j);
+    std::vector<T> zeta;
+    for (size_t i = 0; i <= 2000; ++i)
+    {
+      zeta.push_back(-70.0 + 0.035 * i);
+    }
+    zeta.push_back(-s * s);
+
+    const T e0 = max_error<T>(zeta, s, gfi<T>, gfiArray<T>);
+    const T e1 = max_error<T>(zeta, s, dgfidx<T>, dgfidxArray<T>);
+    std::cout << "s " << s << " gfi maximum error " << e0 << " dgfidx maximum error " << e1 << "\n";
+    //// the same expressions are evaluated for the same arguments
+    ok = ok && (e0 == 0.0) && (e1 == 0.0);
+  }
+
+  std::vector<T> zeta;
+  for (size_t i = 0; i <= 2000; ++i)
+  {
+    zeta.push_back(-70.0 + 0.035 * i);
+  }
+  benchmark<T>("gfi   ", zeta, 4.0, gfi<T>, gfiArray<T>, repeat);
+  benchmark<T>("dgfidx", zeta, 4.0, dgfidx<T>, dgfidxArray<T>, repeat);
+  return ok;
+}
+
 int main()
 {
   unit<double>();
+  bool ok = unit_array<double>(1000);
 #ifdef DEVSIM_EXTENDED_PRECISION
   unit<float128>();
+  ok = unit_array<float128>(1) && ok;
 #endif
+  std::cout << (ok ? "PASS" : "FAIL") << "\n";
+  return ok ? 0 : 1;
 }
 #endif
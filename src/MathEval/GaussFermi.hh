@@ -6,6 +6,7 @@ SPDX-License-Identifier: Apache-2.0
 ***/
 #ifndef GAUSS_FERMI_HH
 #define GAUSS_FERMI_HH
+#include <cstddef>
 template <typename T>
 T gfi(T zeta, T s);
 
@@ -17,4 +18,12 @@ T igfi(T g, T s);
 
 template <typename T>
 T digfidx(T g, T s);
+
+//// Evaluate n entries with the same s, choosing the range of each argument without branches,
+//// so that the loops may be vectorized
+template <typename T>
+void gfiArray(const T *zeta, T s, T *result, size_t n);
+
+template <typename T>
+void dgfidxArray(const T *zeta, T s, T *result, size_t n);
 #endif
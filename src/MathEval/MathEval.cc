@@ -50,11 +50,14 @@ namespace Eqomfp {
       const char *desc;
   };
 
+  //// array_func is only set where the DEVSIM_UNIT_TEST benchmark of the kernel is faster
+  //// than the scalar loop.  B, gfi, and dgfidx are not.
   template <typename T>
   struct BinaryTblEntry {
       const char *name;
       binaryfuncptr<T> func;
       const char *desc;
+      binaryarrayfuncptr<T> array_func;
   };
 
   template <typename T>
@@ -62,6 +65,7 @@ namespace Eqomfp {
       const char *name;
       unaryfuncptr<T> func;
       const char *desc;
+      unaryarrayfuncptr<T> array_func;
   };
 
 
@@ -116,7 +120,7 @@ using ::derfc_invdx;
   {"exp",       eval64::exp,  "exp(obj)   -- Exponentiation with respect to e"},
   {"log",       eval64::log,  "log(obj)   -- Natural logarithm"},
   {"B",         Bernoulli,    "B(obj)     -- Bernoulli Function"},
-  {"dBdx",      derBernoulli, "dBdx(obj)  -- derivative Bernoulli wrt arg"},
+  {"dBdx",      derBernoulli, "dBdx(obj)  -- derivative Bernoulli wrt arg", derBernoulliArray},
   {"step",      step,         "step(obj)  -- step function"},
   {"sgn",       sgn,          "sgn(obj)   -- sign function"},
   {"acosh",     acosh,        "acosh(obj)   -- inverse hyperbolic cosine function"},
@@ -133,10 +137,10 @@ using ::derfc_invdx;
   {"derfcdx",   eval64::derfcdx,      "derfcdx(obj)  -- derivative of complementary error function"},
   {"derf_invdx",    eval64::derf_invdx,       "derf_invdx(obj)   -- derivative of inverse error function"},
   {"derfc_invdx",   eval64::derfc_invdx,      "derfc_invdx(obj)  -- derivative of inverse complementary error function"},
-  {"Fermi",     Fermi,        "Fermi(obj)  -- Fermi Integral"},
-  {"dFermidx",  dFermidx,     "dFermidx(obj)  -- derivative of Fermi Integral"},
-  {"InvFermi",     InvFermi,        "InvFermi(obj)  -- inverse of the Fermi Integral"},
-  {"dInvFermidx",  dInvFermidx,     "dInvFermidx(obj)  -- derivative of InvFermi Integral"},
+  {"Fermi",     Fermi,        "Fermi(obj)  -- Fermi Integral", FermiArray},
+  {"dFermidx",  dFermidx,     "dFermidx(obj)  -- derivative of Fermi Integral", dFermidxArray},
+  {"InvFermi",     InvFermi,        "InvFermi(obj)  -- inverse of the Fermi Integral", InvFermiArray},
+  {"dInvFermidx",  dInvFermidx,     "dInvFermidx(obj)  -- derivative of InvFermi Integral", dInvFermidxArray},
   {"!",  logical_not,     "!obj  -- Logical Not"},
   {"vec_sum",   vec_sum, "Vector Summation"},
   {"vec_max",   vec_max, "Vector Maximum"},
@@ -263,7 +267,7 @@ using ::derfc_invdx;
   {"exp",      eval128::exp,          "exp(obj)   -- Exponentiation with respect to e"},
   {"log",      eval128::log,          "log(obj)   -- Natural logarithm"},
   {"B",        Bernoulli,    "B(obj)     -- Bernoulli Function"},
-  {"dBdx",     derBernoulli, "dBdx(obj)  -- derivative Bernoulli wrt arg"},
+  {"dBdx",     derBernoulli, "dBdx(obj)  -- derivative Bernoulli wrt arg", derBernoulliArray},
   {"step",     step,         "step(obj)  -- step function"},
   {"sgn",      sgn,          "sgn(obj)   -- sign function"},
   {"acosh",    eval128::acosh,        "acosh(obj)   -- inverse hyperbolic cosine function"},
@@ -280,10 +284,10 @@ using ::derfc_invdx;
   {"derfcdx",  eval128::derfcdx,      "derfcdx(obj)  -- derivative of complementary error function"},
   {"derf_invdx",   eval128::derf_invdx,       "derfdx(obj)   -- derivative of inverse error function"},
   {"derfc_invdx",  eval128::derfc_invdx,      "derfcdx(obj)  -- derivative of inverse complementary error function"},
-  {"Fermi",    Fermi,        "Fermi(obj)  -- Fermi Integral"},
-  {"dFermidx", dFermidx,     "dFermidx(obj)  -- derivative of Fermi Integral"},
-  {"InvFermi",     InvFermi,        "InvFermi(obj)  -- inverse of the Fermi Integral"},
-  {"dInvFermidx",  dInvFermidx,     "dInvFermidx(obj)  -- derivative of InvFermi Integral"},
+  {"Fermi",    Fermi,        "Fermi(obj)  -- Fermi Integral", FermiArray},
+  {"dFermidx", dFermidx,     "dFermidx(obj)  -- derivative of Fermi Integral", dFermidxArray},
+  {"InvFermi",     InvFermi,        "InvFermi(obj)  -- inverse of the Fermi Integral", InvFermiArray},
+  {"dInvFermidx",  dInvFermidx,     "dInvFermidx(obj)  -- derivative of InvFermi Integral", dInvFermidxArray},
   {"!",  logical_not,     "!obj  -- Logical Not"},
   {"vec_sum",   vec_sum, "Vector Summation"},
   {"vec_max",   vec_max, "Vector Maximum"},
@@ -411,13 +415,15 @@ void MathEval<DoubleType>::InitializeBuiltInMathFunc()
   {
     const std::string &name   = Eqomfp::Tables::GetUnaryTable<DoubleType>(i).name;
     Eqomfp::unaryfuncptr<DoubleType> func = Eqomfp::Tables::GetUnaryTable<DoubleType>(i).func;
-    FuncPtrMap_[name]       = Eqomfp::MathWrapperPtr<DoubleType>(new Eqomfp::MathWrapper1<DoubleType>(name, func));
+    Eqomfp::unaryarrayfuncptr<DoubleType> array_func = Eqomfp::Tables::GetUnaryTable<DoubleType>(i).array_func;
+    FuncPtrMap_[name]       = Eqomfp::MathWrapperPtr<DoubleType>(new Eqomfp::MathWrapper1<DoubleType>(name, func, array_func));
   }
   for (size_t i = 0; Eqomfp::Tables::GetBinaryTable<DoubleType>(i).name != nullptr; ++i)
   {
     const std::string &name   = Eqomfp::Tables::GetBinaryTable<DoubleType>(i).name;
     Eqomfp::binaryfuncptr<DoubleType> func = Eqomfp::Tables::GetBinaryTable<DoubleType>(i).func;
-    FuncPtrMap_[name]       = Eqomfp::MathWrapperPtr<DoubleType>(new Eqomfp::MathWrapper2<DoubleType>(name, func));
+    Eqomfp::binaryarrayfuncptr<DoubleType> array_func = Eqomfp::Tables::GetBinaryTable<DoubleType>(i).array_func;
+    FuncPtrMap_[name]       = Eqomfp::MathWrapperPtr<DoubleType>(new Eqomfp::MathWrapper2<DoubleType>(name, func, array_func));
   }
   for (size_t i = 0; Eqomfp::Tables::GetTernaryTable<DoubleType>(i).name != nullptr; ++i)
   {
@@ -579,6 +585,21 @@ void MathEval<DoubleType>::EvaluateMathFunc(const std::string &func, std::vector
   }
 }
 
+template <typename DoubleType>
+const Eqomfp::MathWrapper<DoubleType> *MathEval<DoubleType>::GetMathWrapper(const std::string &func) const
+{
+  const Eqomfp::MathWrapper<DoubleType> *ret = nullptr;
+  if (!tclMathFuncMap_.count(func))
+  {
+    typename std::map<std::string, Eqomfp::MathWrapperPtr<DoubleType>>::const_iterator it = FuncPtrMap_.find(func);
+    if (it != FuncPtrMap_.end())
+    {
+      ret = (it->second).get();
+    }
+  }
+  return ret;
+}
+
 template <typename DoubleType>
 bool MathEval<DoubleType>::AddTclMath(const std::string &funcname, ObjectHolder procedure, size_t numargs, std::string &error)
 {
@@ -27,6 +27,9 @@ class MathEval {
 
     void   EvaluateTclMathFunc(const std::string &, std::vector<DoubleType> &, const std::vector<const std::vector<DoubleType> *> &, std::string &, std::vector<DoubleType> &) const;
 
+    //// Returns nullptr when the function is not built in, or is replaced by a python function
+    const Eqomfp::MathWrapper<DoubleType> *GetMathWrapper(const std::string &) const;
+
     static MathEval &GetInstance();
     static void DestroyInstance();
 
@@ -8,7 +8,7 @@ SPDX-License-Identifier: Apache-2.0
 #include "MathPacket.hh"
 #include "MathWrapper.hh"
 #include "GetNumberOfThreads.hh"
-#include <future>
+#include "ThreadPool.hh"
 #include <memory>
 
 #ifdef DEVSIM_EXTENDED_PRECISION
@@ -55,14 +55,14 @@ void MathPacket<DoubleType>::join(const MathPacket &omp)
 template <typename DoubleType>
 void MathPacket<DoubleType>::operator()(size_t vbeg, size_t vend)
 {
-  fpeFlag_ = FPECheck::getClearedFlag();
   ///// This should not be called in the main thread!!!!!
   ///// otherwise preexisting exceptions would not be processed
   ///// This can be asserted since we already know the main thread id on application startup
   FPECheck::ClearFPE();
   wrapperClass_.Evaluate(dvals_, vvals_, errorString_, result_, vbeg, vend);
-  fpeFlag_       = FPECheck::getFPEFlags();
-  num_processed_ = vend - vbeg;
+  //// a worker may process several chunks with the same packet
+  fpeFlag_        = FPECheck::combineFPEFlags(fpeFlag_, FPECheck::getFPEFlags());
+  num_processed_ += vend - vbeg;
 }
 
 
@@ -78,33 +78,15 @@ std::string MathPacketRun(const MathWrapper<DoubleType> &func, const std::vector
   {
     Eqomfp::MathPacket<DoubleType> MyPacket(func, dvals, vvals, result);
 
-    std::vector<std::shared_ptr<Eqomfp::MathPacket<DoubleType>>> packets;
-    std::vector<std::future<void>> futures;
-
-    const size_t step = vlen / num_threads;
-    size_t b = 0;
-    size_t e = (step == 0) ? vlen : step;
-    while (b < e)
+    //// one packet for each worker, to collect its floating point exceptions
+    std::vector<std::unique_ptr<Eqomfp::MathPacket<DoubleType>>> packets;
+    for (size_t i = 0; i < num_threads; ++i)
     {
-      auto packet = std::shared_ptr<Eqomfp::MathPacket<DoubleType>>(new MathPacket<DoubleType>(func, dvals, vvals, result));
-      packets.push_back(packet);
-      futures.push_back(std::async(std::launch::async, MathPacketRange<DoubleType>(*packet, b, e)));
-
-      b = e;
-      e += step;
-      //// If we have 2 threads, take odd off so don't need additional queue member
-      //// or just use a magic number
-      if (e > (vlen - 2))
-      {
-        e = vlen;
-      }
+      packets.emplace_back(new MathPacket<DoubleType>(func, dvals, vvals, result));
     }
 
-    // process the futures
-    for (auto &p : futures)
-    {
-      p.get();
-    }
+    ThreadInfo::ThreadPool::GetInstance().Run(num_threads, vlen, ThreadInfo::GetChunkSize(vlen, num_threads),
+      [&packets](size_t worker, size_t b, size_t e) {(*packets[worker])(b, e);});
 
     // get the results
     for (auto &p : packets)
@@ -128,19 +110,6 @@ std::string MathPacketRun(const MathWrapper<DoubleType> &func, const std::vector
   return errorString;
 }
 
-template <typename DoubleType>
-MathPacketRange<DoubleType>::MathPacketRange(MathPacket<DoubleType> &mp, size_t b, size_t e)
-  : mathPacket_(mp), beg_(b), end_(e)
-{
-}
-
-
-template <typename DoubleType>
-void MathPacketRange<DoubleType>::operator()()
-{
-  mathPacket_(beg_, end_);
-}
-
 template class MathPacket<double>;
 template std::string MathPacketRun(const MathWrapper<double> &, const std::vector<double> &, const std::vector<const std::vector<double> *> &, std::vector<double> &, size_t);
 #ifdef DEVSIM_EXTENDED_PRECISION
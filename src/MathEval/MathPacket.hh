@@ -49,19 +49,5 @@ class MathPacket {
 template <typename DoubleType>
 std::string MathPacketRun(const MathWrapper<DoubleType> &, const std::vector<DoubleType> &, const std::vector<const std::vector<DoubleType> *> &, std::vector<DoubleType> &, size_t);
 
-template <typename DoubleType>
-class MathPacketRange
-{
-  public:
-    MathPacketRange(MathPacket<DoubleType> &, size_t /* beg */, size_t /* end */);
-    void operator()();
-
-    ~MathPacketRange() {}
-  private:
-
-    MathPacket<DoubleType> &mathPacket_;
-    size_t     beg_;
-    size_t     end_;
-};
 }
 #endif
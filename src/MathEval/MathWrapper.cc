@@ -68,6 +68,12 @@ void MathWrapper1<DoubleType>::DerivedEvaluate(const std::vector<DoubleType> &/*
   DoubleType       *vr = &result[vbeg];
   const DoubleType *v0 = &((*vvals[0])[vbeg]);
 
+  if (arrayfuncptr_)
+  {
+    arrayfuncptr_(v0, vr, vend - vbeg);
+    return;
+  }
+
 //    std::transform(vals.begin(), vals.end(), result.begin(), std::ptr_fun(funcptr_));
   for (size_t i = vbeg; i < vend; ++i)
   {
@@ -104,6 +110,12 @@ void MathWrapper2<DoubleType>::DerivedEvaluate(const std::vector<DoubleType> &dv
     const DoubleType dval1 = dvals[1];
     DoubleType       *vr = &result[vbeg];
 
+    if (arrayfuncptr_)
+    {
+      arrayfuncptr_(v0, dval1, vr, vend - vbeg);
+      return;
+    }
+
     for (size_t i = vbeg; i < vend; ++i)
     {
       *(vr++) = funcptr_(*(v0++), dval1);
@@ -26,6 +26,12 @@ template <typename DoubleType>
 using ternaryfuncptr = DoubleType (*)(DoubleType, DoubleType, DoubleType);
 template <typename DoubleType>
 using quaternaryfuncptr = DoubleType (*)(DoubleType, DoubleType, DoubleType, DoubleType);
+//// evaluate all of the entries in one call
+template <typename DoubleType>
+using unaryarrayfuncptr = void (*)(const DoubleType *, DoubleType *, size_t);
+//// the first argument is a vector and the second is a scalar
+template <typename DoubleType>
+using binaryarrayfuncptr = void (*)(const DoubleType *, DoubleType, DoubleType *, size_t);
 
 
 template <typename DoubleType>
@@ -61,7 +67,7 @@ class MathWrapper {
 template <typename DoubleType>
 class MathWrapper1 : public MathWrapper<DoubleType> {
   public:
-    MathWrapper1(const std::string &name, unaryfuncptr<DoubleType> fptr) : MathWrapper<DoubleType>(name, 1), funcptr_(fptr) {};
+    MathWrapper1(const std::string &name, unaryfuncptr<DoubleType> fptr, unaryarrayfuncptr<DoubleType> aptr = nullptr) : MathWrapper<DoubleType>(name, 1), funcptr_(fptr), arrayfuncptr_(aptr) {};
     ~MathWrapper1() {}
 
   protected:
@@ -71,13 +77,14 @@ class MathWrapper1 : public MathWrapper<DoubleType> {
 
   private:
     unaryfuncptr<DoubleType> funcptr_;
+    unaryarrayfuncptr<DoubleType> arrayfuncptr_;
 };
 
 //// 2
 template <typename DoubleType>
 class MathWrapper2 : public MathWrapper<DoubleType> {
   public:
-    MathWrapper2(const std::string &name, binaryfuncptr<DoubleType> fptr) : MathWrapper<DoubleType>(name, 2), funcptr_(fptr) {};
+    MathWrapper2(const std::string &name, binaryfuncptr<DoubleType> fptr, binaryarrayfuncptr<DoubleType> aptr = nullptr) : MathWrapper<DoubleType>(name, 2), funcptr_(fptr), arrayfuncptr_(aptr) {};
     ~MathWrapper2() {}
 
   protected:
@@ -87,6 +94,7 @@ class MathWrapper2 : public MathWrapper<DoubleType> {
 
   private:
     binaryfuncptr<DoubleType> funcptr_;
+    binaryarrayfuncptr<DoubleType> arrayfuncptr_;
 };
 
 //// 3
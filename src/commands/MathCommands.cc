@@ -26,7 +26,9 @@ SPDX-License-Identifier: Apache-2.0
 #include "GlobalData.hh"
 #include "CompressedMatrix.hh"
 #include "TimeData.hh"
+#include "ThreadPool.hh"
 #include <sstream>
+#include <algorithm>
 #include <array>
 #include <type_traits>
 
@@ -45,6 +47,11 @@ solveCmdImpl(CommandHandler &data)
 
   const DoubleType tdelta = data.GetDoubleOption("tdelta");
   const DoubleType gamma  = data.GetDoubleOption("gamma");
+  const DoubleType tstart = data.GetDoubleOption("tstart");
+  const DoubleType tstop  = data.GetDoubleOption("tstop");
+  const std::string &transient_method = data.GetStringOption("transient_method");
+
+  ObjectHolder callback;
 
   const bool convergence_info = data.GetBooleanOption("info");
   ObjectHolderMap_t ohm;
@@ -91,10 +98,58 @@ solveCmdImpl(CommandHandler &data)
       errorString = os.str();
     }
   }
+  else if (type == "transient_adaptive")
+  {
+    if (tdelta <= 0.0)
+    {
+      std::ostringstream os;
+      os << "\"tdelta\" must be positive for type " << type << "\n";
+      errorString += os.str();
+    }
+
+    if (tstop <= tstart)
+    {
+      std::ostringstream os;
+      os << "\"tstop\" must be greater than \"tstart\" for type " << type << "\n";
+      errorString += os.str();
+    }
+
+    if (data.GetDoubleOption("charge_error") <= 0.0)
+    {
+      std::ostringstream os;
+      os << "\"charge_error\" must be positive for type " << type << "\n";
+      errorString += os.str();
+    }
+
+    if ((transient_method != "bdf2") && (transient_method != "tr"))
+    {
+      std::ostringstream os;
+      os << "\"transient_method\" must be \"bdf2\" or \"tr\"\n";
+      errorString += os.str();
+    }
+
+    if (!TimeData<DoubleType>::GetInstance().ExistsQ(TimePoint_t::TM0))
+    {
+      std::ostringstream os;
+      os << "type \"transient_dc\" must be solved before type " << type << "\n";
+      errorString += os.str();
+    }
+
+    if (data.IsSpecified("callback"))
+    {
+      callback = data.GetObjectHolder("callback");
+      if (!callback.IsCallable())
+      {
+        std::ostringstream os;
+        os << "Option \"callback\" is not a function\n";
+        errorString += os.str();
+      }
+    }
+  }
   else
   {
     std::ostringstream os;
-    os << "\"dc\", \"ac\", \"noise\", \"transient_dc\", \"transient_bdf1\", \"transient_tr\", \"transient_bdf2\", are the only valid simulation types\n";
+    os << "\"dc\", \"ac\", \"noise\", \"transient_dc\", \"transient_bdf1\", \"transient_tr\", \"transient_bdf2\", \"transient_adaptive\", are the only valid simulation types\n";
     errorString = os.str();
   }
 
@@ -111,6 +166,9 @@ solveCmdImpl(CommandHandler &data)
   const int maximum_iterations = data.GetIntegerOption("maximum_iterations");
   const int maximum_divergence = data.GetIntegerOption("maximum_divergence");
   const int symbolic_iteration_limit = data.GetIntegerOption("symbolic_iteration_limit");
+  const int jacobian_reuse = data.GetIntegerOption("jacobian_reuse");
+  const DoubleType jacobian_reuse_rate = data.GetDoubleOption("jacobian_reuse_rate");
+  const int line_search_steps = data.GetIntegerOption("line_search_steps");
   const DoubleType frequency = data.GetDoubleOption("frequency");
   const std::string &outputNode = data.GetStringOption("output_node");
 
@@ -122,6 +180,9 @@ solveCmdImpl(CommandHandler &data)
   solver.SetMaxDiv(maximum_divergence);
   solver.SetMaxAbsError(maximum_error);
   solver.SetSymbolicIterationLimit(static_cast<size_t>(symbolic_iteration_limit));
+  solver.SetJacobianReuse(static_cast<size_t>(std::max(jacobian_reuse, 0)));
+  solver.SetJacobianReuseRate(jacobian_reuse_rate);
+  solver.SetLineSearchSteps(static_cast<size_t>(std::max(line_search_steps, 0)));
 
   std::unique_ptr<dsMath::LinearSolver<DoubleType>> linearSolver;
 
@@ -186,6 +247,30 @@ solveCmdImpl(CommandHandler &data)
   {
     res = solver.Solve(*linearSolver, dsMath::TimeMethods::BDF2<DoubleType>(tdelta, gamma), p_ohm);
   }
+  else if (type == "transient_adaptive")
+  {
+    dsMath::TimeMethods::AdaptiveParams<DoubleType> params;
+    params.tstart     = tstart;
+    params.tstop      = tstop;
+    params.tdelta     = tdelta;
+    params.min_tdelta = data.GetDoubleOption("minimum_tdelta");
+    params.max_tdelta = data.GetDoubleOption("maximum_tdelta");
+    params.growth     = data.GetDoubleOption("tdelta_growth");
+    params.shrink     = data.GetDoubleOption("tdelta_shrink");
+    params.use_tr     = (transient_method == "tr");
+
+    ObjectHolderMap_t adaptive_ohm;
+    res = solver.SolveTransientAdaptive(*linearSolver, params, callback, adaptive_ohm);
+    if (p_ohm)
+    {
+      ohm = adaptive_ohm;
+    }
+    else if (res)
+    {
+      data.SetObjectResult(adaptive_ohm["time_points"]);
+      return;
+    }
+  }
 
   if (p_ohm)
   {
@@ -227,17 +312,27 @@ solveCmd(CommandHandler &data)
     {"maximum_iterations", "20", dsGetArgs::optionType::INTEGER, dsGetArgs::requiredType::OPTIONAL},
     {"maximum_divergence", "20", dsGetArgs::optionType::INTEGER, dsGetArgs::requiredType::OPTIONAL},
     {"symbolic_iteration_limit", "1", dsGetArgs::optionType::INTEGER, dsGetArgs::requiredType::OPTIONAL},
+    {"jacobian_reuse", "0", dsGetArgs::optionType::INTEGER, dsGetArgs::requiredType::OPTIONAL},
+    {"jacobian_reuse_rate", "0.5", dsGetArgs::optionType::FLOAT, dsGetArgs::requiredType::OPTIONAL},
+    {"line_search_steps", "0", dsGetArgs::optionType::INTEGER, dsGetArgs::requiredType::OPTIONAL},
     {"frequency",    "0.0", dsGetArgs::optionType::FLOAT, dsGetArgs::requiredType::OPTIONAL},
     {"output_node",  "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL},
     {"solver_type",  "direct", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL},
     {"tdelta",       "0.0", dsGetArgs::optionType::FLOAT, dsGetArgs::requiredType::OPTIONAL},
     {"charge_error", "0.0", dsGetArgs::optionType::FLOAT, dsGetArgs::requiredType::OPTIONAL},
     {"gamma",        "1.0", dsGetArgs::optionType::FLOAT, dsGetArgs::requiredType::OPTIONAL},
+    {"tstart",         "0.0", dsGetArgs::optionType::FLOAT, dsGetArgs::requiredType::OPTIONAL},
+    {"tstop",          "0.0", dsGetArgs::optionType::FLOAT, dsGetArgs::requiredType::OPTIONAL},
+    {"minimum_tdelta", "0.0", dsGetArgs::optionType::FLOAT, dsGetArgs::requiredType::OPTIONAL},
+    {"maximum_tdelta", "0.0", dsGetArgs::optionType::FLOAT, dsGetArgs::requiredType::OPTIONAL},
+    {"tdelta_growth",  "2.0", dsGetArgs::optionType::FLOAT, dsGetArgs::requiredType::OPTIONAL},
+    {"tdelta_shrink",  "0.2", dsGetArgs::optionType::FLOAT, dsGetArgs::requiredType::OPTIONAL},
+    {"transient_method", "bdf2", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL},
+    {"callback",       "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL},
     // empty string converts to bool for python
     {"info", "", dsGetArgs::optionType::BOOLEAN, dsGetArgs::requiredType::OPTIONAL},
     {nullptr,  nullptr, dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL}
   };
-//      {"callback",      "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL},
 
   bool error = data.processOptions(option, errorString);
 
@@ -432,6 +527,47 @@ getContactCurrentCmd(CommandHandler &data)
     return;
 }
 
+void
+getThreadStatisticsCmd(CommandHandler &data)
+{
+  std::string errorString;
+
+  static dsGetArgs::Option option[] =
+  {
+    {"reset", "", dsGetArgs::optionType::BOOLEAN, dsGetArgs::requiredType::OPTIONAL},
+    {nullptr,  nullptr, dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL}
+  };
+
+  bool error = data.processOptions(option, errorString);
+
+  if (error)
+  {
+      data.SetErrorResult(errorString);
+      return;
+  }
+
+  auto &pool = ThreadInfo::ThreadPool::GetInstance();
+  const auto s = pool.GetStatistics();
+
+  if (data.GetBooleanOption("reset"))
+  {
+    pool.ResetStatistics();
+  }
+
+  ObjectHolderMap_t ohm;
+  ohm["threads"]     = ObjectHolder(static_cast<int>(s.threads));
+  ohm["evaluations"] = ObjectHolder(static_cast<int>(s.evaluations));
+  ohm["tasks"]       = ObjectHolder(static_cast<int>(s.tasks));
+  //// may exceed the range of int in long simulations
+  ohm["items"]       = ObjectHolder(static_cast<double>(s.items));
+  ohm["min_chunk"]   = ObjectHolder(static_cast<int>(s.min_chunk));
+  ohm["max_chunk"]   = ObjectHolder(static_cast<int>(s.max_chunk));
+  ohm["busy_time"]   = ObjectHolder(s.busy_time);
+  ohm["idle_time"]   = ObjectHolder(s.idle_time);
+  ohm["wall_time"]   = ObjectHolder(s.wall_time);
+  data.SetObjectResult(ObjectHolder(ohm));
+}
+
 void
 setInitialConditionCmd(CommandHandler &data)
 {
@@ -16,6 +16,7 @@ void getContactCurrentCmd(CommandHandler &);
 void solveCmd(CommandHandler &);
 void getMatrixAndRHSCmd(CommandHandler &);
 void setInitialConditionCmd(CommandHandler &);
+void getThreadStatisticsCmd(CommandHandler &);
 }
 
 #endif
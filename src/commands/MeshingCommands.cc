@@ -17,6 +17,8 @@ SPDX-License-Identifier: Apache-2.0
 #include "DevsimReader.hh"
 #include "DevsimWriter.hh"
 #include "DevsimRestartWriter.hh"
+#include "DevsimBinaryWriter.hh"
+#include "DevsimBinaryReader.hh"
 #include "VTKWriter.hh"
 #include "TecplotWriter.hh"
 #include "dsAssert.hh"
@@ -737,7 +739,15 @@ loadDevicesCmd(CommandHandler &data)
 
     const std::string &fileName = data.GetStringOption("file");
 
-    bool ret = dsDevsimParse::LoadMeshes(fileName, errorString);
+    bool ret = false;
+    if (dsDevsimBinary::IsBinaryFile(fileName))
+    {
+      ret = dsDevsimBinary::LoadMeshes(fileName, errorString);
+    }
+    else
+    {
+      ret = dsDevsimParse::LoadMeshes(fileName, errorString);
+    }
     if (!ret)
     {
       data.SetErrorResult(errorString);
@@ -763,6 +773,7 @@ writeDevicesCmd(CommandHandler &data)
         {"device",   "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL, nullptr},
         {"type",     "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL, nullptr},
         {"include_test",  "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL, nullptr},
+        {"compress", "", dsGetArgs::optionType::BOOLEAN, dsGetArgs::requiredType::OPTIONAL, nullptr},
         {nullptr,  nullptr, dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL, nullptr}
     };
     bool error = data.processOptions(option, errorString);
@@ -806,12 +817,23 @@ writeDevicesCmd(CommandHandler &data)
       include_test = ObjectHolder("");
     }
 
+    if (data.IsSpecified("compress") && (type != "devsim_binary"))
+    {
+        errorString += R"(Option "compress" only supported when "type" is "devsim_binary".)" "\n";
+        data.SetErrorResult(errorString);
+        return;
+    }
+
     std::unique_ptr<MeshWriter> mw;
 
     if (type.empty() || (type == "devsim"))
     {
         mw = std::unique_ptr<MeshWriter>(new DevsimRestartWriter());
     }
+    else if (type == "devsim_binary")
+    {
+        mw = std::unique_ptr<MeshWriter>(new DevsimBinaryWriter(data.GetBooleanOption("compress")));
+    }
     else if (type == "devsim_data")
     {
         mw = std::unique_ptr<MeshWriter>(new DevsimWriter());
@@ -826,7 +848,7 @@ writeDevicesCmd(CommandHandler &data)
     }
     else
     {
-        errorString += "type: " + type + " is not a valid type.  Please select from \"devsim\", \"devsim_data\", \"vtk\", or \"tecplot\".\n";
+        errorString += "type: " + type + " is not a valid type.  Please select from \"devsim\", \"devsim_binary\", \"devsim_data\", \"vtk\", or \"tecplot\".\n";
         data.SetErrorResult(errorString);
         return;
     }
@@ -64,6 +64,8 @@ SPDX-License-Identifier: Apache-2.0
 #include <iomanip>
 #include <utility>
 #include <functional>
+#include <set>
+#include <algorithm>
 
 using namespace dsValidate;
 
@@ -900,6 +902,8 @@ setNodeValuesCmd(CommandHandler &data)
 
     std::vector<double> values;
     ObjectHolder vdata = data.GetObjectHolder("values");
+    //// a buffer of doubles is read in place, anything else is converted
+    DoubleBuffer buffer(vdata);
     if (vdata.IsList())
     {
       if (!initializer.empty())
@@ -908,7 +912,7 @@ setNodeValuesCmd(CommandHandler &data)
         os << "Options \"values\" and \"init_from\" should not be specified at the same time\n";
         errorString += os.str();
       }
-      bool ok = vdata.GetDoubleList(values);
+      bool ok = !buffer.empty() || vdata.GetDoubleList(values);
       if (!ok)
       {
         std::ostringstream os;
@@ -933,6 +937,7 @@ setNodeValuesCmd(CommandHandler &data)
     size_t values_expected = 0;
 
     std::function<void(const std::vector<double> &)> setter;
+    std::function<void(const double *)> buffer_setter;
 #ifdef DEVSIM_EXTENDED_PRECISION
     std::function<void(const std::vector<float128> &)> extended_setter;
     std::vector<float128> extended_values;
@@ -951,6 +956,7 @@ setNodeValuesCmd(CommandHandler &data)
       initializer_exists = static_cast<bool>(nm_initializer);
 
       setter          = [nm_name](const std::vector<double> &v) {nm_name->SetValues(v);};
+      buffer_setter   = [nm_name](const double *v) {nm_name->SetValues(v);};
 #ifdef DEVSIM_EXTENDED_PRECISION
       extended_setter = [nm_name](const std::vector<float128> &v) {nm_name->SetValues(v);};
 #endif
@@ -1061,6 +1067,11 @@ setNodeValuesCmd(CommandHandler &data)
       }
     }
 
+    if (!buffer.empty() && !buffer_setter)
+    {
+      values.assign(buffer.begin(), buffer.end());
+    }
+
     if (!model_exists)
     {
       std::ostringstream os;
@@ -1073,6 +1084,10 @@ setNodeValuesCmd(CommandHandler &data)
       os << "-init_from " << initializer << " does not exist\n";
       errorString += os.str();
     }
+    else if (buffer_setter && (buffer.size() == values_expected) && !buffer.empty())
+    {
+      buffer_setter(buffer.begin());
+    }
     else if (values.size() == values_expected)
     {
       dsAssert(static_cast<bool>(setter), "UNEXPECTED");
@@ -1102,6 +1117,102 @@ setNodeValuesCmd(CommandHandler &data)
     }
 }
 
+void
+setNodeValuesTableCmd(CommandHandler &data)
+{
+    std::string errorString;
+
+    using namespace dsGetArgs;
+    static dsGetArgs::Option option[] =
+    {
+        {"device",   "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, mustBeValidDevice},
+        {"region",   "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, stringCannotBeEmpty},
+        {"names",    "", dsGetArgs::optionType::LIST,   dsGetArgs::requiredType::REQUIRED, nullptr},
+        {"values",   "", dsGetArgs::optionType::LIST,   dsGetArgs::requiredType::REQUIRED, nullptr},
+        {nullptr,  nullptr, dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL}
+    };
+
+    bool error = data.processOptions(option, errorString);
+
+    if (error)
+    {
+        data.SetErrorResult(errorString);
+        return;
+    }
+
+    const std::string &deviceName = data.GetStringOption("device");
+    const std::string &regionName = data.GetStringOption("region");
+
+    Device *dev = nullptr;
+    Region *reg = nullptr;
+
+    errorString = ValidateDeviceAndRegion(deviceName, regionName, dev, reg);
+
+    if (!errorString.empty())
+    {
+        data.SetErrorResult(errorString);
+        return;
+    }
+
+    std::vector<std::string> names;
+    if (!data.GetObjectHolder("names").GetStringList(names) || names.empty())
+    {
+      errorString += "Option \"names\" must be a non empty list of strings\n";
+    }
+
+    //// a buffer of doubles is read in place, anything else is converted
+    ObjectHolder vdata = data.GetObjectHolder("values");
+    DoubleBuffer buffer(vdata);
+    std::vector<double> converted;
+    const double *values = buffer.begin();
+    size_t number_values = buffer.size();
+    if (buffer.empty())
+    {
+      if (!vdata.GetDoubleList(converted))
+      {
+        errorString += "Option \"values\" could not be converted to a list of doubles\n";
+      }
+      values = converted.data();
+      number_values = converted.size();
+    }
+
+    const size_t number_nodes = reg->GetNumberNodes();
+
+    std::vector<NodeModelPtr> models;
+    for (const auto &name : names)
+    {
+      auto nm_name = std::const_pointer_cast<NodeModel, const NodeModel>(reg->GetNodeModel(name));
+      if (!nm_name)
+      {
+        std::ostringstream os;
+        os << "Model " << name << " does not exist\n";
+        errorString += os.str();
+      }
+      models.push_back(nm_name);
+    }
+
+    if (errorString.empty() && (number_values != names.size() * number_nodes))
+    {
+      std::ostringstream os;
+      os << "wrong number of elements, expected " << names.size() << " rows of " << number_nodes << " values\n";
+      errorString += os.str();
+    }
+
+    if (!errorString.empty())
+    {
+      data.SetErrorResult(errorString);
+      return;
+    }
+
+    //// one row for each model, as returned by get_model_values_table
+    for (size_t i = 0; i < models.size(); ++i)
+    {
+      models[i]->SetValues(values + i * number_nodes);
+    }
+
+    data.SetEmptyResult();
+}
+
 void
 setNodeValueCmd(CommandHandler &data)
 {
@@ -1178,7 +1289,7 @@ setNodeValueCmd(CommandHandler &data)
 }
 
 namespace {
-void SetListAsResult(CommandHandler &data, const std::string &type, const std::string &name, const std::vector<double> &vals)
+void SetListAsResult(CommandHandler &data, const std::string &type, const std::string &name, const std::vector<double> &vals, bool as_buffer = false)
 {
 
   if (vals.empty())
@@ -1188,6 +1299,10 @@ void SetListAsResult(CommandHandler &data, const std::string &type, const std::s
     data.SetErrorResult(os.str());
     return;
   }
+  else if (as_buffer)
+  {
+    data.SetObjectResult(CreateDoubleBufferCopy(vals));
+  }
   else
   {
     data.SetObjectResult(CreateDoublePODArray(vals));
@@ -1208,6 +1323,7 @@ printNodeValuesCmd(CommandHandler &data)
       {"device",   "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, mustBeValidDevice},
       {"region",   "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, stringCannotBeEmpty},
       {"name",     "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, stringCannotBeEmpty},
+      {"buffer",   "", dsGetArgs::optionType::BOOLEAN, dsGetArgs::requiredType::OPTIONAL},
       {nullptr,  nullptr, dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL}
   };
 
@@ -1222,6 +1338,7 @@ printNodeValuesCmd(CommandHandler &data)
   const std::string &deviceName = data.GetStringOption("device");
   const std::string &regionName = data.GetStringOption("region");
   const std::string &name = data.GetStringOption("name");
+  const bool as_buffer = data.GetBooleanOption("buffer");
 
   Device *dev = nullptr;
   Region *reg = nullptr;
@@ -1269,7 +1386,7 @@ printNodeValuesCmd(CommandHandler &data)
     {
       const NodeScalarList<double> &nsl = nm_name->GetScalarValues<double>();
 
-      SetListAsResult(data, "Node Model", name, nsl);
+      SetListAsResult(data, "Node Model", name, nsl, as_buffer);
     }
     else if (commandName == "delete_node_model")
     {
@@ -1294,6 +1411,7 @@ printEdgeValuesCmd(CommandHandler &data)
     {"device",   "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, mustBeValidDevice},
     {"region",   "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, stringCannotBeEmpty},
     {"name",     "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, stringCannotBeEmpty},
+    {"buffer",   "", dsGetArgs::optionType::BOOLEAN, dsGetArgs::requiredType::OPTIONAL},
     {nullptr,  nullptr, dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL}
   };
 
@@ -1308,6 +1426,7 @@ printEdgeValuesCmd(CommandHandler &data)
   const std::string &deviceName = data.GetStringOption("device");
   const std::string &regionName = data.GetStringOption("region");
   const std::string &name = data.GetStringOption("name");
+  const bool as_buffer = data.GetBooleanOption("buffer");
 
   Device *dev = nullptr;
   Region *reg = nullptr;
@@ -1352,7 +1471,7 @@ printEdgeValuesCmd(CommandHandler &data)
     else if (commandName == "get_edge_model_values")
     {
       const EdgeScalarList<double> &nsl = nm_name->GetScalarValues<double>();
-      SetListAsResult(data, "Edge Model", name, nsl);
+      SetListAsResult(data, "Edge Model", name, nsl, as_buffer);
     }
     else if (commandName == "delete_edge_model")
     {
@@ -1379,6 +1498,7 @@ printElementEdgeValuesCmd(CommandHandler &data)
     {"device",   "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, mustBeValidDevice},
     {"region",   "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, stringCannotBeEmpty},
     {"name",     "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, stringCannotBeEmpty},
+    {"buffer",   "", dsGetArgs::optionType::BOOLEAN, dsGetArgs::requiredType::OPTIONAL},
     {nullptr,  nullptr, dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL}
   };
 
@@ -1393,6 +1513,7 @@ printElementEdgeValuesCmd(CommandHandler &data)
   const std::string &deviceName = data.GetStringOption("device");
   const std::string &regionName = data.GetStringOption("region");
   const std::string &name = data.GetStringOption("name");
+  const bool as_buffer = data.GetBooleanOption("buffer");
 
   Device *dev = nullptr;
   Region *reg = nullptr;
@@ -1453,7 +1574,7 @@ printElementEdgeValuesCmd(CommandHandler &data)
       {
         const TriangleEdgeScalarList<double> &nsl = triangle_edge_model->GetScalarValues<double>();
 
-        SetListAsResult(data, "Element Edge Model", name, nsl);
+        SetListAsResult(data, "Element Edge Model", name, nsl, as_buffer);
       }
       else if (commandName == "delete_element_model")
       {
@@ -1483,7 +1604,7 @@ printElementEdgeValuesCmd(CommandHandler &data)
       {
         const TetrahedronEdgeScalarList<double> &nsl = tetrahedron_edge_model->GetScalarValues<double>();
 
-        SetListAsResult(data, "Element Edge Model", name, nsl);
+        SetListAsResult(data, "Element Edge Model", name, nsl, as_buffer);
       }
       else if (commandName == "delete_element_model")
       {
@@ -1496,6 +1617,134 @@ printElementEdgeValuesCmd(CommandHandler &data)
   }
 }
 
+void
+getModelValuesTableCmd(CommandHandler &data)
+{
+  std::string errorString;
+
+  using namespace dsGetArgs;
+  static dsGetArgs::Option option[] =
+  {
+    {"device",   "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, mustBeValidDevice},
+    {"region",   "", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::REQUIRED, stringCannotBeEmpty},
+    {"names",    "", dsGetArgs::optionType::LIST,   dsGetArgs::requiredType::REQUIRED, nullptr},
+    {"type",     "node", dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL, nullptr},
+    {nullptr,  nullptr, dsGetArgs::optionType::STRING, dsGetArgs::requiredType::OPTIONAL}
+  };
+
+  bool error = data.processOptions(option, errorString);
+
+  if (error)
+  {
+      data.SetErrorResult(errorString);
+      return;
+  }
+
+  const std::string &deviceName = data.GetStringOption("device");
+  const std::string &regionName = data.GetStringOption("region");
+  const std::string &type = data.GetStringOption("type");
+
+  std::vector<std::string> names;
+  if (!data.GetObjectHolder("names").GetStringList(names) || names.empty())
+  {
+    data.SetErrorResult("Option \"names\" must be a non empty list of strings\n");
+    return;
+  }
+
+  Device *dev = nullptr;
+  Region *reg = nullptr;
+
+  errorString = ValidateDeviceAndRegion(deviceName, regionName, dev, reg);
+
+  if (!errorString.empty())
+  {
+      data.SetErrorResult(errorString);
+      return;
+  }
+
+  const size_t dimension = dev->GetDimension();
+
+  if ((type != "node") && (type != "edge") && (type != "element"))
+  {
+    data.SetErrorResult("Option \"type\" must be \"node\", \"edge\", or \"element\"\n");
+    return;
+  }
+  else if ((type == "element") && (dimension == 1))
+  {
+    data.SetErrorResult("Element models are not available for 1D devices\n");
+    return;
+  }
+
+  //// Each row is copied as soon as it is fetched, since calculating a later
+  //// model may recalculate an earlier one and reallocate its values.
+  ObjectHolder result;
+  double *output = nullptr;
+  size_t columns = 0;
+  for (const auto &name : names)
+  {
+    const std::vector<double> *row = nullptr;
+    if (type == "node")
+    {
+      if (auto m = reg->GetNodeModel(name))
+      {
+        row = &m->GetScalarValues<double>();
+      }
+    }
+    else if (type == "edge")
+    {
+      if (auto m = reg->GetEdgeModel(name))
+      {
+        row = &m->GetScalarValues<double>();
+      }
+    }
+    else if (dimension == 2)
+    {
+      if (auto m = reg->GetTriangleEdgeModel(name))
+      {
+        row = &m->GetScalarValues<double>();
+      }
+    }
+    else if (dimension == 3)
+    {
+      if (auto m = reg->GetTetrahedronEdgeModel(name))
+      {
+        row = &m->GetScalarValues<double>();
+      }
+    }
+
+    if (!row)
+    {
+      std::ostringstream os;
+      os << "Model " << name << " of type " << type << " does not exist\n";
+      errorString += os.str();
+    }
+    else if (row->empty())
+    {
+      std::ostringstream os;
+      os << "Model " << name << " of type " << type << " is empty\n";
+      errorString += os.str();
+    }
+    else
+    {
+      if (result.empty())
+      {
+        columns = row->size();
+        result = CreateDoubleBufferCopy(names.size(), columns, output);
+      }
+      dsAssert(row->size() == columns, "UNEXPECTED");
+      output = std::copy(row->begin(), row->end(), output);
+    }
+  }
+
+  if (!errorString.empty())
+  {
+    data.SetErrorResult(errorString);
+    return;
+  }
+
+  data.SetObjectResult(result);
+}
+
 void
 getInterfaceValuesCmd(CommandHandler &data)
 {
@@ -1632,6 +1881,91 @@ getNodeModelListCmd(CommandHandler &data)
       data.SetStringListResult(GetKeys(nml));
     }
   }
+  else if (commandName == "get_model_dependency_graph")
+  {
+    const Region::DependencyMap_t &dependencies = reg->GetDependencyMap();
+    const Region::DependencyMap_t &dependents   = reg->GetReverseDependencyMap();
+
+    std::set<std::string> names;
+    for (const auto &it : dependencies)
+    {
+      names.insert(it.first);
+      names.insert(it.second.begin(), it.second.end());
+    }
+
+    const auto get_list = [](const Region::DependencyMap_t &dmap, const std::string &name) {
+      ObjectHolderList_t ret;
+      Region::DependencyMap_t::const_iterator it = dmap.find(name);
+      if (it != dmap.end())
+      {
+        for (const std::string &x : it->second)
+        {
+          ret.push_back(ObjectHolder(x));
+        }
+      }
+      return ret;
+    };
+
+    ObjectHolderMap_t graph;
+    for (const std::string &name : names)
+    {
+      //// the models marked old when this one changes
+      std::set<std::string> visited;
+      std::vector<std::string> queue(1, name);
+      while (!queue.empty())
+      {
+        const std::string current = queue.back();
+        queue.pop_back();
+        Region::DependencyMap_t::const_iterator it = dependents.find(current);
+        if (it == dependents.end())
+        {
+          continue;
+        }
+        for (const std::string &x : it->second)
+        {
+          if ((x != name) && visited.insert(x).second)
+          {
+            queue.push_back(x);
+          }
+        }
+      }
+
+      std::string type = "other";
+      bool up_to_date = false;
+      if (ConstNodeModelPtr nm = reg->GetNodeModel(name))
+      {
+        type = "node";
+        up_to_date = nm->IsUpToDate();
+      }
+      else if (ConstEdgeModelPtr em = reg->GetEdgeModel(name))
+      {
+        type = "edge";
+        up_to_date = em->IsUpToDate();
+      }
+      else if (ConstTriangleEdgeModelPtr tm = reg->GetTriangleEdgeModel(name))
+      {
+        type = "element";
+        up_to_date = tm->IsUpToDate();
+      }
+      else if (ConstTetrahedronEdgeModelPtr tm = reg->GetTetrahedronEdgeModel(name))
+      {
+        type = "element";
+        up_to_date = tm->IsUpToDate();
+      }
+
+      ObjectHolderList_t dependency_list = get_list(dependencies, name);
+      ObjectHolderList_t dependent_list  = get_list(dependents, name);
+
+      ObjectHolderMap_t entry;
+      entry["type"]                  = ObjectHolder(type);
+      entry["up_to_date"]            = ObjectHolder(up_to_date);
+      entry["dependencies"]          = ObjectHolder(dependency_list);
+      entry["dependents"]            = ObjectHolder(dependent_list);
+      entry["transitive_dependents"] = ObjectHolder(static_cast<int>(visited.size()));
+      graph[name] = ObjectHolder(entry);
+    }
+    data.SetMapResult(graph);
+  }
 }
 
 void
@@ -24,6 +24,7 @@ void createVectorElementModelCmd(CommandHandler &);
 void debugTriangleCmd(CommandHandler &);
 void getInterfaceModelListCmd(CommandHandler &);
 void getInterfaceValuesCmd(CommandHandler &);
+void getModelValuesTableCmd(CommandHandler &);
 void getNodeModelListCmd(CommandHandler &);
 void printEdgeValuesCmd(CommandHandler &);
 void printElementEdgeValuesCmd(CommandHandler &);
@@ -31,6 +32,7 @@ void printNodeValuesCmd(CommandHandler &);
 void registerFunctionCmd(CommandHandler &);
 void setNodeValueCmd(CommandHandler &);
 void setNodeValuesCmd(CommandHandler &);
+void setNodeValuesTableCmd(CommandHandler &);
 void symdiffCmd(CommandHandler &);
 }
 
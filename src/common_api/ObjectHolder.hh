@@ -85,6 +85,52 @@ class ObjectHolder {
 
 };
 
+//// Read only access to a C contiguous buffer of native doubles, such as a
+//// numpy array, array.array, or memoryview, for as long as this object
+//// exists.  The data are not copied when the buffer protocol is available.
+class DoubleBuffer {
+  public:
+    explicit DoubleBuffer(const ObjectHolder &);
+    ~DoubleBuffer();
+
+    DoubleBuffer(const DoubleBuffer &) = delete;
+    DoubleBuffer &operator=(const DoubleBuffer &) = delete;
+
+    //// true when the object has a buffer, which is empty when the buffer
+    //// is in another format and should be converted element by element
+    bool IsBuffer() const
+    {
+      return is_buffer_;
+    }
+
+    bool empty() const
+    {
+      return size_ == 0;
+    }
+
+    size_t size() const
+    {
+      return size_;
+    }
+
+    const double *begin() const
+    {
+      return data_;
+    }
+
+    const double *end() const
+    {
+      return data_ + size_;
+    }
+
+  private:
+    void         *view_;
+    ObjectHolder  bytes_;
+    const double *data_;
+    size_t        size_;
+    bool          is_buffer_;
+};
+
 template <typename T>
 inline ObjectHolder CreateObjectHolderList(const std::vector<T> &list)
 {
@@ -123,9 +169,19 @@ ObjectHolder CreateDoublePODArray(const std::vector<double>  &list);
 
 ObjectHolder CreateComplexDoublePODArray(const std::vector<std::complex<double>>  &list);
 
+//// read only memoryview of doubles over a single copy of the data, taken when it is created.
+//// It is not a view of the model values, and does not change when they are recalculated.
+ObjectHolder CreateDoubleBufferCopy(const std::vector<double>  &list);
+
+//// two dimensional copy of rows by columns, with output set to the data,
+//// which the caller fills in before returning the memoryview to python
+ObjectHolder CreateDoubleBufferCopy(size_t rows, size_t columns, double *&output);
+
 #ifdef DEVSIM_EXTENDED_PRECISION
 ObjectHolder CreateDoublePODArray(const std::vector<float128> &list);
 
+ObjectHolder CreateDoubleBufferCopy(const std::vector<float128> &list);
+
 ObjectHolder CreateComplexDoublePODArray(const std::vector<complex128> &list);
 #endif
 #endif
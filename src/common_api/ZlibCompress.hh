@@ -10,5 +10,6 @@ SPDX-License-Identifier: Apache-2.0
 #include <vector>
 #include <cstddef>
 bool DEVSIMZlibCompress(std::vector<char> &/*output*/, char * /*input*/, size_t /*input_length*/);
+bool DEVSIMZlibDecompress(std::vector<char> &/*output*/, char * /*input*/, size_t /*input_length*/);
 
 #endif
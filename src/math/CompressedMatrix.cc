@@ -162,9 +162,52 @@ void CompressedMatrix<DoubleType>::CreateMatrix()
     Az_.resize(Ai_.size());
   }
 
+  ClearScatterMaps();
+
   compressed = true;
 }
 
+template <typename DoubleType>
+void CompressedMatrix<DoubleType>::ClearScatterMaps()
+{
+  scatter_real_.clear();
+  scatter_imag_.clear();
+}
+
+//// Returns the slot of entry (r, c) in the compressed matrix, or -1 if it is not in the symbolic pattern
+template <typename DoubleType>
+int CompressedMatrix<DoubleType>::GetScatterSlot(ScatterMap &smap, int r, int c, bool is_zero)
+{
+  size_t &pos = smap.pos;
+  const size_t len = smap.slots.size();
+
+  if ((pos < len) && (smap.entries[pos].first == r) && (smap.entries[pos].second == c))
+  {
+    return smap.slots[pos++];
+  }
+
+  /// zero entries are skipped, so keep the rest of the map
+  if (is_zero && (pos < len))
+  {
+    return -1;
+  }
+
+  const RowInd &ri = Symbolic_[c];
+  RowInd::const_iterator rit = ri.find(r);
+  if (rit == ri.end())
+  {
+    return -1;
+  }
+
+  /// the assembly order changed, so record the entries from here
+  smap.entries.resize(pos);
+  smap.slots.resize(pos);
+  smap.entries.push_back(std::make_pair(r, c));
+  smap.slots.push_back(rit->second);
+  ++pos;
+  return rit->second;
+}
+
 template <typename DoubleType>
 void CompressedMatrix<DoubleType>::SetCompressed(bool x)
 {
@@ -265,29 +308,23 @@ void CompressedMatrix<DoubleType>::AddEntryImpl(int r, int c, DoubleType v)
   dsAssert(static_cast<size_t>(c) < this->size(), "UNEXPECTED");
 #endif
 
-  if (v == DTZERO)
-  {
-    return;
-  }
-
   if (compressed)
   {
     /// need to adapt for handling of out of band entries
     /// and recompressing matrix
-    const RowInd &ri = Symbolic_[c];
-    RowInd::const_iterator rit = ri.find(r);
-    if (rit != ri.end())
+    const int slot = GetScatterSlot(scatter_real_, r, c, v == DTZERO);
+    if (slot >= 0)
     {
-      Ax_[rit->second] += v;
+      Ax_[slot] += v;
     }
-    else
+    else if (v != DTZERO)
     {
       DecompressMatrix();
       AddSymbolicImpl(r, c);
       OutOfBandEntries_Real[r][c] += v;
     }
   }
-  else
+  else if (v != DTZERO)
   {
     AddSymbolicImpl(r, c);
     /// the double entry is initialized to zero (property of map)
@@ -318,27 +355,21 @@ void CompressedMatrix<DoubleType>::AddImagEntryImpl(int r, int c, DoubleType v)
   dsAssert(static_cast<size_t>(c) < this->size(), "UNEXPECTED");
 #endif
 
-  if (v == DTZERO)
-  {
-    return;
-  }
-
   if (compressed)
   {
-    const RowInd &ri = Symbolic_[c];
-    RowInd::const_iterator rit = ri.find(r);
-    if (rit != ri.end())
+    const int slot = GetScatterSlot(scatter_imag_, r, c, v == DTZERO);
+    if (slot >= 0)
     {
-      Az_[rit->second] += v;
+      Az_[slot] += v;
     }
-    else
+    else if (v != DTZERO)
     {
       DecompressMatrix();
       AddSymbolicImpl(r, c);
       OutOfBandEntries_Imag[r][c] += v;
     }
   }
-  else
+  else if (v != DTZERO)
   {
     AddSymbolicImpl(r, c);
     /// the double entry is initialized to zero (property of map)
@@ -388,6 +419,7 @@ void CompressedMatrix<DoubleType>::DecompressMatrix()
   os << "Matrix Decompress!!! Symbolic pattern changed\n";
   OutputStream::WriteOut(OutputStream::OutputType::VERBOSE1, os.str());
   compressed = false;
+  ClearScatterMaps();
   const size_t sz = Ap_.size() - 1;
 
 #ifndef NDEBUG
@@ -455,17 +487,25 @@ void CompressedMatrix<DoubleType>::Finalize()
       OutOfBandEntries_Imag.clear();
       OutOfBandEntries_Imag.resize(this->size());
     }
+
+    /// the out of band entries were not added in assembly order
+    ClearScatterMaps();
   }
   else
   {
     symbolicstatus_ = SymbolicStatus_t::SAME_SYMBOLIC;
   }
+  scatter_real_.pos = 0;
+  scatter_imag_.pos = 0;
 }
 
 template <typename DoubleType>
 void CompressedMatrix<DoubleType>::ClearMatrix()
 {
 //  compressed = false;
+  scatter_real_.pos = 0;
+  scatter_imag_.pos = 0;
+
   const size_t sz = Ax_.size();
   Ax_.clear();
   Ax_.resize(sz);
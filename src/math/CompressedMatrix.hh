@@ -92,6 +92,23 @@ class CompressedMatrix : public Matrix<DoubleType> {
         void DecompressMatrix();
 
     private:
+        //// Slots in Ax_ or Az_ of the entries, in the order they were added in the last assembly.
+        //// While the entries arrive in the same order, they are written without a lookup in Symbolic_.
+        struct ScatterMap {
+          RowColEntryVec entries;
+          IntVec_t       slots;
+          size_t         pos = 0;
+          void clear()
+          {
+            entries.clear();
+            slots.clear();
+            pos = 0;
+          }
+        };
+
+        int GetScatterSlot(ScatterMap &, int, int, bool);
+        void ClearScatterMaps();
+
         void AddSymbolicImpl(int, int);  // add row,column to element list
         void AddEntryImpl(int, int, DoubleType);  // add row,column, value
         //void AddEntryImpl(int, int, ComplexDouble_t<DoubleType>);
@@ -117,6 +134,8 @@ class CompressedMatrix : public Matrix<DoubleType> {
         mutable ComplexDoubleVec_t<DoubleType> Axz_;
         bool compressed;
         SymbolicStatus_t symbolicstatus_;
+        ScatterMap scatter_real_;
+        ScatterMap scatter_imag_;
 
         static const inline DoubleType DTZERO{};
 };
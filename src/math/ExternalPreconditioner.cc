@@ -86,6 +86,32 @@ ExternalPreconditioner<DoubleType>::~ExternalPreconditioner()
 {
 }
 
+template <typename DoubleType>
+bool ExternalPreconditioner<DoubleType>::GetSolverInfo(ObjectHolder &info) const
+{
+  if (solver_info_.empty())
+  {
+    return false;
+  }
+  info = solver_info_;
+  return true;
+}
+
+namespace {
+// the optional "info" entry is passed back through solve(info=True)
+void SetSolverInfo(ObjectHolderMap_t &result_dictionary, ObjectHolder &solver_info)
+{
+  if (auto it = result_dictionary.find("info"); it != result_dictionary.end())
+  {
+    solver_info = it->second;
+  }
+  else
+  {
+    solver_info = ObjectHolder();
+  }
+}
+}
+
 template <typename DoubleType>
 bool ExternalPreconditioner<DoubleType>::init(ObjectHolder oh, std::string &error_string)
 {
@@ -289,6 +315,7 @@ void ExternalPreconditioner<DoubleType>::DerivedLUSolve(DoubleVec_t<DoubleType>
       auto message = result_dictionary["message"].GetString();
       error_string += message;
       dsAssert(status, error_string);
+      SetSolverInfo(result_dictionary, solver_info_);
       std::vector<double> xv;
       preswap(xv, x);
       bool ret = result_dictionary["x"].GetDoubleList(xv);
@@ -349,6 +376,7 @@ void ExternalPreconditioner<DoubleType>::DerivedLUSolve(ComplexDoubleVec_t<Doubl
       auto message = result_dictionary["message"].GetString();
       error_string += message;
       dsAssert(status, error_string);
+      SetSolverInfo(result_dictionary, solver_info_);
 
       bool ret = false;
       ComplexDoubleVec_t<double> xv;
@@ -21,6 +21,7 @@ class ExternalPreconditioner : public Preconditioner<DoubleType>
         bool init (ObjectHolder, std::string &);
         dsMath::CompressionType GetRealMatrixCompressionType() const override;
         dsMath::CompressionType GetComplexMatrixCompressionType() const override;
+        bool GetSolverInfo(ObjectHolder &) const override;
 
     protected:
         bool DerivedLUFactor(Matrix<DoubleType> *) override;
@@ -36,6 +37,7 @@ class ExternalPreconditioner : public Preconditioner<DoubleType>
 
         mutable ObjectHolder command_handle_;
         mutable ObjectHolder command_data_;
+        mutable ObjectHolder solver_info_;
         CompressionType compression_type_;
 };
 }
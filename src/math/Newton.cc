@@ -15,8 +15,10 @@ SPDX-License-Identifier: Apache-2.0
 #include "Preconditioner.hh"
 #include "SolverUtil.hh"
 #include "LinearSolver.hh"
+#include "DirectLinearSolver.hh"
 #include "Device.hh"
 #include "Region.hh"
+#include "NodeModel.hh"
 #include "EquationHolder.hh"
 #include "OutputStream.hh"
 #include "dsAssert.hh"
@@ -33,12 +35,18 @@ SPDX-License-Identifier: Apache-2.0
 #include "BoostConstants.hh"
 
 #include "ControlGIL.hh"
+#include "GetNumberOfThreads.hh"
+#include "ThreadPool.hh"
+#include "FPECheck.hh"
 
+#include <algorithm>
+#include <exception>
 #include <sstream>
 #include <iomanip>
 #include <cmath>
 #include <cstdlib>
 using std::abs;
+using std::sqrt;
 
 namespace dsMath {
 
@@ -142,10 +150,109 @@ void Newton<DoubleType>::AssembleContactsAndInterfaces(RealRowColValueVec<Double
   }
 }
 
+namespace {
+//// Assembling regions in parallel is opt in, until the shared state it
+//// relies on has been verified for concurrent use
+bool IsThreadedRegionAssembly(const Device &dev)
+{
+  bool ret = false;
+  const GlobalData &gdata = GlobalData::GetInstance();
+  GlobalData::DBEntry_t dbent = gdata.GetDBEntryOnDevice(dev.GetName(), "threaded_region_assembly");
+  if (dbent.first)
+  {
+    const auto &x = dbent.second.GetBoolean();
+    if (x.first)
+    {
+      ret = x.second;
+    }
+  }
+  return ret;
+}
+}
+
 template <typename DoubleType>
 void Newton<DoubleType>::AssembleBulk(RealRowColValueVec<DoubleType> &mat, RHSEntryVec<DoubleType> &rhs, Device &dev, dsMathEnum::WhatToLoad w, dsMathEnum::TimeMode t)
 {
-  dev.RegionAssemble(mat, rhs, dsMathEnum::WhatToLoad::MATRIXANDRHS, t);
+  const Device::RegionList_t &rlist = dev.GetRegionList();
+  const size_t num_threads = std::min(ThreadInfo::GetNumberOfThreads(), rlist.size());
+
+  if ((num_threads < 2) || !IsThreadedRegionAssembly(dev))
+  {
+    dev.RegionAssemble(mat, rhs, dsMathEnum::WhatToLoad::MATRIXANDRHS, t);
+    return;
+  }
+
+  //// Each region is assembled by a pool worker into its own buffers.
+  //// Equations within a region share lazily evaluated models, and are
+  //// assembled serially.  Threaded model evaluations started by a region
+  //// run in its worker.  The buffers are appended in the same region order
+  //// as Device::RegionAssemble, so the entries are the same as the serial
+  //// assembly for any number of threads.
+  ////
+  //// The regions still share the parameters in GlobalData, the MathEval
+  //// functions, the symdiff expressions of the models, and OutputStream.
+  //// Models calling python take the GIL, which serializes them.  These are
+  //// only read during assembly, but this has not been verified, so the
+  //// "threaded_region_assembly" parameter must be set to enable it.
+  std::vector<Region *> regions;
+  for (auto &it : rlist)
+  {
+    regions.push_back(it.second);
+  }
+
+  const size_t num_regions = regions.size();
+  std::vector<RealRowColValueVec<DoubleType>> mats(num_regions);
+  std::vector<RHSEntryVec<DoubleType>>        rhss(num_regions);
+  std::vector<FPECheck::FPEFlag_t>            fpe_flags(num_regions, FPECheck::getClearedFlag());
+  std::vector<std::exception_ptr>             errors(num_regions);
+
+  ThreadInfo::ThreadPool::GetInstance().Run(num_threads, num_regions, 1,
+    [&](size_t /*worker*/, size_t b, size_t e) {
+      for (size_t i = b; i < e; ++i)
+      {
+        FPECheck::ClearFPE();
+        try
+        {
+          regions[i]->Assemble(mats[i], rhss[i], dsMathEnum::WhatToLoad::MATRIXANDRHS, t);
+        }
+        catch (...)
+        {
+          errors[i] = std::current_exception();
+        }
+        fpe_flags[i] = FPECheck::getFPEFlags();
+      }
+    });
+
+  FPECheck::FPEFlag_t fpe_flag = FPECheck::getClearedFlag();
+  for (size_t i = 0; i < num_regions; ++i)
+  {
+    if (errors[i])
+    {
+      std::rethrow_exception(errors[i]);
+    }
+    fpe_flag = FPECheck::combineFPEFlags(fpe_flag, fpe_flags[i]);
+  }
+
+  if (FPECheck::CheckFPE(fpe_flag))
+  {
+    //// Raise FPE in the main thread
+    FPECheck::raiseFPE(fpe_flag);
+  }
+
+  size_t mat_size = mat.size();
+  size_t rhs_size = rhs.size();
+  for (size_t i = 0; i < num_regions; ++i)
+  {
+    mat_size += mats[i].size();
+    rhs_size += rhss[i].size();
+  }
+  mat.reserve(mat_size);
+  rhs.reserve(rhs_size);
+  for (size_t i = 0; i < num_regions; ++i)
+  {
+    mat.insert(mat.end(), mats[i].begin(), mats[i].end());
+    rhs.insert(rhs.end(), rhss[i].begin(), rhss[i].end());
+  }
 }
 
 template <typename DoubleType>
@@ -517,6 +624,114 @@ void CallACUpdateSolution(NodeKeeper &nk, const std::string &rname, const std::s
 
 }
 
+template <typename DoubleType>
+void Newton<DoubleType>::LoadResidual(Matrix<DoubleType> &matrix, DoubleVec_t<DoubleType> &rhs, const DoubleVec_t<DoubleType> &rhs_constant, permvec_t &permvec, const TimeMethods::TimeParams<DoubleType> &timeinfo, dsMathEnum::WhatToLoad w)
+{
+  rhs = rhs_constant;
+
+  /// This is the resistive portion (always assembled
+  if (timeinfo.IsDCOnly())
+  {
+    LoadMatrixAndRHS(matrix, rhs, permvec, w, dsMathEnum::TimeMode::DC, static_cast<DoubleType>(1.0));
+  }
+  else
+  {
+    LoadMatrixAndRHS(matrix, rhs, permvec, w, dsMathEnum::TimeMode::DC, timeinfo.b0);
+
+    /// This assembles the time derivative current
+    if (timeinfo.a0 != 0.0)
+    {
+      LoadMatrixAndRHS(matrix, rhs, permvec, w, dsMathEnum::TimeMode::TIME, timeinfo.a0);
+    }
+  }
+}
+
+template <typename DoubleType>
+void Newton<DoubleType>::UpdateSolutions(DoubleVec_t<DoubleType> &result)
+{
+  GlobalData &gdata = GlobalData::GetInstance();
+  const GlobalData::DeviceList_t &dlist = gdata.GetDeviceList();
+
+  GlobalData::DeviceList_t::const_iterator dit  = dlist.begin();
+  GlobalData::DeviceList_t::const_iterator dend = dlist.end();
+  for ( ; dit != dend; ++dit)
+  {
+    Device *dev = (dit->second);
+    dev->Update(result);
+  }
+
+  NodeKeeper &nk = NodeKeeper::instance();
+  if (nk.HaveNodes())
+  {
+    CallUpdateSolution(nk, "dcop", result);
+    nk.TriggerCallbacksOnNodes();
+  }
+}
+
+namespace {
+template <typename DoubleType>
+DoubleType GetNorm(const DoubleVec_t<DoubleType> &v)
+{
+  DoubleType ret = 0.0;
+  for (const auto &x : v)
+  {
+    ret += x * x;
+  }
+  return sqrt(ret);
+}
+
+//// The line search keeps its copy of the solutions here, so that no
+//// node solutions are added to the regions
+template <typename DoubleType>
+struct SolutionSnapshot {
+  std::vector<std::pair<NodeModelPtr, NodeScalarList<DoubleType>>> node_solutions;
+  std::vector<double> circuit_solution;
+};
+
+template <typename DoubleType>
+void SaveSolutions(SolutionSnapshot<DoubleType> &snapshot)
+{
+  snapshot.node_solutions.clear();
+
+  const GlobalData::DeviceList_t &dlist = GlobalData::GetInstance().GetDeviceList();
+  for (const auto &dit : dlist)
+  {
+    const Device::RegionList_t &rlist = dit.second->GetRegionList();
+    for (const auto &rit : rlist)
+    {
+      const Region &region = *(rit.second);
+      for (const auto &name : region.GetVariableList())
+      {
+        NodeModelPtr nm = std::const_pointer_cast<NodeModel, const NodeModel>(region.GetNodeModel(name));
+        dsAssert(nm.get(), std::string("Node Solution: \"") + name + "\" not available");
+        snapshot.node_solutions.emplace_back(nm, nm->GetScalarValues<DoubleType>());
+      }
+    }
+  }
+
+  NodeKeeper &nk = NodeKeeper::instance();
+  if (nk.HaveNodes())
+  {
+    snapshot.circuit_solution = *nk.GetSolution("dcop");
+  }
+}
+
+template <typename DoubleType>
+void LoadSolutions(const SolutionSnapshot<DoubleType> &snapshot)
+{
+  for (const auto &it : snapshot.node_solutions)
+  {
+    it.first->SetValues(it.second);
+  }
+
+  NodeKeeper &nk = NodeKeeper::instance();
+  if (nk.HaveNodes())
+  {
+    *nk.GetSolution("dcop") = snapshot.circuit_solution;
+  }
+}
+}
+
 template <typename DoubleType>
 void Newton<DoubleType>::GetMatrixAndRHSForExternalUse(CompressionType ct, ObjectHolderMap_t &ohm)
 {
@@ -670,6 +885,22 @@ bool Newton<DoubleType>::Solve(LinearSolver<DoubleType> &itermethod, const TimeM
 
   const size_t symbolic_iter_max = (std::getenv("DEVSIM_NEW_SYMBOLIC") == nullptr) ? symbolicIterationLimit : size_t(-1);
 
+  dsTimerTotal &model_time = dsTimerTotal::GetInstance("model_evaluation");
+  dsCounterTotal &shared_evaluations = dsCounterTotal::GetInstance("shared_subexpression_evaluations");
+  dsCounterTotal &shared_reuses      = dsCounterTotal::GetInstance("shared_subexpression_reuses");
+
+  //// Modified Newton reuses the factorization of a direct solver
+  const bool can_reuse_jacobian = (jacobianReuseLimit > 0) && (dynamic_cast<DirectLinearSolver<DoubleType> *>(&itermethod) != nullptr);
+  bool   have_factorization = false;
+  size_t reuse_count = 0;
+  DoubleType last_residual_norm = 0.0;
+
+  //// The line search assembles the right hand side into a separate matrix, so the
+  //// factored matrix and its symbolic pattern are not changed
+  std::unique_ptr<Matrix<DoubleType>> residual_matrix;
+  DoubleVec_t<DoubleType> residual(numeqns);
+  SolutionSnapshot<DoubleType> line_search_snapshot;
+
   for (size_t iter = 0; (iter < maxiter) && (!converged) && (divergence_count < maxDivergenceCount); ++iter)
   {
     if (max_error_hit)
@@ -684,64 +915,154 @@ bool Newton<DoubleType>::Solve(LinearSolver<DoubleType> &itermethod, const TimeM
       p_iteration_map = &iteration_map;
     }
 
-    rhs = rhs_constant;
+    const double model_time_start = model_time.GetTime();
+    const size_t shared_evaluations_start = shared_evaluations.GetCount();
+    const size_t shared_reuses_start      = shared_reuses.GetCount();
+    const size_t peak_memory_start = dsTimer::GetPeakMemory();
+    preconditioner->ResetTimes();
 
-//        std::cerr << "Begin Load Matrix\n";
-    /// This is the resistive portion (always assembled
-    if (timeinfo.IsDCOnly())
-    {
-      LoadMatrixAndRHS(*matrix, rhs, permvec, dsMathEnum::WhatToLoad::MATRIXANDRHS, dsMathEnum::TimeMode::DC, static_cast<DoubleType>(1.0));
-    }
-    else
+    double assembly_time = 0.0;
     {
-      LoadMatrixAndRHS(*matrix, rhs, permvec, dsMathEnum::WhatToLoad::MATRIXANDRHS, dsMathEnum::TimeMode::DC, timeinfo.b0);
+      dsTimer timer("Assembly");
 
-      /// This assembles the time derivative current
-      if (timeinfo.a0 != 0.0)
-      {
-        LoadMatrixAndRHS(*matrix, rhs, permvec, dsMathEnum::WhatToLoad::MATRIXANDRHS, dsMathEnum::TimeMode::TIME, timeinfo.a0);
-      }
-    }
+      LoadResidual(*matrix, rhs, rhs_constant, permvec, timeinfo, dsMathEnum::WhatToLoad::MATRIXANDRHS);
 
 //        std::cerr << "End Load Matrix\n";
+      assembly_time = timer.GetElapsedTime();
+    }
 
     result.clear();
     result.resize(numeqns);
 
-    matrix->Finalize();
+    double compression_time = 0.0;
+    {
+      dsTimer timer("Compression");
+      matrix->Finalize();
+      compression_time = timer.GetElapsedTime();
+    }
 
 //        std::cerr << "Begin Solve Matrix\n";
-    // iter is 0 based
-    if (iter < symbolic_iter_max)
+    bool symbolic_factorization = false;
+    bool same_symbolic = false;
+    if (auto cm = dynamic_cast<CompressedMatrix<DoubleType> *>(matrix.get()); cm)
     {
-      if (auto cm = dynamic_cast<CompressedMatrix<DoubleType> *>(matrix.get()); cm)
+      same_symbolic = (cm->GetSymbolicStatus() == SymbolicStatus_t::SAME_SYMBOLIC);
+      // iter is 0 based
+      if (iter < symbolic_iter_max)
       {
         cm->SetSymbolicStatus(SymbolicStatus_t::NEW_SYMBOLIC);
       }
+      symbolic_factorization = (cm->GetSymbolicStatus() == SymbolicStatus_t::NEW_SYMBOLIC);
     }
 
-    bool solveok = itermethod.Solve(*matrix, *preconditioner, result, rhs);
+    //// Keep the old factorization while the residual contracts fast enough.
+    //// A changed matrix pattern always needs a new factorization, since
+    //// some solvers keep pointers into the compressed matrix.
+    const DoubleType residual_norm = (can_reuse_jacobian || (lineSearchSteps > 0)) ? GetNorm(rhs) : 0.0;
+
+    bool reuse_jacobian = false;
+    if (can_reuse_jacobian)
+    {
+      reuse_jacobian = have_factorization && same_symbolic && (reuse_count < jacobianReuseLimit)
+        && (residual_norm < jacobianReuseRate * last_residual_norm);
+      last_residual_norm = residual_norm;
+    }
+
+    bool solveok = false;
+    bool jacobian_reused = false;
+    double linear_solver_time = 0.0;
+    {
+      dsTimer timer("Linear Solver");
+      if (reuse_jacobian)
+      {
+        solveok = preconditioner->LUSolve(result, rhs);
+        jacobian_reused = solveok;
+      }
+
+      if (jacobian_reused)
+      {
+        ++reuse_count;
+      }
+      else
+      {
+        solveok = itermethod.Solve(*matrix, *preconditioner, result, rhs);
+        have_factorization = solveok;
+        reuse_count = 0;
+      }
+      linear_solver_time = timer.GetElapsedTime();
+    }
     if (!solveok)
     {
       break;
     }
 //        std::cerr << "End Solve Matrix\n";
 
+    if (p_iteration_map)
     {
-      GlobalData::DeviceList_t::const_iterator dit  = dlist.begin();
-      GlobalData::DeviceList_t::const_iterator dend = dlist.end();
-      for ( ; dit != dend; ++dit)
+      ObjectHolder solver_info;
+      if (preconditioner->GetSolverInfo(solver_info))
       {
-        std::string name = (dit->first);
-        Device *dev =      (dit->second);
-        dev->Update(result);
+        (*p_iteration_map)["solver_info"] = solver_info;
       }
     }
 
-    if (nk.HaveNodes())
+    double update_time = 0.0;
+    DoubleType step_factor = 1.0;
+    {
+      dsTimer timer("Update");
+      if (lineSearchSteps > 0)
+      {
+        SaveSolutions(line_search_snapshot);
+      }
+
+      UpdateSolutions(result);
+
+      //// Backtracking line search on the norm of the right hand side
+      for (size_t step = 0; step < lineSearchSteps; ++step)
+      {
+        if (!residual_matrix)
+        {
+          residual_matrix = std::unique_ptr<Matrix<DoubleType>>(CreateMatrix(preconditioner.get()));
+        }
+        LoadResidual(*residual_matrix, residual, rhs_constant, permvec, timeinfo, dsMathEnum::WhatToLoad::RHS);
+        residual_matrix->Finalize();
+        residual_matrix->ClearMatrix();
+
+        if (GetNorm(residual) <= (1.0 - 1.0e-4 * step_factor) * residual_norm)
+        {
+          break;
+        }
+
+        step_factor *= 0.5;
+        for (auto &x : result)
+        {
+          x *= 0.5;
+        }
+        LoadSolutions(line_search_snapshot);
+        UpdateSolutions(result);
+      }
+      update_time = timer.GetElapsedTime();
+    }
+
+    if (p_iteration_map)
     {
-      CallUpdateSolution(nk, "dcop", result);
-      nk.TriggerCallbacksOnNodes();
+      ObjectHolderMap_t &imap = *p_iteration_map;
+      imap["assembly_time"]          = ObjectHolder(assembly_time);
+      imap["model_evaluation_time"]  = ObjectHolder(model_time.GetTime() - model_time_start);
+      imap["compression_time"]       = ObjectHolder(compression_time);
+      imap["linear_solver_time"]     = ObjectHolder(linear_solver_time);
+      imap["factorization_time"]     = ObjectHolder(preconditioner->GetFactorTime());
+      imap["symbolic_factorization"] = ObjectHolder(symbolic_factorization && !jacobian_reused);
+      imap["jacobian_reused"]        = ObjectHolder(jacobian_reused);
+      imap["back_substitution_time"] = ObjectHolder(preconditioner->GetSolveTime());
+      imap["update_time"]            = ObjectHolder(update_time);
+      imap["peak_memory_delta"]      = ObjectHolder(static_cast<double>(dsTimer::GetPeakMemory() - peak_memory_start));
+      imap["shared_subexpression_evaluations"] = ObjectHolder(static_cast<int>(shared_evaluations.GetCount() - shared_evaluations_start));
+      imap["shared_subexpression_reuses"]      = ObjectHolder(static_cast<int>(shared_reuses.GetCount() - shared_reuses_start));
+      if (lineSearchSteps > 0)
+      {
+        imap["step_factor"]            = ObjectHolder(static_cast<double>(step_factor));
+      }
     }
 
     PrintIteration(iter, p_iteration_map);
@@ -782,7 +1103,8 @@ bool Newton<DoubleType>::Solve(LinearSolver<DoubleType> &itermethod, const TimeM
         last_rel_err = devrerr;
         last_abs_err = devaerr;
 
-        converged = converged && (devrerr < relLimit) && (devaerr < absLimit);
+        //// a damped step must also meet the tolerances as a full step
+        converged = converged && (devrerr < step_factor * relLimit) && (devaerr < step_factor * absLimit);
 
         max_error_hit = max_error_hit || (devaerr > maxLimit);
       }
@@ -796,7 +1118,7 @@ bool Newton<DoubleType>::Solve(LinearSolver<DoubleType> &itermethod, const TimeM
         const DoubleType cirrerr = nk.GetRelError("dcop");
         const DoubleType ciraerr = nk.GetAbsError("dcop");
         PrintCircuitErrors(p_iteration_map);
-        converged = converged && (cirrerr < relLimit) && (ciraerr < absLimit);
+        converged = converged && (cirrerr < step_factor * relLimit) && (ciraerr < step_factor * absLimit);
         max_error_hit = max_error_hit || (ciraerr > maxLimit);
       }
     }
@@ -819,7 +1141,14 @@ bool Newton<DoubleType>::Solve(LinearSolver<DoubleType> &itermethod, const TimeM
     //// Check to see if your projection was correct
     if (timeinfo.IsIntegration())
     {
-      converged = converged && CheckTransientProjection(timeinfo, newQ, ohm);
+      if (predictedQ)
+      {
+        converged = converged && CheckTruncationError(newQ, ohm);
+      }
+      else
+      {
+        converged = converged && CheckTransientProjection(timeinfo, newQ, ohm);
+      }
     }
   }
 
@@ -1074,6 +1403,250 @@ bool Newton<DoubleType>::CheckTransientProjection(const TimeMethods::TimeParams<
   return converged;
 }
 
+//// The charge predicted by extrapolation, compared to the solved charge, estimates the local truncation error.
+//// The error is relative to the charge, and scaled by the charge_error, so a value above 1 rejects the step.
+template <typename DoubleType>
+bool Newton<DoubleType>::CheckTruncationError(const DoubleVec_t<DoubleType> &newQ, ObjectHolderMap_t *ohm)
+{
+  const DoubleVec_t<DoubleType> &projectQ = *predictedQ;
+  dsAssert(projectQ.size() == newQ.size(), "UNEXPECTED");
+
+  DoubleType qrel = 0.0;
+  for (size_t i = 0; i < newQ.size(); ++i)
+  {
+    const DoubleType &qproj = projectQ[i];
+    const DoubleType &qnew  = newQ[i];
+    if (qnew != 0.0)
+    {
+      const DoubleType qr = abs(qnew - qproj)/(1.0e-20 + abs(qnew) + abs(qproj));
+      if (qr > qrel)
+      {
+        qrel = qr;
+      }
+    }
+  }
+
+  truncationError = truncationErrorScale * qrel / qrelLimit;
+
+  std::ostringstream os;
+  os << "Truncation Error " << std::scientific << std::setprecision(5) << truncationError << "\n";
+  OutputStream::WriteOut(OutputStream::OutputType::INFO, os.str());
+
+  if (ohm)
+  {
+    (*ohm)["truncation_error"] = ObjectHolder(static_cast<double>(truncationError));
+  };
+
+  return truncationError <= 1.0;
+}
+
+namespace {
+//// Lagrange extrapolation of the charge at time t from the accepted time points
+template <typename DoubleType>
+void ExtrapolateCharge(const std::vector<std::pair<DoubleType, DoubleVec_t<DoubleType>>> &history, DoubleType t, DoubleVec_t<DoubleType> &q)
+{
+  const size_t npoints = history.size();
+  std::vector<DoubleType> weights(npoints, 1.0);
+  for (size_t i = 0; i < npoints; ++i)
+  {
+    for (size_t j = 0; j < npoints; ++j)
+    {
+      if (i != j)
+      {
+        weights[i] *= (t - history[j].first) / (history[i].first - history[j].first);
+      }
+    }
+  }
+
+  q.clear();
+  q.resize(history.back().second.size());
+  for (size_t i = 0; i < npoints; ++i)
+  {
+    const DoubleVec_t<DoubleType> &hq = history[i].second;
+    for (size_t k = 0; k < q.size(); ++k)
+    {
+      q[k] += weights[i] * hq[k];
+    }
+  }
+}
+}
+
+//// Integrates from tstart to tstop, starting from a transient_dc or transient solution.
+//// The first step is BDF1, and the following steps are variable step BDF2 or TR.
+template <typename DoubleType>
+bool Newton<DoubleType>::SolveTransientAdaptive(LinearSolver<DoubleType> &itermethod, const TimeMethods::AdaptiveParams<DoubleType> &params, ObjectHolder &callback, ObjectHolderMap_t &ohm)
+{
+  typedef std::pair<DoubleType, DoubleVec_t<DoubleType>> ChargePoint_t;
+
+  const DoubleType safety = 0.9;
+  const DoubleType failure_shrink = 0.25;
+
+  TimeData<DoubleType> &tinst = TimeData<DoubleType>::GetInstance();
+
+  //// the last accepted charges, oldest first
+  std::vector<ChargePoint_t> history;
+  history.push_back(ChargePoint_t(params.tstart, tinst.GetQ(TimePoint_t::TM0)));
+
+  DoubleVec_t<DoubleType> projectQ;
+  predictedQ = &projectQ;
+
+  ObjectHolderList_t time_points;
+  ObjectHolderList_t steps;
+
+  size_t accepted_steps = 0;
+  size_t rejected_steps = 0;
+  size_t failed_steps = 0;
+
+  DoubleType t = params.tstart;
+  DoubleType h = params.tdelta;
+  DoubleType h_prev = 0.0;
+  bool converged = true;
+
+  while (t < params.tstop)
+  {
+    if (params.max_tdelta > 0.0)
+    {
+      h = std::min(h, params.max_tdelta);
+    }
+
+    //// do not leave a sliver for the last step
+    const bool last_step = ((t + 1.1 * h) >= params.tstop);
+    if (last_step)
+    {
+      h = params.tstop - t;
+    }
+
+    const DoubleType tnext = last_step ? params.tstop : (t + h);
+
+    std::string method;
+    DoubleType order = 1.0;
+    if (accepted_steps == 0)
+    {
+      //// forward Euler projection from the starting point
+      projectQ = history.back().second;
+      tinst.AssembleI(TimePoint_t::TM0, -h, projectQ);
+      truncationErrorScale = 0.5;
+      method = "bdf1";
+    }
+    else
+    {
+      ExtrapolateCharge(history, tnext, projectQ);
+      //// the error of the extrapolation over the span of the history points
+      truncationErrorScale = h / (tnext - history.front().first);
+      if (params.use_tr)
+      {
+        truncationErrorScale *= 0.25;
+        method = "tr";
+      }
+      else
+      {
+        method = "bdf2";
+      }
+      order = 2.0;
+    }
+
+    truncationError = -1.0;
+    bool ok = false;
+    if (method == "bdf1")
+    {
+      ok = Solve(itermethod, TimeMethods::BDF1<DoubleType>(h, 1.0), nullptr);
+    }
+    else if (method == "tr")
+    {
+      ok = Solve(itermethod, TimeMethods::TR<DoubleType>(h, 1.0), nullptr);
+    }
+    else
+    {
+      //// variable step BDF2 with the previous step h_prev
+      ok = Solve(itermethod, TimeMethods::BDF2<DoubleType>(h_prev + h, h_prev / (h_prev + h)), nullptr);
+    }
+
+    ObjectHolderMap_t step_map;
+    step_map["time"] = ObjectHolder(static_cast<double>(tnext));
+    step_map["tdelta"] = ObjectHolder(static_cast<double>(h));
+    step_map["method"] = ObjectHolder(method);
+    step_map["truncation_error"] = ObjectHolder(static_cast<double>(truncationError));
+
+    DoubleType h_next = h;
+    if (ok)
+    {
+      t = tnext;
+      h_prev = h;
+      ++accepted_steps;
+      step_map["status"] = ObjectHolder("accepted");
+
+      history.push_back(ChargePoint_t(t, tinst.GetQ(TimePoint_t::TM0)));
+      if (history.size() > 3)
+      {
+        history.erase(history.begin());
+      }
+
+      time_points.push_back(ObjectHolder(static_cast<double>(t)));
+
+      const DoubleType factor = (truncationError > 0.0) ? safety * pow(truncationError, -1.0 / (order + 1.0)) : params.growth;
+      h_next = h * std::min(params.growth, factor);
+    }
+    else if (truncationError > 1.0)
+    {
+      ++rejected_steps;
+      step_map["status"] = ObjectHolder("rejected");
+      const DoubleType factor = safety * pow(truncationError, -1.0 / (order + 1.0));
+      h_next = h * std::max(params.shrink, std::min(safety, factor));
+    }
+    else
+    {
+      ++failed_steps;
+      step_map["status"] = ObjectHolder("diverged");
+      h_next = h * failure_shrink;
+    }
+    steps.push_back(ObjectHolder(step_map));
+
+    {
+      std::ostringstream os;
+      os << "Time " << std::scientific << std::setprecision(5) << tnext << " step " << h << " " << method << " "
+         << step_map["status"].GetString() << "\n";
+      OutputStream::WriteOut(OutputStream::OutputType::INFO, os.str());
+    }
+
+    if (ok && callback.IsCallable())
+    {
+      ObjectHolderMap_t args;
+      args["time"] = ObjectHolder(static_cast<double>(t));
+      Interpreter interpreter;
+      if (!interpreter.RunCommand(callback, args))
+      {
+        predictedQ = nullptr;
+        std::string error = "while calling transient callback\n";
+        error += interpreter.GetErrorString();
+        OutputStream::WriteOut(OutputStream::OutputType::FATAL, error.c_str());
+      }
+    }
+
+    //// the time step must also advance the time
+    if ((t < params.tstop) && ((h_next < params.min_tdelta) || ((t + h_next) == t)))
+    {
+      std::ostringstream os;
+      os << "Time step " << std::scientific << std::setprecision(5) << h_next << " is below the minimum " << params.min_tdelta << "\n";
+      OutputStream::WriteOut(OutputStream::OutputType::INFO, os.str());
+      converged = false;
+      break;
+    }
+    h = h_next;
+  }
+
+  predictedQ = nullptr;
+
+  ohm["converged"] = ObjectHolder(converged);
+  ohm["time"] = ObjectHolder(static_cast<double>(t));
+  ohm["time_points"] = ObjectHolder(time_points);
+  ohm["steps"] = ObjectHolder(steps);
+  ohm["accepted_steps"] = ObjectHolder(static_cast<int>(accepted_steps));
+  ohm["rejected_steps"] = ObjectHolder(static_cast<int>(rejected_steps));
+  ohm["failed_steps"] = ObjectHolder(static_cast<int>(failed_steps));
+
+  return converged;
+}
+
 template <typename DoubleType>
 void Newton<DoubleType>::UpdateTransientCurrent(const TimeMethods::TimeParams<DoubleType> &timeinfo, size_t numeqns, const DoubleVec_t<DoubleType> &newI, const DoubleVec_t<DoubleType> &newQ)
 {
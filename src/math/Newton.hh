@@ -141,6 +141,18 @@ struct TR : public TimeParams<DoubleType>
   using TimeParams<DoubleType>::b1;
 };
 
+
+template <typename DoubleType>
+struct AdaptiveParams {
+  DoubleType tstart     = 0.0;
+  DoubleType tstop      = 0.0;
+  DoubleType tdelta     = 0.0; // initial time step
+  DoubleType min_tdelta = 0.0;
+  DoubleType max_tdelta = 0.0; // no limit when 0
+  DoubleType growth     = 2.0; // maximum increase of the time step after an accepted step
+  DoubleType shrink     = 0.2; // maximum decrease of the time step after a rejected step
+  bool       use_tr     = false; // TR instead of BDF2 after the BDF1 startup step
+};
 }
 
 template <typename DoubleType>
@@ -159,6 +171,9 @@ class Newton {
 
         bool Solve(LinearSolver<DoubleType> &, const TimeMethods::TimeParams<DoubleType> &, ObjectHolderMap_t *ohm);
 
+        //// Returns the accepted time points in "time_points"
+        bool SolveTransientAdaptive(LinearSolver<DoubleType> &, const TimeMethods::AdaptiveParams<DoubleType> &, ObjectHolder & /*callback*/, ObjectHolderMap_t &);
+
         bool ACSolve(LinearSolver<DoubleType> &, DoubleType);
 
         bool NoiseSolve(const std::string &, LinearSolver<DoubleType> &, DoubleType);
@@ -191,6 +206,18 @@ class Newton {
         {
             symbolicIterationLimit = x;
         }
+        void SetJacobianReuse(size_t x)
+        {
+            jacobianReuseLimit = x;
+        }
+        void SetJacobianReuseRate(DoubleType x)
+        {
+            jacobianReuseRate = x;
+        }
+        void SetLineSearchSteps(size_t x)
+        {
+            lineSearchSteps = x;
+        }
 
 
     protected:
@@ -205,6 +232,7 @@ class Newton {
     private:
         void InitializeTransientAssemble(const TimeMethods::TimeParams<DoubleType> &, size_t, DoubleVec_t<DoubleType> &);
         bool CheckTransientProjection(const TimeMethods::TimeParams<DoubleType> &, const DoubleVec_t<DoubleType> &, ObjectHolderMap_t *ohm);
+        bool CheckTruncationError(const DoubleVec_t<DoubleType> &, ObjectHolderMap_t *ohm);
         void UpdateTransientCurrent(const TimeMethods::TimeParams<DoubleType> &, size_t, const DoubleVec_t<DoubleType> &, const DoubleVec_t<DoubleType> &);
 
         void PrintDeviceErrors(const Device &device, ObjectHolderMap_t *);
@@ -216,10 +244,13 @@ class Newton {
 
         void BackupSolutions();
         void RestoreSolutions();
+        void UpdateSolutions(DoubleVec_t<DoubleType> &);
 
         template <typename T>
         void LoadMatrixAndRHS(Matrix<DoubleType> &, std::vector<T> &, permvec_t &, dsMathEnum::WhatToLoad, dsMathEnum::TimeMode, T);
 
+        void LoadResidual(Matrix<DoubleType> &, DoubleVec_t<DoubleType> &, const DoubleVec_t<DoubleType> &, permvec_t &, const TimeMethods::TimeParams<DoubleType> &, dsMathEnum::WhatToLoad);
+
         void LoadMatrixAndRHSAC(Matrix<DoubleType> &, ComplexDoubleVec_t<DoubleType> &, permvec_t &, DoubleType);
         void LoadCircuitRHSAC(ComplexDoubleVec_t<DoubleType> &);
 
@@ -241,6 +272,9 @@ class Newton {
         size_t maxiter = 0; /// The maximum number of iterations
         size_t maxDivergenceCount = 0; // abort after this number of diverging iterations
         size_t symbolicIterationLimit = 0; // how many iterations with same symbolic factorization
+        size_t jacobianReuseLimit = 0; // how many consecutive iterations reuse the numeric factorization
+        DoubleType jacobianReuseRate = 0.0; // maximum residual contraction rate when reusing the factorization
+        size_t lineSearchSteps = 0; // maximum number of times the update is halved
         DoubleType absLimit = 0.0;  /// The calculated abs error (maybe come on per device or per region basis)
         DoubleType relLimit = 0.0;  /// The calculated rel error
         DoubleType maxLimit = 0.0; // The maximum absolute error before solver failure
@@ -249,6 +283,11 @@ class Newton {
 
         size_t dimension = 0;
 
+        //// Set by SolveTransientAdaptive for the truncation error estimate of a time step
+        const DoubleVec_t<DoubleType> *predictedQ = nullptr;
+        DoubleType truncationErrorScale = 0.0;
+        DoubleType truncationError = 0.0;
+
 };
 }
 #endif
@@ -10,6 +10,7 @@ SPDX-License-Identifier: Apache-2.0
 #include "Matrix.hh"
 #include "FPECheck.hh"
 #include "OutputStream.hh"
+#include "dsTimer.hh"
 namespace dsMath {
 template <typename DoubleType>
 Preconditioner<DoubleType>::~Preconditioner()
@@ -17,7 +18,7 @@ Preconditioner<DoubleType>::~Preconditioner()
 }
 
 template <typename DoubleType>
-Preconditioner<DoubleType>::Preconditioner(size_t numeqns, PEnum::TransposeType_t transpose) : size_(numeqns), factored(false), transpose_solve_(transpose), matrix_(nullptr)
+Preconditioner<DoubleType>::Preconditioner(size_t numeqns, PEnum::TransposeType_t transpose) : size_(numeqns), factored(false), transpose_solve_(transpose), matrix_(nullptr), factor_time_(0.0), solve_time_(0.0)
 {
 }
 
@@ -27,10 +28,18 @@ bool Preconditioner<DoubleType>::GetTransposeSolve()
   return (transpose_solve_ == PEnum::TransposeType_t::TRANS);
 }
 
+template <typename DoubleType>
+bool Preconditioner<DoubleType>::GetSolverInfo(ObjectHolder &) const
+{
+  return false;
+}
+
 template <typename DoubleType>
 bool Preconditioner<DoubleType>::LUFactor(Matrix<DoubleType> *mat)
 {
 
+  dsTimer timer("LUFactor");
+
   factored = false;
   matrix_ = mat;
 
@@ -52,6 +61,7 @@ bool Preconditioner<DoubleType>::LUFactor(Matrix<DoubleType> *mat)
   }
 
   factored = ret;
+  factor_time_ += timer.GetElapsedTime();
   return ret;
 }
 
@@ -64,6 +74,8 @@ bool Preconditioner<DoubleType>::LUSolve(DoubleVec_t<DoubleType> &x, const Doubl
   dsAssert(static_cast<size_t>(b.size()) == size(), "UNEXPECTED");
 #endif
 
+  dsTimer timer("LUSolve");
+
   bool ret = false;
 
   FPECheck::ClearFPE();
@@ -87,6 +99,7 @@ bool Preconditioner<DoubleType>::LUSolve(DoubleVec_t<DoubleType> &x, const Doubl
     ret = true;
   }
 
+  solve_time_ += timer.GetElapsedTime();
   return ret;
 }
 
@@ -98,6 +111,8 @@ bool Preconditioner<DoubleType>::LUSolve(ComplexDoubleVec_t<DoubleType> &x, cons
   dsAssert(static_cast<size_t>(b.size()) == size(), "UNEXPECTED");
 #endif
 
+  dsTimer timer("LUSolve");
+
   bool ret = false;
 
   //// This should be able to return a value too
@@ -119,6 +134,7 @@ bool Preconditioner<DoubleType>::LUSolve(ComplexDoubleVec_t<DoubleType> &x, cons
     ret = true;
   }
 
+  solve_time_ += timer.GetElapsedTime();
   return ret;
 }
 }
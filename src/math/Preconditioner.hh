@@ -8,6 +8,7 @@ SPDX-License-Identifier: Apache-2.0
 #ifndef PRECONDITIONER_HH
 #define PRECONDITIONER_HH
 #include "dsMathTypes.hh"
+class ObjectHolder;
 namespace dsMath {
 template <typename DoubleType>
 class Matrix;
@@ -36,6 +37,18 @@ class Preconditioner {
 #endif
     bool GetTransposeSolve();
 
+    // diagnostics from the last factorization and solve, if the solver provides them
+    virtual bool GetSolverInfo(ObjectHolder &) const;
+
+    // seconds spent in LUFactor and LUSolve since the last call to ResetTimes
+    double GetFactorTime() const {return factor_time_;}
+    double GetSolveTime() const {return solve_time_;}
+    void ResetTimes()
+    {
+      factor_time_ = 0.0;
+      solve_time_ = 0.0;
+    }
+
     inline size_t size() const {return size_;}
 
   protected:
@@ -53,6 +66,8 @@ class Preconditioner {
     bool factored;
     PEnum::TransposeType_t transpose_solve_;
     Matrix<DoubleType> *matrix_;
+    double factor_time_;
+    mutable double solve_time_;
 
 };
 }
@@ -42,6 +42,16 @@ class TimeData
           return !QData[static_cast<size_t>(tp)].empty();
         }
 
+        const std::vector<DoubleType> &GetI(TimePoint_t tp) const
+        {
+          return IData[static_cast<size_t>(tp)];
+        }
+
+        const std::vector<DoubleType> &GetQ(TimePoint_t tp) const
+        {
+          return QData[static_cast<size_t>(tp)];
+        }
+
     private:
 
         TimeData();
@@ -0,0 +1,75 @@
+/***
+DEVSIM
+Copyright 2026 DEVSIM LLC
+
+SPDX-License-Identifier: Apache-2.0
+***/
+
+#ifndef DEVSIM_BINARY_FORMAT_HH
+#define DEVSIM_BINARY_FORMAT_HH
+#include <cstdint>
+#include <cstddef>
+#include <cstring>
+#include <algorithm>
+
+//// The devsim_binary restart format
+////
+//// The file starts with the magic string and the version, followed by records.  Each record starts with
+//// its RecordType, followed by its strings and arrays.  All of the numbers are little endian.
+////
+//// string: uint64 length, characters
+//// array:  uint64 number of entries, uint32 values per entry, uint64 number of chunks, chunks
+//// chunk:  uint64 number of values, uint8 compressed, uint64 number of bytes, bytes
+////
+//// Indexes are stored as uint64 and model values as double.  Compressed chunks are zlib streams of the
+//// little endian values.
+namespace dsDevsimBinary {
+const char   Magic[8] = {'D', 'S', 'B', 'I', 'N', 'A', 'R', 'Y'};
+const uint32_t Version = 1;
+//// the number of values written to each chunk
+const size_t ChunkSize = 1 << 20;
+
+enum class RecordType : uint32_t {
+  BEGIN_DEVICE = 1,   // name
+  END_DEVICE,
+  COORDINATES,        // array of x, y, z
+  BEGIN_REGION,       // name, material
+  END_REGION,
+  BEGIN_CONTACT,      // name, region, material
+  END_CONTACT,
+  BEGIN_INTERFACE,    // name, region0, region1
+  END_INTERFACE,
+  NODES,              // array of 1 index, 2 for an interface
+  EDGES,              // array of 2 indexes, 4 for an interface
+  TRIANGLES,          // array of 3 indexes, 6 for an interface
+  TETRAHEDRA,         // array of 4 indexes
+  MODEL_VALUES,       // model type, name, array of values
+  MODEL,              // model type, name, the model in the text format
+  EQUATION            // name, the equation in the text format
+};
+
+inline bool IsLittleEndian()
+{
+  const uint16_t x = 1;
+  unsigned char c;
+  std::memcpy(&c, &x, 1);
+  return c == 1;
+}
+
+//// converts between the host and little endian byte order
+template <typename T>
+void SwapLittleEndian(T *values, size_t n)
+{
+  if (IsLittleEndian())
+  {
+    return;
+  }
+
+  for (size_t i = 0; i < n; ++i)
+  {
+    unsigned char *b = reinterpret_cast<unsigned char *>(&values[i]);
+    std::reverse(b, b + sizeof(T));
+  }
+}
+}
+#endif
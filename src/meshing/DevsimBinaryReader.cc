@@ -0,0 +1,652 @@
+/***
+DEVSIM
+Copyright 2026 DEVSIM LLC
+
+SPDX-License-Identifier: Apache-2.0
+***/
+
+#include "DevsimBinaryReader.hh"
+#include "DevsimBinaryFormat.hh"
+#include "DevsimLoader.hh"
+#include "DevsimReader.hh"
+#include "MeshKeeper.hh"
+#include "ZlibCompress.hh"
+#include <fstream>
+#include <sstream>
+#include <vector>
+#include <limits>
+
+using dsDevsimBinary::RecordType;
+using dsMesh::Solution;
+
+namespace {
+class BinaryInput {
+  public:
+    BinaryInput(std::istream &i, uint64_t s) : is(i), remaining(s) {}
+
+    //// false at the end of the file
+    bool ReadRecord(RecordType &r)
+    {
+      if (remaining == 0)
+      {
+        return false;
+      }
+      uint32_t x = 0;
+      const bool ret = ReadUInt32(x);
+      r = static_cast<RecordType>(x);
+      return ret;
+    }
+
+    bool ReadUInt32(uint32_t &x)
+    {
+      return ReadBytes(reinterpret_cast<char *>(&x), sizeof(x)) && Swap(&x, 1);
+    }
+
+    bool ReadUInt64(uint64_t &x)
+    {
+      return ReadBytes(reinterpret_cast<char *>(&x), sizeof(x)) && Swap(&x, 1);
+    }
+
+    bool ReadString(std::string &s)
+    {
+      uint64_t n = 0;
+      if (!ReadUInt64(n) || (n > remaining))
+      {
+        return false;
+      }
+      s.resize(n);
+      return ReadBytes(&s[0], n);
+    }
+
+    //// the entries must have width values
+    template <typename T>
+    bool ReadArray(std::vector<T> &values, uint32_t width);
+
+    bool ReadBytes(char *data, uint64_t n)
+    {
+      if (n > remaining)
+      {
+        return false;
+      }
+      is.read(data, n);
+      remaining -= n;
+      return static_cast<bool>(is);
+    }
+
+  private:
+    template <typename T>
+    bool Swap(T *values, size_t n)
+    {
+      dsDevsimBinary::SwapLittleEndian(values, n);
+      return true;
+    }
+
+    std::istream &is;
+    uint64_t      remaining;
+};
+
+template <typename T>
+bool BinaryInput::ReadArray(std::vector<T> &values, uint32_t width)
+{
+  uint64_t count   = 0;
+  uint32_t w       = 0;
+  uint64_t nchunks = 0;
+  if (!(ReadUInt64(count) && ReadUInt32(w) && ReadUInt64(nchunks)) || (w != width) || (count > std::numeric_limits<uint64_t>::max() / (width * sizeof(T))))
+  {
+    return false;
+  }
+
+  //// the values are added as they are read, so that a damaged file does not allocate too much memory
+  const uint64_t n = count * width;
+  values.clear();
+  values.reserve(std::min<uint64_t>(n, remaining / sizeof(T)));
+
+  std::vector<char> compressed;
+  std::vector<char> uncompressed;
+  uint64_t begin = 0;
+  for (uint64_t i = 0; i < nchunks; ++i)
+  {
+    uint64_t length = 0;
+    char     is_compressed = 0;
+    uint64_t nbytes = 0;
+    if (!(ReadUInt64(length) && ReadBytes(&is_compressed, 1) && ReadUInt64(nbytes)) || (length > (n - begin)))
+    {
+      return false;
+    }
+
+    values.resize(begin + length);
+    char *data = reinterpret_cast<char *>(values.data() + begin);
+    if (is_compressed)
+    {
+      if (nbytes > remaining)
+      {
+        return false;
+      }
+      compressed.resize(nbytes);
+      if (!ReadBytes(compressed.data(), nbytes))
+      {
+        return false;
+      }
+      bool ret = DEVSIMZlibDecompress(uncompressed, compressed.data(), nbytes);
+      if (!ret || (uncompressed.size() != length * sizeof(T)))
+      {
+        return false;
+      }
+      std::copy(uncompressed.begin(), uncompressed.end(), data);
+    }
+    else if ((nbytes != length * sizeof(T)) || !ReadBytes(data, nbytes))
+    {
+      return false;
+    }
+
+    Swap(values.data() + begin, length);
+    begin += length;
+  }
+  return begin == n;
+}
+
+class BinaryLoader {
+  public:
+    BinaryLoader(BinaryInput &i, std::ostringstream &e) : in(i), errors(e), loader(nullptr) {}
+
+    bool Load();
+
+  private:
+    bool BeginDevice();
+    bool EndDevice();
+    bool Coordinates();
+    bool BeginRegion();
+    bool BeginContact();
+    bool BeginInterface();
+    bool Nodes();
+    bool Edges();
+    bool Triangles();
+    bool Tetrahedra();
+    bool Model(bool);
+    bool Equation();
+
+    bool InDevice()
+    {
+      return loader && !region && !contact && !interface;
+    }
+
+    BinaryInput              &in;
+    std::ostringstream       &errors;
+    dsMesh::DevsimLoader     *loader;
+    dsMesh::MeshRegionPtr     region;
+    dsMesh::MeshContactPtr    contact;
+    dsMesh::MeshInterfacePtr  interface;
+};
+
+bool BinaryLoader::Load()
+{
+  RecordType r;
+  bool ret = true;
+  while (ret && in.ReadRecord(r))
+  {
+    switch (r)
+    {
+      case RecordType::BEGIN_DEVICE:
+        ret = BeginDevice();
+        break;
+      case RecordType::END_DEVICE:
+        ret = EndDevice();
+        break;
+      case RecordType::COORDINATES:
+        ret = Coordinates();
+        break;
+      case RecordType::BEGIN_REGION:
+        ret = BeginRegion();
+        break;
+      case RecordType::END_REGION:
+        ret = static_cast<bool>(region);
+        if (ret)
+        {
+          loader->AddRegion(std::move(region));
+        }
+        break;
+      case RecordType::BEGIN_CONTACT:
+        ret = BeginContact();
+        break;
+      case RecordType::END_CONTACT:
+        ret = static_cast<bool>(contact);
+        if (ret)
+        {
+          loader->AddContact(std::move(contact));
+        }
+        break;
+      case RecordType::BEGIN_INTERFACE:
+        ret = BeginInterface();
+        break;
+      case RecordType::END_INTERFACE:
+        ret = static_cast<bool>(interface);
+        if (ret)
+        {
+          loader->AddInterface(std::move(interface));
+        }
+        break;
+      case RecordType::NODES:
+        ret = Nodes();
+        break;
+      case RecordType::EDGES:
+        ret = Edges();
+        break;
+      case RecordType::TRIANGLES:
+        ret = Triangles();
+        break;
+      case RecordType::TETRAHEDRA:
+        ret = Tetrahedra();
+        break;
+      case RecordType::MODEL_VALUES:
+        ret = Model(true);
+        break;
+      case RecordType::MODEL:
+        ret = Model(false);
+        break;
+      case RecordType::EQUATION:
+        ret = Equation();
+        break;
+      default:
+        ret = false;
+        break;
+    }
+
+    if (!ret && errors.str().empty())
+    {
+      errors << "ERROR: unexpected record " << static_cast<uint32_t>(r) << "\n";
+    }
+  }
+
+  if (ret && loader)
+  {
+    errors << "ERROR: device " << loader->GetName() << " is not complete\n";
+    ret = false;
+  }
+
+  return ret;
+}
+
+bool BinaryLoader::BeginDevice()
+{
+  std::string name;
+  if (loader || !in.ReadString(name))
+  {
+    return false;
+  }
+
+  dsMesh::MeshKeeper &mk = dsMesh::MeshKeeper::GetInstance();
+  if (mk.GetMesh(name))
+  {
+    errors << "ERROR: a mesh already exists by the name " << name << "\n";
+    return false;
+  }
+
+  loader = new dsMesh::DevsimLoader(name);
+  mk.AddMesh(loader);
+  return true;
+}
+
+bool BinaryLoader::EndDevice()
+{
+  if (!InDevice())
+  {
+    return false;
+  }
+
+  std::string errorString;
+  bool ret = loader->Finalize(errorString);
+  if (ret)
+  {
+    ret = loader->Instantiate(loader->GetName(), errorString);
+  }
+  loader = nullptr;
+
+  errors << errorString;
+  return ret;
+}
+
+bool BinaryLoader::Coordinates()
+{
+  std::vector<double> positions;
+  if (!InDevice() || !in.ReadArray(positions, 3))
+  {
+    return false;
+  }
+
+  std::vector<dsMesh::MeshCoordinate> coordinates;
+  coordinates.reserve(positions.size() / 3);
+  for (size_t i = 0; i < positions.size(); i += 3)
+  {
+    coordinates.push_back(dsMesh::MeshCoordinate(positions[i], positions[i + 1], positions[i + 2]));
+  }
+  loader->AddCoordinates(coordinates);
+  return true;
+}
+
+bool BinaryLoader::BeginRegion()
+{
+  std::string name;
+  std::string material;
+  if (!InDevice() || !(in.ReadString(name) && in.ReadString(material)))
+  {
+    return false;
+  }
+
+  if (loader->IsMeshRegion(name))
+  {
+    errors << "ERROR: region already exists on device " << name << "\n";
+    return false;
+  }
+
+  region = std::make_unique<dsMesh::MeshRegion>(name, material);
+  return true;
+}
+
+bool BinaryLoader::BeginContact()
+{
+  std::string name;
+  std::string rname;
+  std::string material;
+  if (!InDevice() || !(in.ReadString(name) && in.ReadString(rname) && in.ReadString(material)))
+  {
+    return false;
+  }
+
+  if (loader->IsMeshContact(name))
+  {
+    errors << "ERROR: contact already exists on device " << name << "\n";
+    return false;
+  }
+
+  contact = std::make_unique<dsMesh::MeshContact>(name, rname, material);
+  return true;
+}
+
+bool BinaryLoader::BeginInterface()
+{
+  std::string name;
+  std::string rname0;
+  std::string rname1;
+  if (!InDevice() || !(in.ReadString(name) && in.ReadString(rname0) && in.ReadString(rname1)))
+  {
+    return false;
+  }
+
+  if (loader->IsMeshInterface(name))
+  {
+    errors << "ERROR: interface already exists on device " << name << "\n";
+    return false;
+  }
+
+  interface = std::make_unique<dsMesh::MeshInterface>(name, rname0, rname1);
+  return true;
+}
+
+bool BinaryLoader::Nodes()
+{
+  std::vector<uint64_t> indexes;
+  if (region && in.ReadArray(indexes, 1))
+  {
+    for (size_t i = 0; i < indexes.size(); ++i)
+    {
+      region->AddNode(dsMesh::MeshNode(indexes[i]));
+    }
+  }
+  else if (contact && in.ReadArray(indexes, 1))
+  {
+    for (size_t i = 0; i < indexes.size(); ++i)
+    {
+      contact->AddNode(dsMesh::MeshNode(indexes[i]));
+    }
+  }
+  else if (interface && in.ReadArray(indexes, 2))
+  {
+    for (size_t i = 0; i < indexes.size(); i += 2)
+    {
+      interface->AddNodePair(dsMesh::MeshInterfaceNodePair(indexes[i], indexes[i + 1]));
+    }
+  }
+  else
+  {
+    return false;
+  }
+  return true;
+}
+
+bool BinaryLoader::Edges()
+{
+  std::vector<uint64_t> indexes;
+  if (region && in.ReadArray(indexes, 2))
+  {
+    for (size_t i = 0; i < indexes.size(); i += 2)
+    {
+      region->AddEdge(dsMesh::MeshEdge(indexes[i], indexes[i + 1]));
+    }
+  }
+  else if (contact && in.ReadArray(indexes, 2))
+  {
+    for (size_t i = 0; i < indexes.size(); i += 2)
+    {
+      contact->AddEdge(dsMesh::MeshEdge(indexes[i], indexes[i + 1]));
+    }
+  }
+  else if (interface && in.ReadArray(indexes, 4))
+  {
+    for (size_t i = 0; i < indexes.size(); i += 4)
+    {
+      interface->AddEdgePair(dsMesh::MeshEdge(indexes[i], indexes[i + 1]), dsMesh::MeshEdge(indexes[i + 2], indexes[i + 3]));
+    }
+  }
+  else
+  {
+    return false;
+  }
+  return true;
+}
+
+bool BinaryLoader::Triangles()
+{
+  std::vector<uint64_t> indexes;
+  if (region && in.ReadArray(indexes, 3))
+  {
+    for (size_t i = 0; i < indexes.size(); i += 3)
+    {
+      region->AddTriangle(dsMesh::MeshTriangle(indexes[i], indexes[i + 1], indexes[i + 2]));
+    }
+  }
+  else if (contact && in.ReadArray(indexes, 3))
+  {
+    for (size_t i = 0; i < indexes.size(); i += 3)
+    {
+      contact->AddTriangle(dsMesh::MeshTriangle(indexes[i], indexes[i + 1], indexes[i + 2]));
+    }
+  }
+  else if (interface && in.ReadArray(indexes, 6))
+  {
+    for (size_t i = 0; i < indexes.size(); i += 6)
+    {
+      interface->AddTrianglePair(dsMesh::MeshTriangle(indexes[i], indexes[i + 1], indexes[i + 2]), dsMesh::MeshTriangle(indexes[i + 3], indexes[i + 4], indexes[i + 5]));
+    }
+  }
+  else
+  {
+    return false;
+  }
+  return true;
+}
+
+bool BinaryLoader::Tetrahedra()
+{
+  std::vector<uint64_t> indexes;
+  if (!region || !in.ReadArray(indexes, 4))
+  {
+    return false;
+  }
+
+  for (size_t i = 0; i < indexes.size(); i += 4)
+  {
+    region->AddTetrahedron(dsMesh::MeshTetrahedron(indexes[i], indexes[i + 1], indexes[i + 2], indexes[i + 3]));
+  }
+  return true;
+}
+
+bool BinaryLoader::Model(bool has_values)
+{
+  uint32_t    mtype = 0;
+  std::string name;
+  if (!(in.ReadUInt32(mtype) && in.ReadString(name)))
+  {
+    return false;
+  }
+
+  const Solution::ModelType model_type = static_cast<Solution::ModelType>(mtype);
+  if (model_type == Solution::ModelType::INTERFACENODE)
+  {
+    if (!interface || has_values)
+    {
+      return false;
+    }
+  }
+  else if (!region || (mtype < static_cast<uint32_t>(Solution::ModelType::NODE)) || (mtype > static_cast<uint32_t>(Solution::ModelType::TETRAHEDRONEDGE)))
+  {
+    return false;
+  }
+
+  if ((region && region->IsSolution(name)) || (interface && interface->IsSolution(name)))
+  {
+    errors << "ERROR: Solution already loaded " << name << "\n";
+    return false;
+  }
+
+  dsMesh::SolutionPtr sol = std::make_unique<Solution>(name);
+  sol->SetModelType(model_type);
+
+  if (has_values)
+  {
+    Solution::values_t values;
+    if (!in.ReadArray(values, 1))
+    {
+      return false;
+    }
+    sol->SetDataType(Solution::DataType::DATA);
+    sol->SetValues(std::move(values));
+  }
+  else
+  {
+    std::string text;
+    if (!in.ReadString(text))
+    {
+      return false;
+    }
+    std::string errorString;
+    if (!dsDevsimParse::ParseModelText(text, sol, errorString))
+    {
+      errors << errorString << "ERROR: could not read model " << name << ": " << text << "\n";
+      return false;
+    }
+  }
+
+  if (region)
+  {
+    region->AddSolution(std::move(sol));
+  }
+  else
+  {
+    interface->AddSolution(std::move(sol));
+  }
+  return true;
+}
+
+bool BinaryLoader::Equation()
+{
+  std::string name;
+  std::string text;
+  if (!(in.ReadString(name) && in.ReadString(text)))
+  {
+    return false;
+  }
+
+  if ((region && region->IsEquation(name)) || (contact && contact->IsEquation(name)) || (interface && interface->IsEquation(name)))
+  {
+    errors << "ERROR: Equation already loaded " << name << "\n";
+    return false;
+  }
+
+  dsMesh::EquationPtr eq = std::make_unique<dsMesh::Equation>(name);
+  std::string errorString;
+  if (!dsDevsimParse::ParseEquationText(text, eq, errorString))
+  {
+    errors << errorString << "ERROR: could not read equation " << name << ": " << text << "\n";
+    return false;
+  }
+
+  if (region)
+  {
+    region->AddEquation(std::move(eq));
+  }
+  else if (contact)
+  {
+    contact->AddEquation(std::move(eq));
+  }
+  else if (interface)
+  {
+    interface->AddEquation(std::move(eq));
+  }
+  else
+  {
+    return false;
+  }
+  return true;
+}
+}
+
+namespace dsDevsimBinary {
+bool IsBinaryFile(const std::string &fname)
+{
+  std::ifstream myfile(fname.c_str(), std::ios::in | std::ios::binary);
+  char magic[sizeof(Magic)];
+  return myfile.read(magic, sizeof(magic)) && std::equal(magic, magic + sizeof(magic), Magic);
+}
+
+bool LoadMeshes(const std::string &fname, std::string &errorString)
+{
+  std::ostringstream os;
+
+  std::ifstream myfile(fname.c_str(), std::ios::in | std::ios::binary | std::ios::ate);
+  if (!myfile)
+  {
+    errorString += "Could not open file " + fname + "\n";
+    return false;
+  }
+
+  const uint64_t size = myfile.tellg();
+  myfile.seekg(0);
+
+  BinaryInput in(myfile, size);
+
+  char     magic[sizeof(Magic)];
+  uint32_t version = 0;
+  bool ret = in.ReadBytes(magic, sizeof(magic)) && std::equal(magic, magic + sizeof(magic), Magic) && in.ReadUInt32(version);
+  if (!ret)
+  {
+    os << "ERROR: " << fname << " is not a devsim_binary file\n";
+  }
+  else if (version != Version)
+  {
+    os << "ERROR: " << fname << " has devsim_binary version " << version << ", expected " << Version << "\n";
+    ret = false;
+  }
+  else
+  {
+    BinaryLoader loader(in, os);
+    ret = loader.Load();
+    if (!ret)
+    {
+      os << "ERROR: could not load " << fname << "\n";
+    }
+  }
+
+  errorString += os.str();
+  return ret;
+}
+}
@@ -0,0 +1,19 @@
+/***
+DEVSIM
+Copyright 2026 DEVSIM LLC
+
+SPDX-License-Identifier: Apache-2.0
+***/
+
+#ifndef DEVSIM_BINARY_READER_HH
+#define DEVSIM_BINARY_READER_HH
+#include <string>
+
+namespace dsDevsimBinary {
+//// true when the file starts with the devsim_binary magic string
+bool IsBinaryFile(const std::string &/*filename*/);
+
+//// loads the devices the same way as dsDevsimParse::LoadMeshes
+bool LoadMeshes(const std::string &/*filename*/, std::string &/*errorString*/);
+}
+#endif
@@ -0,0 +1,455 @@
+/***
+DEVSIM
+Copyright 2026 DEVSIM LLC
+
+SPDX-License-Identifier: Apache-2.0
+***/
+
+#include "DevsimBinaryWriter.hh"
+#include "DevsimBinaryFormat.hh"
+#include "MeshLoaderStructs.hh"
+#include "GlobalData.hh"
+#include "Device.hh"
+#include "Coordinate.hh"
+#include "Region.hh"
+#include "Node.hh"
+#include "Edge.hh"
+#include "Triangle.hh"
+#include "Tetrahedron.hh"
+#include "Contact.hh"
+#include "Interface.hh"
+#include "NodeModel.hh"
+#include "EdgeModel.hh"
+#include "TriangleEdgeModel.hh"
+#include "TetrahedronEdgeModel.hh"
+#include "InterfaceNodeModel.hh"
+#include "EquationHolder.hh"
+#include "ContactEquationHolder.hh"
+#include "InterfaceEquationHolder.hh"
+#include "ZlibCompress.hh"
+#include "dsAssert.hh"
+#include <sstream>
+#include <fstream>
+#include <iomanip>
+#include <limits>
+#include <vector>
+
+using dsDevsimBinary::RecordType;
+using dsMesh::Solution;
+
+namespace {
+class BinaryOutput {
+  public:
+    BinaryOutput(std::ostream &o, bool c) : os(o), compress(c) {}
+
+    void WriteRecord(RecordType r)
+    {
+      WriteUInt32(static_cast<uint32_t>(r));
+    }
+
+    void WriteUInt32(uint32_t x)
+    {
+      dsDevsimBinary::SwapLittleEndian(&x, 1);
+      os.write(reinterpret_cast<const char *>(&x), sizeof(x));
+    }
+
+    void WriteUInt64(uint64_t x)
+    {
+      dsDevsimBinary::SwapLittleEndian(&x, 1);
+      os.write(reinterpret_cast<const char *>(&x), sizeof(x));
+    }
+
+    void WriteString(const std::string &s)
+    {
+      WriteUInt64(s.size());
+      os.write(s.data(), s.size());
+    }
+
+    //// n is the number of values, and is a multiple of width
+    template <typename T>
+    void WriteArray(const T *values, size_t n, uint32_t width);
+
+  private:
+    std::ostream &os;
+    bool          compress;
+};
+
+template <typename T>
+void BinaryOutput::WriteArray(const T *values, size_t n, uint32_t width)
+{
+  const size_t nchunks = (n + dsDevsimBinary::ChunkSize - 1) / dsDevsimBinary::ChunkSize;
+
+  WriteUInt64(n / width);
+  WriteUInt32(width);
+  WriteUInt64(nchunks);
+
+  std::vector<T>    swapped;
+  std::vector<char> compressed;
+  for (size_t i = 0; i < nchunks; ++i)
+  {
+    const size_t begin  = i * dsDevsimBinary::ChunkSize;
+    const size_t length = std::min(n - begin, dsDevsimBinary::ChunkSize);
+    const size_t nbytes = length * sizeof(T);
+
+    const char *data = reinterpret_cast<const char *>(values + begin);
+    if (!dsDevsimBinary::IsLittleEndian())
+    {
+      swapped.assign(values + begin, values + begin + length);
+      dsDevsimBinary::SwapLittleEndian(swapped.data(), length);
+      data = reinterpret_cast<const char *>(swapped.data());
+    }
+
+    //// only kept when it is smaller
+    bool use_compressed = false;
+    if (compress)
+    {
+      bool ret = DEVSIMZlibCompress(compressed, const_cast<char *>(data), nbytes);
+      dsAssert(ret, "UNEXPECTED");
+      use_compressed = compressed.size() < nbytes;
+    }
+
+    WriteUInt64(length);
+    os.put(use_compressed ? 1 : 0);
+    if (use_compressed)
+    {
+      WriteUInt64(compressed.size());
+      os.write(compressed.data(), compressed.size());
+    }
+    else
+    {
+      WriteUInt64(nbytes);
+      os.write(data, nbytes);
+    }
+  }
+}
+
+//// The text format of a model or equation, without its begin and end lines
+//// Numbers are written with enough digits to be read back exactly
+template <typename T>
+std::string SerializeText(const T &obj)
+{
+  std::ostringstream os;
+  os << std::setprecision(std::numeric_limits<double>::max_digits10) << std::scientific;
+  obj.DevsimSerialize(os);
+
+  const std::string &text = os.str();
+  const size_t begin = text.find('\n') + 1;
+  const size_t end   = text.rfind("\nend_");
+  dsAssert(begin != 0 && end != std::string::npos && end >= begin, "UNEXPECTED");
+  return text.substr(begin, end - begin);
+}
+
+template <typename T>
+void WriteModel(BinaryOutput &out, Solution::ModelType mtype, const T &model)
+{
+  if (model.SerializesValues())
+  {
+    out.WriteRecord(RecordType::MODEL_VALUES);
+    out.WriteUInt32(static_cast<uint32_t>(mtype));
+    out.WriteString(model.GetName());
+    const std::vector<double> &vals = model.template GetScalarValues<double>();
+    out.WriteArray(vals.data(), vals.size(), 1);
+  }
+  else
+  {
+    out.WriteRecord(RecordType::MODEL);
+    out.WriteUInt32(static_cast<uint32_t>(mtype));
+    out.WriteString(model.GetName());
+    out.WriteString(SerializeText(model));
+  }
+}
+
+template <typename T>
+void WriteModels(BinaryOutput &out, Solution::ModelType mtype, const T &mlist)
+{
+  for (auto it = mlist.begin(); it != mlist.end(); ++it)
+  {
+    WriteModel(out, mtype, *(it->second));
+  }
+}
+
+template <typename T>
+void WriteEquations(BinaryOutput &out, const T &eqlist)
+{
+  for (auto it = eqlist.begin(); it != eqlist.end(); ++it)
+  {
+    out.WriteRecord(RecordType::EQUATION);
+    out.WriteString(it->first);
+    out.WriteString(SerializeText(it->second));
+  }
+}
+
+template <typename T>
+void AppendIndexes(std::vector<uint64_t> &indexes, const T &elist)
+{
+  for (auto it = elist.begin(); it != elist.end(); ++it)
+  {
+    const ConstNodeList &nlist = (*it)->GetNodeList();
+    for (size_t i = 0; i < nlist.size(); ++i)
+    {
+      indexes.push_back(nlist[i]->GetIndex());
+    }
+  }
+}
+
+void WriteIndexes(BinaryOutput &out, RecordType r, const std::vector<uint64_t> &indexes, uint32_t width)
+{
+  out.WriteRecord(r);
+  out.WriteArray(indexes.data(), indexes.size(), width);
+}
+
+void WriteRegion(BinaryOutput &out, const Region &reg, size_t dimension)
+{
+  out.WriteRecord(RecordType::BEGIN_REGION);
+  out.WriteString(reg.GetName());
+  out.WriteString(reg.GetMaterialName());
+
+  std::vector<uint64_t> indexes;
+  const ConstNodeList &nlist = reg.GetNodeList();
+  for (size_t i = 0; i < nlist.size(); ++i)
+  {
+    indexes.push_back(nlist[i]->GetCoordinate().GetIndex());
+  }
+  WriteIndexes(out, RecordType::NODES, indexes, 1);
+
+  indexes.clear();
+  if (dimension == 1)
+  {
+    AppendIndexes(indexes, reg.GetEdgeList());
+    WriteIndexes(out, RecordType::EDGES, indexes, 2);
+  }
+  else if (dimension == 2)
+  {
+    AppendIndexes(indexes, reg.GetTriangleList());
+    WriteIndexes(out, RecordType::TRIANGLES, indexes, 3);
+  }
+  else if (dimension == 3)
+  {
+    AppendIndexes(indexes, reg.GetTetrahedronList());
+    WriteIndexes(out, RecordType::TETRAHEDRA, indexes, 4);
+  }
+
+  WriteModels(out, Solution::ModelType::NODE, reg.GetNodeModelList());
+  WriteModels(out, Solution::ModelType::EDGE, reg.GetEdgeModelList());
+  WriteModels(out, Solution::ModelType::TRIANGLEEDGE, reg.GetTriangleEdgeModelList());
+  WriteModels(out, Solution::ModelType::TETRAHEDRONEDGE, reg.GetTetrahedronEdgeModelList());
+
+  WriteEquations(out, reg.GetEquationPtrList());
+
+  out.WriteRecord(RecordType::END_REGION);
+}
+
+void WriteContact(BinaryOutput &out, const Contact &cnt, size_t dimension)
+{
+  out.WriteRecord(RecordType::BEGIN_CONTACT);
+  out.WriteString(cnt.GetName());
+  out.WriteString(cnt.GetRegion()->GetName());
+  out.WriteString(cnt.GetMaterialName());
+
+  std::vector<uint64_t> indexes;
+  if (dimension == 1)
+  {
+    const ConstNodeList_t &ctnodes = cnt.GetNodes();
+    for (size_t i = 0; i < ctnodes.size(); ++i)
+    {
+      indexes.push_back(ctnodes[i]->GetIndex());
+    }
+    WriteIndexes(out, RecordType::NODES, indexes, 1);
+  }
+  else if (dimension == 2)
+  {
+    AppendIndexes(indexes, cnt.GetEdges());
+    WriteIndexes(out, RecordType::EDGES, indexes, 2);
+  }
+  else if (dimension == 3)
+  {
+    AppendIndexes(indexes, cnt.GetTriangles());
+    WriteIndexes(out, RecordType::TRIANGLES, indexes, 3);
+  }
+
+  WriteEquations(out, cnt.GetEquationPtrList());
+
+  out.WriteRecord(RecordType::END_CONTACT);
+}
+
+void WriteInterface(BinaryOutput &out, const Interface &iint, size_t dimension)
+{
+  out.WriteRecord(RecordType::BEGIN_INTERFACE);
+  out.WriteString(iint.GetName());
+  out.WriteString(iint.GetRegion0()->GetName());
+  out.WriteString(iint.GetRegion1()->GetName());
+
+  const ConstNodeList_t &itnodes0 = iint.GetNodes0();
+  const ConstNodeList_t &itnodes1 = iint.GetNodes1();
+  dsAssert(itnodes0.size() == itnodes1.size(), "UNEXPECTED");
+
+  //// the entries from both regions are written together, as in the text format
+  std::vector<uint64_t> indexes;
+  if (dimension == 1 || (!iint.ElementsProvided()))
+  {
+    for (size_t i = 0; i < itnodes0.size(); ++i)
+    {
+      indexes.push_back(itnodes0[i]->GetIndex());
+      indexes.push_back(itnodes1[i]->GetIndex());
+    }
+    WriteIndexes(out, RecordType::NODES, indexes, 2);
+  }
+  else if (dimension == 2)
+  {
+    const ConstEdgeList_t &itedges0 = iint.GetEdges0();
+    const ConstEdgeList_t &itedges1 = iint.GetEdges1();
+    if (!itedges0.empty() && (itedges0.size() == itedges1.size()))
+    {
+      for (size_t i = 0; i < itedges0.size(); ++i)
+      {
+        indexes.push_back(itedges0[i]->GetHead()->GetIndex());
+        indexes.push_back(itedges0[i]->GetTail()->GetIndex());
+        indexes.push_back(itedges1[i]->GetHead()->GetIndex());
+        indexes.push_back(itedges1[i]->GetTail()->GetIndex());
+      }
+      WriteIndexes(out, RecordType::EDGES, indexes, 4);
+    }
+  }
+  else if (dimension == 3)
+  {
+    const ConstTriangleList_t &ittriangles0 = iint.GetTriangles0();
+    const ConstTriangleList_t &ittriangles1 = iint.GetTriangles1();
+    if (!ittriangles0.empty() && (ittriangles0.size() == ittriangles1.size()))
+    {
+      for (size_t i = 0; i < ittriangles0.size(); ++i)
+      {
+        const std::vector<ConstNodePtr> &triangle0_nodes = ittriangles0[i]->GetNodeList();
+        const std::vector<ConstNodePtr> &triangle1_nodes = ittriangles1[i]->GetNodeList();
+        for (size_t j = 0; j < 3; ++j)
+        {
+          indexes.push_back(triangle0_nodes[j]->GetIndex());
+        }
+        for (size_t j = 0; j < 3; ++j)
+        {
+          indexes.push_back(triangle1_nodes[j]->GetIndex());
+        }
+      }
+      WriteIndexes(out, RecordType::TRIANGLES, indexes, 6);
+    }
+  }
+
+  const Interface::NameToInterfaceNodeModelMap_t &imlist = iint.GetInterfaceNodeModelList();
+  for (auto it = imlist.begin(); it != imlist.end(); ++it)
+  {
+    out.WriteRecord(RecordType::MODEL);
+    out.WriteUInt32(static_cast<uint32_t>(Solution::ModelType::INTERFACENODE));
+    out.WriteString(it->first);
+    out.WriteString(SerializeText(*(it->second)));
+  }
+
+  WriteEquations(out, iint.GetInterfaceEquationList());
+
+  out.WriteRecord(RecordType::END_INTERFACE);
+}
+
+bool WriteSingleDevice(const std::string &dname, BinaryOutput &out, std::string &errorString)
+{
+  GlobalData   &gdata = GlobalData::GetInstance();
+
+  DevicePtr dp = gdata.GetDevice(dname);
+
+  if (!dp)
+  {
+    errorString += "ERROR: Device \"" + dname + "\" does not exist\n";
+    return false;
+  }
+
+  const Device &dev = *dp;
+  const size_t dimension = dev.GetDimension();
+
+  out.WriteRecord(RecordType::BEGIN_DEVICE);
+  out.WriteString(dname);
+
+  {
+    const Device::CoordinateList_t &clist = dev.GetCoordinateList();
+    std::vector<double> positions;
+    positions.reserve(3 * clist.size());
+    for (Device::CoordinateList_t::const_iterator cit = clist.begin(); cit != clist.end(); ++cit)
+    {
+      const Vector<double> &pos = (*cit)->Position();
+      positions.push_back(pos.Getx());
+      positions.push_back(pos.Gety());
+      positions.push_back(pos.Getz());
+    }
+    out.WriteRecord(RecordType::COORDINATES);
+    out.WriteArray(positions.data(), positions.size(), 3);
+  }
+
+  const Device::RegionList_t &rlist = dev.GetRegionList();
+  for (Device::RegionList_t::const_iterator rit = rlist.begin(); rit != rlist.end(); ++rit)
+  {
+    WriteRegion(out, *(rit->second), dimension);
+  }
+
+  const Device::ContactList_t &ctlist = dev.GetContactList();
+  for (Device::ContactList_t::const_iterator cit = ctlist.begin(); cit != ctlist.end(); ++cit)
+  {
+    WriteContact(out, *(cit->second), dimension);
+  }
+
+  const Device::InterfaceList_t &itlist = dev.GetInterfaceList();
+  for (Device::InterfaceList_t::const_iterator iit = itlist.begin(); iit != itlist.end(); ++iit)
+  {
+    WriteInterface(out, *(iit->second), dimension);
+  }
+
+  out.WriteRecord(RecordType::END_DEVICE);
+
+  return true;
+}
+
+bool WriteDevices(const std::string &filename, const std::vector<std::string> &dnames, bool compress, std::string &errorString)
+{
+  std::ofstream myfile;
+  myfile.open (filename.c_str(), std::ios::out | std::ios::trunc | std::ios::binary);
+  if (!myfile)
+  {
+    errorString += "Could not open \"" + filename + "\" for writing\n";
+    return false;
+  }
+
+  BinaryOutput out(myfile, compress);
+  myfile.write(dsDevsimBinary::Magic, sizeof(dsDevsimBinary::Magic));
+  out.WriteUInt32(dsDevsimBinary::Version);
+
+  bool ret = true;
+  for (size_t i = 0; i < dnames.size(); ++i)
+  {
+    ret = WriteSingleDevice(dnames[i], out, errorString) && ret;
+  }
+
+  myfile.close();
+  if (!myfile)
+  {
+    errorString += "Could not write \"" + filename + "\"\n";
+    ret = false;
+  }
+  return ret;
+}
+}
+
+DevsimBinaryWriter::~DevsimBinaryWriter()
+{
+}
+
+bool DevsimBinaryWriter::WriteMesh_(const std::string &deviceName, const std::string &filename, MeshWriterTest_t, std::string &errorString)
+{
+  return WriteDevices(filename, std::vector<std::string>(1, deviceName), compress_, errorString);
+}
+
+bool DevsimBinaryWriter::WriteMeshes_(const std::string &filename, MeshWriterTest_t, std::string &errorString)
+{
+  std::vector<std::string> dnames;
+  GlobalData   &gdata = GlobalData::GetInstance();
+  const GlobalData::DeviceList_t &dlist = gdata.GetDeviceList();
+  for (GlobalData::DeviceList_t::const_iterator dit = dlist.begin(); dit != dlist.end(); ++dit)
+  {
+    dnames.push_back(dit->first);
+  }
+  return WriteDevices(filename, dnames, compress_, errorString);
+}
@@ -0,0 +1,23 @@
+/***
+DEVSIM
+Copyright 2026 DEVSIM LLC
+
+SPDX-License-Identifier: Apache-2.0
+***/
+
+#ifndef DEVSIM_BINARY_WRITER_HH
+#define DEVSIM_BINARY_WRITER_HH
+#include "MeshWriter.hh"
+#include <string>
+/// Writes the same devices and models as DevsimRestartWriter in the devsim_binary format
+class DevsimBinaryWriter : public MeshWriter {
+    public:
+        explicit DevsimBinaryWriter(bool compress) : compress_(compress) {}
+        ~DevsimBinaryWriter();
+    private:
+        bool WriteMeshes_(const std::string &/*filename*/, MeshWriterTest_t /*include*/, std::string &/*errorString*/);
+        bool WriteMesh_(const std::string &/*deviceName*/, const std::string &/*filename*/, MeshWriterTest_t /*include*/, std::string &/*errorString*/);
+
+        bool compress_;
+};
+#endif
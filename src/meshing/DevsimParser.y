@@ -38,10 +38,17 @@ int Devsimlex();
 %token        BEG_INTERFACEEQUATION END_INTERFACEEQUATION
 %token        BEG_REGIONEQUATION END_REGIONEQUATION
 %token        BEG_CONTACTEQUATION END_CONTACTEQUATION
+//// sent first by the scanner when parsing the text of a single model or equation
+%token        MODEL_TEXT EQUATION_TEXT
 
 %type <dval> number
 
 %%
+input : all |
+        MODEL_TEXT model_text |
+        EQUATION_TEXT equation_command
+        ;
+
 all : | all device
     ;
 
@@ -869,6 +876,12 @@ uniform : UNIFORMSECTION number {
           dsDevsimParse::Sol->SetUniformValue($2);
         }
 
+model_text : builtin |
+        dataparent |
+        uniform |
+        command
+        ;
+
 command : command_recursive |
           command COMMAND_EOL
           ;
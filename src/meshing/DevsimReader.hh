@@ -31,6 +31,10 @@ extern std::string errors;
 void DeletePointers();
 
 bool LoadMeshes(const std::string &/*filename*/, std::string &/*errorString*/);
+
+//// the text of a model or equation, without its begin and end lines
+bool ParseModelText(const std::string &/*text*/, dsMesh::SolutionPtr &, std::string &/*errorString*/);
+bool ParseEquationText(const std::string &/*text*/, dsMesh::EquationPtr &, std::string &/*errorString*/);
 }
 
 #endif
@@ -136,6 +136,12 @@ class Solution {
             return values;
         }
 
+        //// all of the values at once, instead of AddValue
+        void SetValues(values_t &&v)
+        {
+            values = std::move(v);
+        }
+
         void SetReserve(size_t rs)
         {
           reserve_size = rs;
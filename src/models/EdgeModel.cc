@@ -13,6 +13,7 @@ SPDX-License-Identifier: Apache-2.0
 #include "Node.hh"
 #include "dsAssert.hh"
 #include "FPECheck.hh"
+#include "dsTimer.hh"
 #include "Vector.hh"
 #include "GeometryStream.hh"
 #include <cmath>
@@ -67,6 +68,8 @@ void EdgeModel::CalculateValues() const
   FPECheck::ClearFPE();
   if (!uptodate)
   {
+    static dsTimerTotal &model_time = dsTimerTotal::GetInstance("model_evaluation");
+    dsTimerTotal::Section section(model_time);
     inprocess = true;
     try
     {
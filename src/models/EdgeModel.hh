@@ -145,12 +145,24 @@ class EdgeModel : public std::enable_shared_from_this<EdgeModel> {
           return model_data.GetLength();
         }
 
+        //// changes whenever the values are set, and does not recalculate them
+        size_t GetVersion() const
+        {
+          return model_data.GetVersion();
+        }
+
         bool IsZero() const;
 
         bool IsOne() const;
 
         void DevsimSerialize(std::ostream &) const;
 
+        //// true when Serialize writes the values of the model
+        virtual bool SerializesValues() const
+        {
+          return false;
+        }
+
         const std::string &GetRegionName() const;
 
         const std::string &GetDeviceName() const;
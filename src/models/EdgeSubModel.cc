@@ -102,6 +102,12 @@ void EdgeSubModel<DoubleType>::Serialize(std::ostream &of) const
   }
 }
 
+template <typename DoubleType>
+bool EdgeSubModel<DoubleType>::SerializesValues() const
+{
+  return parentModelName.empty() && !this->IsUniform();
+}
+
 template class EdgeSubModel<double>;
 #ifdef DEVSIM_EXTENDED_PRECISION
 #include "Float128.hh"
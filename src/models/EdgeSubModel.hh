@@ -21,6 +21,7 @@ class EdgeSubModel : public EdgeModel
         static EdgeModelPtr CreateEdgeSubModel(const std::string &, RegionPtr, EdgeModel::DisplayType, ConstEdgeModelPtr);
 
         void Serialize(std::ostream &) const;
+        bool SerializesValues() const;
 
     private:
         friend class dsModelFactory<EdgeSubModel>;
@@ -12,6 +12,7 @@ SPDX-License-Identifier: Apache-2.0
 #include "Region.hh"
 #include "dsAssert.hh"
 #include "FPECheck.hh"
+#include "dsTimer.hh"
 #include "GeometryStream.hh"
 
 
@@ -49,6 +50,8 @@ void InterfaceNodeModel::CalculateValues() const
   FPECheck::ClearFPE();
 
   // TODO: fix this so the values are actually cached
+  static dsTimerTotal &model_time = dsTimerTotal::GetInstance("model_evaluation");
+  dsTimerTotal::Section section(model_time);
   inprocess = true;
   try
   {
@@ -6,6 +6,13 @@ SPDX-License-Identifier: Apache-2.0
 ***/
 
 #include "ModelDataHolder.hh"
+#include <atomic>
+
+size_t ModelDataHolder::NextVersion()
+{
+  static std::atomic<size_t> versions(0);
+  return ++versions;
+}
 
 void ModelDataHolder::clear_type(MDtype t) const
 {
@@ -97,6 +104,7 @@ void ModelDataHolder::clear() const
   std::vector<float128>().swap(float128_values);
 #endif
   is_uniform = true;
+  version = NextVersion();
 }
 
 bool ModelDataHolder::IsZero() const
@@ -225,8 +233,7 @@ void ModelDataHolder::set_indexes(const std::vector<size_t> &indexes, const floa
 }
 #endif
 
-template <>
-void ModelDataHolder::set_indexes(const std::vector<size_t> &indexes, const std::vector<double> &v)
+void ModelDataHolder::set_indexes(const std::vector<size_t> &indexes, const double *v)
 {
   clear();
 
@@ -241,6 +248,12 @@ void ModelDataHolder::set_indexes(const std::vector<size_t> &indexes, const std:
   is_uniform = false;
 }
 
+template <>
+void ModelDataHolder::set_indexes(const std::vector<size_t> &indexes, const std::vector<double> &v)
+{
+  set_indexes(indexes, v.data());
+}
+
 #ifdef DEVSIM_EXTENDED_PRECISION
 template <>
 void ModelDataHolder::set_indexes(const std::vector<size_t> &indexes, const std::vector<float128> &v)
@@ -259,13 +272,19 @@ void ModelDataHolder::set_indexes(const std::vector<size_t> &indexes, const std:
 }
 #endif
 
-template <>
-void ModelDataHolder::set_values(const std::vector<double> &nv)
+void ModelDataHolder::set_values(const double *nv, size_t n)
 {
   clear_type(MDtype::EXTENDED);
   type = MDtype::DOUBLE;
-  double_values = nv;
+  double_values.assign(nv, nv + n);
   is_uniform = false;
+  version = NextVersion();
+}
+
+template <>
+void ModelDataHolder::set_values(const std::vector<double> &nv)
+{
+  set_values(nv.data(), nv.size());
 }
 
 #ifdef DEVSIM_EXTENDED_PRECISION
@@ -276,6 +295,7 @@ void ModelDataHolder::set_values(const std::vector<float128> &nv)
   type = MDtype::EXTENDED;
   float128_values = nv;
   is_uniform = false;
+  version = NextVersion();
 }
 #endif
 
@@ -294,6 +314,7 @@ void ModelDataHolder::SetValue(size_t index, const float128 &nv)
   expand_uniform();
 
   float128_values[index] = nv;
+  version = NextVersion();
 
 }
 #endif
@@ -317,6 +338,7 @@ void ModelDataHolder::SetValue(size_t index, const double &nv)
     expand_uniform();
 
     double_values[index] = nv;
+    version = NextVersion();
   }
 }
 
@@ -21,7 +21,7 @@ class ModelDataHolder
   enum class MDtype {DOUBLE, EXTENDED};
 
   public:
-    explicit ModelDataHolder(size_t l) : double_uniform_value(0.0), length(l), type(MDtype::DOUBLE), is_uniform(true)
+    explicit ModelDataHolder(size_t l) : double_uniform_value(0.0), length(l), type(MDtype::DOUBLE), is_uniform(true), version(NextVersion())
     {
       // default float128 are 0.0
     }
@@ -39,6 +39,12 @@ class ModelDataHolder
 
     bool IsUniform() const;
 
+    //// Changes whenever the values change, and is never the same for two holders
+    size_t GetVersion() const
+    {
+      return version;
+    }
+
     template <typename DoubleType>
     MDtype GetMDtype() const;
 
@@ -66,6 +72,11 @@ class ModelDataHolder
     template <typename DoubleType>
     void set_values(const DoubleType &/*v*/);
 
+    //// copies the values from a buffer of length doubles
+    void set_indexes(const std::vector<size_t> &/*indexes*/, const double * /*values*/);
+
+    void set_values(const double * /*values*/, size_t /*length*/);
+
     void clear() const;
 
     void expand_uniform() const;
@@ -74,6 +85,7 @@ class ModelDataHolder
 
     void clear_type(MDtype t) const;
     void set_type(MDtype t) const;
+    static size_t NextVersion();
 
     mutable std::vector<double> double_values;
     mutable double              double_uniform_value;
@@ -84,6 +96,7 @@ class ModelDataHolder
     const size_t                length;
     mutable MDtype              type;
     mutable bool                is_uniform;
+    mutable size_t              version;
 };
 
 #endif
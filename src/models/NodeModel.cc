@@ -12,6 +12,7 @@ SPDX-License-Identifier: Apache-2.0
 #include "Contact.hh"
 #include "dsAssert.hh"
 #include "FPECheck.hh"
+#include "dsTimer.hh"
 #include "GeometryStream.hh"
 
 #include <algorithm>
@@ -89,6 +90,8 @@ void NodeModel::CalculateValues() const
   FPECheck::ClearFPE();
   if (!uptodate)
   {
+    static dsTimerTotal &model_time = dsTimerTotal::GetInstance("model_evaluation");
+    dsTimerTotal::Section section(model_time);
     inprocess = true;
     try
     {
@@ -151,6 +154,22 @@ void NodeModel::SetValues(const NodeScalarList<DoubleType> &nv)
   uptodate = true;
 }
 
+void NodeModel::SetValues(const double *nv)
+{
+  if (mycontact)
+  {
+    GetContactIndexes(); // safety
+    model_data.set_indexes(atcontact, nv);
+  }
+  else
+  {
+    model_data.set_values(nv, model_data.GetLength());
+  }
+
+  MarkOld();
+  uptodate = true;
+}
+
 template <typename DoubleType>
 void NodeModel::SetValues(const DoubleType &v) const
 {
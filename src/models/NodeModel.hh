@@ -84,6 +84,9 @@ class NodeModel : public std::enable_shared_from_this<NodeModel> {
         template <typename DoubleType>
         void SetValues(const DoubleType &);
 
+        //// copies the values from a buffer of GetRegion().GetNumberNodes() doubles
+        void SetValues(const double *);
+
         const Region &GetRegion() const
         {
             return *myregion;
@@ -138,12 +141,24 @@ class NodeModel : public std::enable_shared_from_this<NodeModel> {
           return model_data.GetLength();
         }
 
+        //// changes whenever the values are set, and does not recalculate them
+        size_t GetVersion() const
+        {
+          return model_data.GetVersion();
+        }
+
         bool IsZero() const;
 
         bool IsOne() const;
 
         void DevsimSerialize(std::ostream &) const;
 
+        //// true when Serialize writes the values of the model
+        virtual bool SerializesValues() const
+        {
+          return false;
+        }
+
         const std::string &GetRegionName() const;
 
         const std::string &GetDeviceName() const;
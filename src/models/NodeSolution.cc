@@ -94,6 +94,12 @@ void NodeSolution<DoubleType>::Serialize(std::ostream &of) const
   }
 }
 
+template <typename DoubleType>
+bool NodeSolution<DoubleType>::SerializesValues() const
+{
+  return parentModelName.empty() && !this->IsUniform();
+}
+
 template class NodeSolution<double>;
 #ifdef DEVSIM_EXTENDED_PRECISION
 #include "Float128.hh"
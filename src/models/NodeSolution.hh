@@ -20,6 +20,7 @@ class NodeSolution : public NodeModel
     public:
 
         void Serialize(std::ostream &) const;
+        bool SerializesValues() const;
 
 
     private:
@@ -8,7 +8,7 @@ SPDX-License-Identifier: Apache-2.0
 #include "ParallelOpEqual.hh"
 #include "ScalarData.hh"
 #include "GetNumberOfThreads.hh"
-#include <future>
+#include "ThreadPool.hh"
 #include <memory>
 
 
@@ -40,18 +40,17 @@ void OpEqualPacket<U>::join(const OpEqualPacket<U> &omp)
 template <typename U>
 void OpEqualPacket<U>::operator()(size_t vbeg, size_t vend)
 {
-  fpeFlag_ = FPECheck::getClearedFlag();
   ///// This should not be called in the main thread!!!!!
   ///// otherwise preexisting exceptions would not be processed
   ///// This can be asserted since we already know the main thread id on application startup
   FPECheck::ClearFPE();
   opEqualTask_(vbeg, vend);
-  fpeFlag_       = FPECheck::getFPEFlags();
-  num_processed_ = vend - vbeg;
+  //// a worker may process several chunks with the same packet
+  fpeFlag_        = FPECheck::combineFPEFlags(fpeFlag_, FPECheck::getFPEFlags());
+  num_processed_ += vend - vbeg;
 }
 
 
-//// TODO: synchronize with MathPacket
 template <typename U>
 void OpEqualRun(U &task, size_t vlen)
 {
@@ -62,36 +61,15 @@ void OpEqualRun(U &task, size_t vlen)
   {
     OpEqualPacket<U> MyPacket(task);
 
-    std::vector<std::shared_ptr<OpEqualPacket<U>>> packets;
-    std::vector<std::future<void>> futures;
-
-    ///// TODO: This code should be generalized and made available for all thread scheduling
-    ///// e.g. GetSchedule function for queue
-    const size_t step = vlen / num_threads;
-    size_t b = 0;
-    size_t e = (step == 0) ? vlen : step;
-    while (b < e)
+    //// one packet for each worker, to collect its floating point exceptions
+    std::vector<std::unique_ptr<OpEqualPacket<U>>> packets;
+    for (size_t i = 0; i < num_threads; ++i)
     {
-      auto packet = std::shared_ptr<OpEqualPacket<U>>(new OpEqualPacket<U>(task));
-      packets.push_back(packet);
-      futures.push_back(std::async(std::launch::async, OpEqualRange<OpEqualPacket<U> >(*packet, b, e)));
-
-      b = e;
-      e += step;
-      //// If we have 2 threads, take odd off so don't need additional queue member
-      //// or just use a magic number
-      if (e > (vlen - 2))
-      {
-        e = vlen;
-      }
+      packets.emplace_back(new OpEqualPacket<U>(task));
     }
 
-
-    // process the futures
-    for (auto &p : futures)
-    {
-      p.get();
-    }
+    ThreadInfo::ThreadPool::GetInstance().Run(num_threads, vlen, ThreadInfo::GetChunkSize(vlen, num_threads),
+      [&packets](size_t worker, size_t b, size_t e) {(*packets[worker])(b, e);});
 
     // get the results
     for (auto &p : packets)
@@ -113,18 +91,6 @@ void OpEqualRun(U &task, size_t vlen)
 }
 
 
-template <typename U>
-OpEqualRange<U>::OpEqualRange(U &mp, size_t b, size_t e) :
-  opEqualPacket_(mp), beg_(b), end_(e)
-{
-}
-
-template <typename U>
-void OpEqualRange<U>::operator()()
-{
-  opEqualPacket_(beg_, end_);
-}
-
 #define DBLTYPE double
 #include "ParallelOpEqualInstantiate.cc"
 
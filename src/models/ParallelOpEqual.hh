@@ -78,23 +78,5 @@ class OpEqualPacket {
 template <typename U> void
 OpEqualRun(U &, size_t /*length*/);
 
-template <typename U>
-class OpEqualRange
-{
-  public:
-    //// Copy so we have fpe status of each one
-    OpEqualRange(U &, size_t /*beg*/, size_t /*end*/);
-
-    void operator()();
-
-    ~OpEqualRange() {}
-
-  private:
-
-    U            &opEqualPacket_;
-    size_t           beg_;
-    size_t           end_;
-};
-
 #endif
 
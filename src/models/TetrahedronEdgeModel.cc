@@ -8,6 +8,7 @@ SPDX-License-Identifier: Apache-2.0
 #include "TetrahedronEdgeModel.hh"
 #include "Region.hh"
 #include "FPECheck.hh"
+#include "dsTimer.hh"
 #include "Device.hh"
 #include "dsAssert.hh"
 #include "EdgeData.hh"
@@ -65,6 +66,8 @@ void TetrahedronEdgeModel::CalculateValues() const
   FPECheck::ClearFPE();
   if (!uptodate)
   {
+    static dsTimerTotal &model_time = dsTimerTotal::GetInstance("model_evaluation");
+    dsTimerTotal::Section section(model_time);
     inprocess = true;
     try
     {
@@ -137,6 +137,12 @@ class TetrahedronEdgeModel : public std::enable_shared_from_this<TetrahedronEdge
 
         void DevsimSerialize(std::ostream &) const;
 
+        //// true when Serialize writes the values of the model
+        virtual bool SerializesValues() const
+        {
+          return false;
+        }
+
         const std::string &GetRegionName() const;
 
         const std::string &GetDeviceName() const;
@@ -106,6 +106,12 @@ void TetrahedronEdgeSubModel<DoubleType>::Serialize(std::ostream &of) const
   }
 }
 
+template <typename DoubleType>
+bool TetrahedronEdgeSubModel<DoubleType>::SerializesValues() const
+{
+  return parentModelName.empty() && !this->IsUniform();
+}
+
 template class TetrahedronEdgeSubModel<double>;
 #ifdef DEVSIM_EXTENDED_PRECISION
 #include "Float128.hh"
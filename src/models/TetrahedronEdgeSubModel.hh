@@ -18,6 +18,7 @@ class TetrahedronEdgeSubModel : public TetrahedronEdgeModel
 {
     public:
         void Serialize(std::ostream &) const;
+        bool SerializesValues() const;
 
         static TetrahedronEdgeModelPtr CreateTetrahedronEdgeSubModel(const std::string &, RegionPtr, TetrahedronEdgeModel::DisplayType);
         static TetrahedronEdgeModelPtr CreateTetrahedronEdgeSubModel(const std::string &, RegionPtr, TetrahedronEdgeModel::DisplayType, ConstTetrahedronEdgeModelPtr);
@@ -9,6 +9,7 @@ SPDX-License-Identifier: Apache-2.0
 #include "TriangleEdgeScalarData.hh"
 #include "Region.hh"
 #include "FPECheck.hh"
+#include "dsTimer.hh"
 #include "Device.hh"
 #include "dsAssert.hh"
 #include "Edge.hh"
@@ -63,6 +64,8 @@ void TriangleEdgeModel::CalculateValues() const
   FPECheck::ClearFPE();
   if (!uptodate)
   {
+    static dsTimerTotal &model_time = dsTimerTotal::GetInstance("model_evaluation");
+    dsTimerTotal::Section section(model_time);
     inprocess = true;
     try
     {
@@ -135,6 +135,12 @@ class TriangleEdgeModel : public std::enable_shared_from_this<TriangleEdgeModel>
 
         void DevsimSerialize(std::ostream &) const;
 
+        //// true when Serialize writes the values of the model
+        virtual bool SerializesValues() const
+        {
+          return false;
+        }
+
         const std::string &GetRegionName() const;
 
         const std::string &GetDeviceName() const;
@@ -103,6 +103,12 @@ void TriangleEdgeSubModel<DoubleType>::Serialize(std::ostream &of) const
   }
 }
 
+template <typename DoubleType>
+bool TriangleEdgeSubModel<DoubleType>::SerializesValues() const
+{
+  return parentModelName.empty() && !this->IsUniform();
+}
+
 template class TriangleEdgeSubModel<double>;
 #ifdef DEVSIM_EXTENDED_PRECISION
 #include "Float128.hh"
@@ -18,6 +18,7 @@ class TriangleEdgeSubModel : public TriangleEdgeModel
 {
     public:
         void Serialize(std::ostream &) const;
+        bool SerializesValues() const;
 
         static TriangleEdgeModelPtr CreateTriangleEdgeSubModel(const std::string &, RegionPtr, TriangleEdgeModel::DisplayType);
         static TriangleEdgeModelPtr CreateTriangleEdgeSubModel(const std::string &, RegionPtr, TriangleEdgeModel::DisplayType, ConstTriangleEdgeModelPtr);
@@ -34,6 +34,8 @@ DS_FUNCTION_TABLE(get_element_model_list,     dsCommand::getNodeModelListCmd)
 DS_FUNCTION_TABLE(get_element_model_values,   dsCommand::printElementEdgeValuesCmd)
 DS_FUNCTION_TABLE(get_interface_model_list,   dsCommand::getInterfaceModelListCmd)
 DS_FUNCTION_TABLE(get_interface_model_values, dsCommand::getInterfaceValuesCmd)
+DS_FUNCTION_TABLE(get_model_dependency_graph, dsCommand::getNodeModelListCmd)
+DS_FUNCTION_TABLE(get_model_values_table,     dsCommand::getModelValuesTableCmd)
 DS_FUNCTION_TABLE(get_node_model_list,        dsCommand::getNodeModelListCmd)
 DS_FUNCTION_TABLE(get_node_model_values,      dsCommand::printNodeValuesCmd)
 DS_FUNCTION_TABLE(interface_model,            dsCommand::createInterfaceNodeModelCmd)
@@ -48,6 +50,7 @@ DS_FUNCTION_TABLE(print_node_values,          dsCommand::printNodeValuesCmd)
 DS_FUNCTION_TABLE(register_function,          dsCommand::registerFunctionCmd)
 DS_FUNCTION_TABLE(set_node_values,            dsCommand::setNodeValuesCmd)
 DS_FUNCTION_TABLE(set_node_value,             dsCommand::setNodeValueCmd)
+DS_FUNCTION_TABLE(set_node_values_table,      dsCommand::setNodeValuesTableCmd)
 DS_FUNCTION_TABLE(set_edge_values,            dsCommand::setNodeValuesCmd)
 DS_FUNCTION_TABLE(set_element_values,         dsCommand::setNodeValuesCmd)
 DS_FUNCTION_TABLE(symdiff,                    dsCommand::symdiffCmd)
@@ -61,6 +64,7 @@ DS_FUNCTION_TABLE(get_contact_charge,         dsCommand::getContactCurrentCmd)
 DS_FUNCTION_TABLE(solve,                      dsCommand::solveCmd)
 DS_FUNCTION_TABLE(get_matrix_and_rhs,         dsCommand::getMatrixAndRHSCmd)
 DS_FUNCTION_TABLE(set_initial_condition,      dsCommand::setInitialConditionCmd)
+DS_FUNCTION_TABLE(get_thread_statistics,      dsCommand::getThreadStatisticsCmd)
 // Equation Commands
 DS_FUNCTION_TABLE(equation,                       dsCommand::createEquationCmd)
 DS_FUNCTION_TABLE(interface_equation,             dsCommand::createInterfaceEquationCmd)
@@ -951,10 +951,14 @@ R"(    devsim.load_devices (file)
     ----------
     file : str
        name of the file to load the meshes from
+
+    Notes
+    -----
+    Files written with the ``devsim_binary`` type of :meth:`devsim.write_devices` are detected automatically.
 )";
 
 static const char write_devices_doc[] =
-R"(    devsim.write_devices (file, device, type, include_test)
+R"(    devsim.write_devices (file, device, type, include_test, compress)
 
     Write a device to a file for visualization or restart
 
@@ -964,10 +968,16 @@ R"(    devsim.write_devices (file, device, type, include_test)
        name of the file to write the meshes to
     device : str, optional
        name of the device to write
-    type : {'devsim', 'devsim_data', 'tecplot', 'vtk'}
+    type : {'devsim', 'devsim_binary', 'devsim_data', 'tecplot', 'vtk'}
        format to use
     include_test : str
        Callback function which tests whether a model should be written to the tecplot or vtk format
+    compress : bool, optional
+       Compress the arrays of the ``devsim_binary`` format with zlib (default False)
+
+    Notes
+    -----
+    The ``devsim_binary`` format contains the same devices, models, and equations as the ``devsim`` format, and is loaded with :meth:`devsim.load_devices`.  The coordinates, elements, and model values are stored as little endian arrays, so the values are restored exactly.
 )";
 
 static const char contact_edge_model_doc[] =
@@ -1476,7 +1486,7 @@ R"(    devsim.get_edge_model_list (device, region)
 )";
 
 static const char get_edge_model_values_doc[] =
-R"(    devsim.get_edge_model_values (device, region, name)
+R"(    devsim.get_edge_model_values (device, region, name, buffer)
 
     Get the edge model values calculated at each edge.
 
@@ -1488,6 +1498,8 @@ R"(    devsim.get_edge_model_values (device, region, name)
        The selected region
     name : str
        Name of the edge model values being returned as a list
+    buffer : bool, optional
+       Copy the values once into a read only memoryview of doubles, instead of building an array.array.  numpy.asarray uses the memoryview without copying it again.  It is a snapshot of the values at the time of the call, not a view of the model, and is not changed when the model is recalculated (default False)
 )";
 
 static const char get_element_model_list_doc[] =
@@ -1504,7 +1516,7 @@ R"(    devsim.get_element_model_list (device, region)
 )";
 
 static const char get_element_model_values_doc[] =
-R"(    devsim.get_element_model_values (device, region, name)
+R"(    devsim.get_element_model_values (device, region, name, buffer)
 
     Get element model values at each element edge
 
@@ -1516,6 +1528,8 @@ R"(    devsim.get_element_model_values (device, region, name)
        The selected region
     name : str
        Name of the element edge model values being returned as a list
+    buffer : bool, optional
+       Copy the values once into a read only memoryview of doubles, instead of building an array.array.  numpy.asarray uses the memoryview without copying it again.  It is a snapshot of the values at the time of the call, not a view of the model, and is not changed when the model is recalculated (default False)
 )";
 
 static const char get_interface_model_list_doc[] =
@@ -1546,6 +1560,54 @@ R"(    devsim.get_interface_model_values (device, interface, name)
        Name of the interface model values being returned as a list
 )";
 
+static const char get_model_dependency_graph_doc[] =
+R"(    devsim.get_model_dependency_graph (device, region)
+
+    Returns the dependencies between the models on the device region
+
+    Parameters
+    ----------
+    device : str
+       The selected device
+    region : str
+       The selected region
+
+    Notes
+    -----
+
+    The result is a dictionary with an entry for each model, and for each parameter or other name that models depend on.  Each entry contains:
+
+    * ``type`` is ``node``, ``edge``, ``element``, or ``other``
+    * ``up_to_date`` is ``True`` when the model values do not need to be recalculated
+    * ``dependencies`` is the list of names the model depends on
+    * ``dependents`` is the list of models depending on this name
+    * ``transitive_dependents`` is the number of models marked out of date when this one changes
+
+    When a model changes, only its dependents, and their dependents, are marked out of date.  They are recalculated when their values are next requested.
+)";
+
+static const char get_model_values_table_doc[] =
+R"(    devsim.get_model_values_table (device, region, names, type)
+
+    Get the values of several models in a region as a two dimensional array, with one row for each model.
+
+    Parameters
+    ----------
+    device : str
+       The selected device
+    region : str
+       The selected region
+    names : list
+       Names of the models being returned
+    type : str, optional
+       Type of the models, which is "node", "edge", or "element" (default "node")
+
+    Notes
+    -----
+
+    The result is a read only ``memoryview`` of doubles with shape ``(len(names), n)``, where ``n`` is the number of nodes, edges, or element edges in the region.  It holds one copy of the values at the time of the call, which ``numpy.asarray`` uses without copying again.  The models are updated once, and models they depend on are shared between them.
+)";
+
 static const char get_node_model_list_doc[] =
 R"(    devsim.get_node_model_list (device, region)
 
@@ -1560,7 +1622,7 @@ R"(    devsim.get_node_model_list (device, region)
 )";
 
 static const char get_node_model_values_doc[] =
-R"(    devsim.get_node_model_values (device, region, name)
+R"(    devsim.get_node_model_values (device, region, name, buffer)
 
     Get node model values evaluated at each node in a region.
 
@@ -1572,6 +1634,8 @@ R"(    devsim.get_node_model_values (device, region, name)
        The selected region
     name : str
        Name of the node model values being returned as a list
+    buffer : bool, optional
+       Copy the values once into a read only memoryview of doubles, instead of building an array.array.  numpy.asarray uses the memoryview without copying it again.  It is a snapshot of the values at the time of the call, not a view of the model, and is not changed when the model is recalculated (default False)
 )";
 
 static const char interface_model_doc[] =
@@ -1783,7 +1847,24 @@ R"(    devsim.set_node_values (device, region, name, init_from, values)
     init_from : str, optional
        Node model we are using to initialize the node solution
     values : list, optional
-       List of values for each node in the region.
+       List of values for each node in the region.  A C contiguous buffer of doubles, such as a numpy array, is copied directly without converting each element.
+)";
+
+static const char set_node_values_table_doc[] =
+R"(    devsim.set_node_values_table (device, region, names, values)
+
+    Set the values of several node models in a region in one call.
+
+    Parameters
+    ----------
+    device : str
+       The selected device
+    region : str
+       The selected region
+    names : list
+       Names of the node models being set
+    values : list
+       Values with one row for each model, and one column for each node in the region, such as the result of :meth:`devsim.get_model_values_table`
 )";
 
 static const char symdiff_doc[] =
@@ -1892,6 +1973,26 @@ R"(    devsim.get_matrix_and_rhs (format)
        Option for returned matrix format.
 )";
 
+static const char get_thread_statistics_doc[] =
+R"(    devsim.get_thread_statistics (reset)
+
+    Returns a dictionary with the statistics of the thread pool used for model evaluation.
+
+    Parameters
+    ----------
+    reset : bool, optional
+       Reset the statistics after they are returned (default False)
+
+    Notes
+    -----
+
+    Model evaluations are run in parallel when the ``threads_available`` parameter is greater than 1, and the number of entries is greater than the ``threads_task_size`` parameter.  The entries are split into chunks of ``threads_chunk_size`` entries, which default to a quarter of the entries for each thread.  The workers are created once and reused.
+
+    When the ``threaded_region_assembly`` parameter is also set, the bulk equations of a device with more than one region are assembled by the pool, with one task for each region.  The equations within a region, and the contacts and interfaces, are still assembled serially.
+
+    The dictionary contains the number of ``threads`` in the pool, the number of parallel ``evaluations``, the number of ``tasks`` or chunks dispatched, the number of ``items`` processed, the ``min_chunk`` and ``max_chunk`` sizes, and the ``busy_time``, ``idle_time``, and ``wall_time`` in seconds.  The ``idle_time`` is the time the workers waited for the last worker in each evaluation.
+)";
+
 static const char set_initial_condition_doc[] =
 R"(    devsim.set_initial_condition (static_rhs, dynamic_rhs)
 
@@ -1906,13 +2007,13 @@ R"(    devsim.set_initial_condition (static_rhs, dynamic_rhs)
 )";
 
 static const char solve_doc[] =
-R"(    devsim.solve (type, solver_type, absolute_error, relative_error, maximum_error, charge_error, gamma, tdelta, maximum_iterations, maximum_divergence, frequency, output_node, info, symbolic_iteration_limit)
+R"(    devsim.solve (type, solver_type, absolute_error, relative_error, maximum_error, charge_error, gamma, tdelta, maximum_iterations, maximum_divergence, frequency, output_node, info, symbolic_iteration_limit, jacobian_reuse, jacobian_reuse_rate, line_search_steps, tstart, tstop, minimum_tdelta, maximum_tdelta, tdelta_growth, tdelta_shrink, transient_method, callback)
 
     Call the solver.  A small-signal AC source is set with the circuit voltage source.
 
     Parameters
     ----------
-    type : {'dc', 'ac', 'noise', 'transient_dc', 'transient_bdf1', 'transient_bdf2', 'transient_tr'} required
+    type : {'dc', 'ac', 'noise', 'transient_dc', 'transient_bdf1', 'transient_bdf2', 'transient_tr', 'transient_adaptive'} required
        type of solve being performed
     solver_type : {'direct', 'iterative'} required
        Linear solver type
@@ -1927,7 +2028,7 @@ R"(    devsim.solve (type, solver_type, absolute_error, relative_error, maximum_
     gamma : Float, optional
        Scaling factor for transient time step (default 1.0)
     tdelta : Float, optional
-       time step (default 0.0)
+       time step, or the initial time step for ``transient_adaptive`` (default 0.0)
     maximum_iterations : int, optional
        Maximum number of iterations in the DC solve (default 20)
     maximum_divergence : int, optional
@@ -1937,7 +2038,54 @@ R"(    devsim.solve (type, solver_type, absolute_error, relative_error, maximum_
     output_node : str, optional
        Output circuit node for noise simulation
     info : bool, optional
-       Solve command return convergence information (default False)
+       Solve command return convergence information (default False).  Each entry in ``iterations`` includes a profile of the iteration, see the notes below.
     symbolic_iteration_limit : int, optional
        Reuse symbolic matrix factorization after this number of iterations (default 1)
+    jacobian_reuse : int, optional
+       Maximum number of consecutive iterations reusing the previous matrix factorization with the direct solver (default 0)
+    jacobian_reuse_rate : Float, optional
+       The factorization is only reused while the norm of the right hand side decreases by this factor from the previous iteration (default 0.5)
+    line_search_steps : int, optional
+       Maximum number of times the Newton update is halved in a backtracking line search (default 0)
+    tstart : Float, optional
+       Starting time for ``transient_adaptive`` (default 0.0)
+    tstop : Float, optional
+       Final time for ``transient_adaptive`` (default 0.0)
+    minimum_tdelta : Float, optional
+       The ``transient_adaptive`` solve fails when the time step is reduced below this value (default 0.0)
+    maximum_tdelta : Float, optional
+       Maximum time step for ``transient_adaptive``, with no limit when 0 (default 0.0)
+    tdelta_growth : Float, optional
+       Maximum increase of the time step after an accepted step (default 2.0)
+    tdelta_shrink : Float, optional
+       Maximum reduction of the time step after a rejected step (default 0.2)
+    transient_method : {'bdf2', 'tr'}, optional
+       Integration method for ``transient_adaptive`` after the first step (default 'bdf2')
+    callback : Function, optional
+       Function called as ``callback(time=t)`` after each accepted ``transient_adaptive`` time step
+
+    Notes
+    -----
+
+    When ``info`` is ``True``, each entry in ``iterations`` contains these times in seconds:
+
+    * ``assembly_time`` loading the matrix and right hand side
+    * ``model_evaluation_time`` evaluating models during the iteration, which is part of the assembly time.  It is summed over the threads evaluating different regions.
+    * ``compression_time`` compressing the matrix
+    * ``linear_solver_time`` in the linear solver
+    * ``factorization_time`` in the matrix factorization.  ``symbolic_factorization`` is ``True`` when the factorization includes a new symbolic factorization, and ``jacobian_reused`` is ``True`` when the previous factorization was reused.
+    * ``back_substitution_time`` in the back substitution
+    * ``update_time`` updating the solution
+
+    and ``peak_memory_delta``, the increase in bytes of the peak resident memory of the process during the iteration.  When ``line_search_steps`` is set, ``step_factor`` is the fraction of the Newton update that was applied.
+
+    With the ``compiled_models`` parameter, ``shared_subexpression_evaluations`` is the number of subexpressions, shared by several node and edge models on a region, that were evaluated during the iteration, and ``shared_subexpression_reuses`` is the number of evaluations saved by using their stored values.
+
+    When ``jacobian_reuse`` is greater than 0, the solver uses a modified Newton method.  The matrix is still assembled every iteration, but the previous factorization is used to solve it for up to ``jacobian_reuse`` iterations, as long as the right hand side norm is reduced by at least ``jacobian_reuse_rate``.  Otherwise, or when the matrix sparsity pattern changes, the matrix is factored again.  The factorization is not kept between calls to ``solve``.
+
+    When ``line_search_steps`` is greater than 0, the right hand side is assembled again after each update.  If its norm did not decrease, the solution is restored and half of the update is applied, up to ``line_search_steps`` times.  A damped update only converges if the errors would also meet the ``absolute_error`` and ``relative_error`` for the full update.  The ``log_damp`` update type of the equation command damps the potential update on each node instead.
+
+    The ``transient_adaptive`` type integrates from ``tstart`` to ``tstop``, starting from a ``transient_dc`` or previous transient solution.  The first time step uses ``transient_bdf1``, and the following steps use variable step ``transient_bdf2`` or ``transient_tr``.  The charge is extrapolated from the previously accepted time points, and the difference with the solved charge estimates the local truncation error.  A step is rejected when this error, relative to the charge, exceeds ``charge_error``, which must be greater than 0.  The next time step is scaled by the estimated error, within the ``tdelta_growth`` and ``tdelta_shrink`` limits, and is reduced by a factor of 4 when the Newton iteration does not converge.  Circuit sources are held at their current values for the whole solve, and the ``callback`` may be used to record results at each time point.
+
+    The command returns the list of accepted time points.  When ``info`` is ``True``, it returns a dictionary with ``converged``, ``time_points``, the final ``time``, the numbers of ``accepted_steps``, ``rejected_steps`` and ``failed_steps``, and ``steps``.  Each entry in ``steps`` contains the ``time`` and ``tdelta`` attempted, the ``method``, the ``status`` (``accepted``, ``rejected``, or ``diverged``), and the ``truncation_error``, which is -1 when the Newton iteration did not converge.
 )";
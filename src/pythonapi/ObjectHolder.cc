@@ -118,6 +118,93 @@ ObjectHolder::ObjectHolder(bool tval)
 }
 
 
+DoubleBuffer::DoubleBuffer(const ObjectHolder &input) : view_(nullptr), data_(nullptr), size_(0), is_buffer_(false)
+{
+  EnsurePythonGIL gil;
+
+  PyObject *obj = reinterpret_cast<PyObject *>(const_cast<void *>(input.GetObject()));
+
+  //// bytes are handled by GetArrayFromBytes
+  if (!obj || PyBytes_Check(obj) || PyByteArray_Check(obj) || PyUnicode_Check(obj))
+  {
+    return;
+  }
+
+  auto is_double_format = [](const std::string &format) {
+    return (format == "d") || (format == "@d") || (format == "=d");
+  };
+
+#if !defined(Py_LIMITED_API) || (Py_LIMITED_API+0 >= 0x030B0000)
+  if (!PyObject_CheckBuffer(obj))
+  {
+    return;
+  }
+
+  Py_buffer *view = new Py_buffer;
+  if (PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0)
+  {
+    PyErr_Clear();
+    delete view;
+    return;
+  }
+  view_ = view;
+
+  is_buffer_ = true;
+  if ((view->itemsize == sizeof(double)) && view->format && is_double_format(view->format))
+  {
+    data_ = reinterpret_cast<const double *>(view->buf);
+    size_ = view->len / sizeof(double);
+  }
+#else
+  //// Before Python 3.11, the buffer protocol is not in the limited API,
+  //// so the memoryview attributes are used to check the layout, and its
+  //// data are copied once with tobytes
+  ObjectHolder mv(PyMemoryView_FromObject(obj));
+  PyErr_Clear();
+  if (mv.empty())
+  {
+    return;
+  }
+
+  is_buffer_ = true;
+  PyObject *mobj = reinterpret_cast<PyObject *>(mv.GetObject());
+
+  ObjectHolder format(PyObject_GetAttrString(mobj, "format"));
+  ObjectHolder itemsize(PyObject_GetAttrString(mobj, "itemsize"));
+  ObjectHolder contiguous(PyObject_GetAttrString(mobj, "c_contiguous"));
+  PyErr_Clear();
+
+  if (is_double_format(format.GetString()) && (itemsize.GetLong().second == sizeof(double)) && contiguous.GetBoolean().second)
+  {
+    bytes_ = ObjectHolder(PyObject_CallMethod(mobj, "tobytes", nullptr));
+    PyErr_Clear();
+
+    char *data = nullptr;
+    Py_ssize_t length = 0;
+    if (!bytes_.empty() && (PyBytes_AsStringAndSize(reinterpret_cast<PyObject *>(bytes_.GetObject()), &data, &length) != -1))
+    {
+      data_ = reinterpret_cast<const double *>(data);
+      size_ = length / sizeof(double);
+    }
+    PyErr_Clear();
+  }
+#endif
+}
+
+DoubleBuffer::~DoubleBuffer()
+{
+#if !defined(Py_LIMITED_API) || (Py_LIMITED_API+0 >= 0x030B0000)
+  if (view_)
+  {
+    EnsurePythonGIL gil;
+
+    Py_buffer *view = reinterpret_cast<Py_buffer *>(view_);
+    PyBuffer_Release(view);
+    delete view;
+  }
+#endif
+}
+
 namespace {
 
 //https://stackoverflow.com/questions/5356773/python-get-string-representation-of-pyobject
@@ -493,6 +580,14 @@ bool GetArrayFromBytes(const ObjectHolder &input, std::vector<T> &values, const
   return !values.empty();
 }
 
+bool GetDoubleBuffer(const ObjectHolder &input, std::vector<double> &values, bool &is_buffer)
+{
+  DoubleBuffer buffer(input);
+  is_buffer = buffer.IsBuffer();
+  values.assign(buffer.begin(), buffer.end());
+  return !values.empty();
+}
+
 template <typename T, typename U>
 void convert_to_unsigned(const std::vector<T> &in, std::vector<U> &out)
 {
@@ -506,7 +601,12 @@ void convert_to_unsigned(const std::vector<T> &in, std::vector<U> &out)
 
 bool ObjectHolder::GetDoubleList(std::vector<double> &values) const
 {
-  if (!GetArrayFromBytes<double>(*this, values, pod_info<double>::ptype, sizeof(double)))
+  bool is_buffer = false;
+  if (GetDoubleBuffer(*this, values, is_buffer))
+  {
+    return true;
+  }
+  else if (is_buffer || !GetArrayFromBytes<double>(*this, values, pod_info<double>::ptype, sizeof(double)))
   {
     return GetFromList<double>(*this, values);
   }
@@ -763,6 +863,69 @@ ObjectHolder CreateComplexDoublePODArray(const dsMath::ComplexDoubleVec_t<double
   return CreatePODArray<double>(reinterpret_cast<const double *>(list.data()), sizeof(std::complex<double>) * list.size());
 }
 
+namespace {
+//// The bytes object owns the copy, so the memoryview is not affected when the
+//// model values are later recalculated or deleted.
+ObjectHolder AllocateBuffer(size_t length, double *&output)
+{
+  ObjectHolder bytes(PyBytes_FromStringAndSize(nullptr, sizeof(double) * length));
+  PyErr_Clear();
+  dsAssert(!bytes.empty(), "could not allocate buffer");
+
+  output = reinterpret_cast<double *>(PyBytes_AsString(reinterpret_cast<PyObject *>(bytes.GetObject())));
+  return bytes;
+}
+
+//// a shape with zero rows is one dimensional
+ObjectHolder CastBuffer(const ObjectHolder &bytes, size_t rows, size_t columns)
+{
+  ObjectHolder view(PyMemoryView_FromObject(reinterpret_cast<PyObject *>(const_cast<void *>(bytes.GetObject()))));
+  PyErr_Clear();
+  dsAssert(!view.empty(), "could not create memoryview");
+
+  PyObject *vobj = reinterpret_cast<PyObject *>(view.GetObject());
+  ObjectHolder result;
+  if (rows)
+  {
+    result = ObjectHolder(PyObject_CallMethod(vobj, "cast", "s(nn)", pod_info<double>::ptype, static_cast<Py_ssize_t>(rows), static_cast<Py_ssize_t>(columns)));
+  }
+  else
+  {
+    result = ObjectHolder(PyObject_CallMethod(vobj, "cast", "s", pod_info<double>::ptype));
+  }
+  PyErr_Clear();
+  dsAssert(!result.empty(), "could not cast memoryview");
+
+  return result;
+}
+
+template <typename T>
+ObjectHolder CreateBufferCopy(const T *data, size_t length)
+{
+  EnsurePythonGIL gil;
+
+  double *output = nullptr;
+  ObjectHolder bytes = AllocateBuffer(length, output);
+  std::transform(data, data + length, output, [](const T &x){return static_cast<double>(x);});
+
+  return CastBuffer(bytes, 0, length);
+}
+}
+
+ObjectHolder CreateDoubleBufferCopy(size_t rows, size_t columns, double *&output)
+{
+  EnsurePythonGIL gil;
+
+  ObjectHolder bytes = AllocateBuffer(rows * columns, output);
+
+  return CastBuffer(bytes, rows, columns);
+}
+
+ObjectHolder CreateDoubleBufferCopy(const dsMath::DoubleVec_t<double> &list)
+{
+  return CreateBufferCopy(list.data(), list.size());
+}
+
 #ifdef DEVSIM_EXTENDED_PRECISION
 #include "Float128.hh"
 #include "dsMathTypes.hh"
@@ -776,6 +939,11 @@ ObjectHolder CreateDoublePODArray(const dsMath::DoubleVec_t<float128> &list)
   return CreatePODArray<double>(tmp);
 }
 
+ObjectHolder CreateDoubleBufferCopy(const dsMath::DoubleVec_t<float128> &list)
+{
+  return CreateBufferCopy(list.data(), list.size());
+}
+
 ObjectHolder CreateComplexDoublePODArray(const dsMath::ComplexDoubleVec_t<float128> &list)
 {
   thread_local dsMath::ComplexDoubleVec_t<double> tmp;
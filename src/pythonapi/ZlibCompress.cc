@@ -15,7 +15,8 @@ SPDX-License-Identifier: Apache-2.0
 #include <cstring>
 
 
-bool DEVSIMZlibCompress(std::vector<char> &output, char *input, size_t input_length)
+namespace {
+bool CallZlib(const char *method, std::vector<char> &output, char *input, size_t input_length)
 {
   EnsurePythonGIL gil;
 
@@ -43,7 +44,7 @@ bool DEVSIMZlibCompress(std::vector<char> &output, char *input, size_t input_len
     return ret;
   };
 
-  auto compress_method = get_callable(mod_importer("zlib"), "compress");
+  auto compress_method = get_callable(mod_importer("zlib"), method);
 
 #if 1
 // https://github.com/python/cpython/issues/98680
@@ -56,7 +57,7 @@ bool DEVSIMZlibCompress(std::vector<char> &output, char *input, size_t input_len
   auto double_data = ObjectHolder(input, input_length);
 #endif
 
-  auto compressed_data = call_method(compress_method, double_data, "issue compressing data");
+  auto compressed_data = call_method(compress_method, double_data, std::string("issue calling zlib.") + method);
 
   auto pyobj = reinterpret_cast<PyObject *>(compressed_data.GetObject());
 
@@ -71,3 +72,14 @@ bool DEVSIMZlibCompress(std::vector<char> &output, char *input, size_t input_len
 
   return true;
 }
+}
+
+bool DEVSIMZlibCompress(std::vector<char> &output, char *input, size_t input_length)
+{
+  return CallZlib("compress", output, input, input_length);
+}
+
+bool DEVSIMZlibDecompress(std::vector<char> &output, char *input, size_t input_length)
+{
+  return CallZlib("decompress", output, input, input_length);
+}
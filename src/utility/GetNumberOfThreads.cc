@@ -8,22 +8,24 @@ SPDX-License-Identifier: Apache-2.0
 #include "GlobalData.hh"
 #include "ObjectHolder.hh"
 #include "OutputStream.hh"
+#include <algorithm>
 #include <sstream>
 #include <string>
 
 namespace ThreadInfo {
-size_t GetNumberOfThreads()
+namespace {
+size_t GetSizeParameter(const char *name)
 {
   size_t ret = 0;
   GlobalData &gdata = GlobalData::GetInstance();
-  GlobalData::DBEntry_t dbent = gdata.GetDBEntryOnGlobal("threads_available");
+  GlobalData::DBEntry_t dbent = gdata.GetDBEntryOnGlobal(name);
   if (dbent.first)
   {
     ObjectHolder::IntegerEntry_t ient = dbent.second.GetInteger();
     if (!ient.first || ient.second < 0)
     {
       std::ostringstream os;
-      os << "Expected valid positive number for \"threads_available\" parameter, but " << dbent.second.GetString() << " was given.\n";
+      os << "Expected valid positive number for \"" << name << "\" parameter, but " << dbent.second.GetString() << " was given.\n";
       OutputStream::WriteOut(OutputStream::OutputType::INFO, os.str());
       ret = 0;
     }
@@ -35,29 +37,28 @@ size_t GetNumberOfThreads()
 
   return ret;
 }
+}
+
+size_t GetNumberOfThreads()
+{
+  return GetSizeParameter("threads_available");
+}
 
 size_t GetMinimumTaskSize()
 {
-  size_t ret = 0;
-  GlobalData &gdata = GlobalData::GetInstance();
-  GlobalData::DBEntry_t dbent = gdata.GetDBEntryOnGlobal("threads_task_size");
-  if (dbent.first)
+  return GetSizeParameter("threads_task_size");
+}
+
+size_t GetChunkSize(size_t length, size_t num_threads)
+{
+  size_t ret = GetSizeParameter("threads_chunk_size");
+  if (ret == 0)
   {
-    ObjectHolder::IntegerEntry_t ient = dbent.second.GetInteger();
-    if (!ient.first || ient.second < 0)
-    {
-      std::ostringstream os;
-      os << "Expected valid positive number for \"threads_task_size\" parameter, but " << dbent.second.GetString() << " was given.\n";
-      OutputStream::WriteOut(OutputStream::OutputType::INFO, os.str());
-      ret = 0;
-    }
-    else
-    {
-      ret = ient.second;
-    }
+    //// several chunks per thread, so that faster threads take more of them
+    const size_t num_chunks = 4 * std::max<size_t>(num_threads, 1);
+    ret = (length + num_chunks - 1) / num_chunks;
   }
-
-  return ret;
+  return std::max<size_t>(ret, 1);
 }
 }
 
@@ -13,6 +13,9 @@ namespace ThreadInfo {
 size_t GetNumberOfThreads();
 
 size_t GetMinimumTaskSize();
+
+//// size of the chunks a range is split into for the thread pool
+size_t GetChunkSize(size_t /*length*/, size_t /*num_threads*/);
 }
 
 #endif
@@ -0,0 +1,214 @@
+/***
+DEVSIM
+Copyright 2026 DEVSIM LLC
+
+SPDX-License-Identifier: Apache-2.0
+***/
+
+#include "ThreadPool.hh"
+#include "FPECheck.hh"
+#include <algorithm>
+#include <chrono>
+
+namespace ThreadInfo {
+
+namespace {
+typedef std::chrono::steady_clock clock_type;
+
+double seconds_since(const clock_type::time_point &tic)
+{
+  return std::chrono::duration<double>(clock_type::now() - tic).count();
+}
+
+//// set in the pool workers, which run nested evaluations themselves
+thread_local bool in_worker = false;
+}
+
+ThreadPool *ThreadPool::instance = nullptr;
+
+ThreadPool &ThreadPool::GetInstance()
+{
+  if (!instance)
+  {
+    instance = new ThreadPool;
+  }
+  return *instance;
+}
+
+ThreadPool::ThreadPool() : task_(nullptr), generation_(0), participants_(0), remaining_(0), length_(0), chunk_size_(1), next_(0)
+{
+}
+
+ThreadPool::~ThreadPool()
+{
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    participants_ = workers_.size() + 1;
+    task_ = nullptr;
+    ++generation_;
+  }
+  start_cv_.notify_all();
+  for (auto &w : workers_)
+  {
+    w.join();
+  }
+}
+
+void ThreadPool::Resize(size_t num_threads)
+{
+  std::lock_guard<std::mutex> lock(mutex_);
+  busy_times_.resize(std::max(busy_times_.size(), num_threads));
+  //// workers are kept when the number of threads is reduced, and they
+  //// wait until they are needed again
+  for (size_t i = workers_.size(); i < num_threads; ++i)
+  {
+    workers_.emplace_back(&ThreadPool::WorkerLoop, this, i);
+  }
+  statistics_.threads = workers_.size();
+}
+
+void ThreadPool::WorkerLoop(size_t id)
+{
+  in_worker = true;
+
+  size_t seen = 0;
+  while (true)
+  {
+    const Task_t *task = nullptr;
+    {
+      std::unique_lock<std::mutex> lock(mutex_);
+      start_cv_.wait(lock, [&]{return (generation_ != seen) && (id < participants_);});
+      seen = generation_;
+      task = task_;
+    }
+
+    //// a null task stops the worker
+    if (!task)
+    {
+      return;
+    }
+
+    const auto tic = clock_type::now();
+    std::exception_ptr error;
+    try
+    {
+      for (size_t b = next_.fetch_add(chunk_size_); b < length_; b = next_.fetch_add(chunk_size_))
+      {
+        (*task)(id, b, std::min(b + chunk_size_, length_));
+      }
+    }
+    catch (...)
+    {
+      error = std::current_exception();
+      //// the remaining chunks are skipped
+      next_ = length_;
+    }
+    const double busy = seconds_since(tic);
+
+    {
+      std::lock_guard<std::mutex> lock(mutex_);
+      busy_times_[id] = busy;
+      if (error && !error_)
+      {
+        error_ = error;
+      }
+      if (--remaining_ == 0)
+      {
+        done_cv_.notify_one();
+      }
+    }
+  }
+}
+
+void ThreadPool::Run(size_t num_threads, size_t length, size_t chunk_size, const Task_t &task)
+{
+  if (length == 0)
+  {
+    return;
+  }
+
+  //// A task calling Run would wait for the workers, including itself, so
+  //// the nested range is processed in the calling worker.  Its floating
+  //// point exception flags are kept, since the task may clear them.
+  if (in_worker)
+  {
+    const FPECheck::FPEFlag_t flags = FPECheck::getFPEFlags();
+    task(0, 0, length);
+    FPECheck::raiseFPE(flags);
+    return;
+  }
+
+  //// one evaluation at a time
+  std::lock_guard<std::mutex> run_lock(run_mutex_);
+
+  const auto tic = clock_type::now();
+
+  num_threads = std::max<size_t>(num_threads, 1);
+  chunk_size  = std::max<size_t>(chunk_size, 1);
+
+  Resize(num_threads);
+
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    task_         = &task;
+    error_        = nullptr;
+    length_       = length;
+    chunk_size_   = chunk_size;
+    next_         = 0;
+    participants_ = num_threads;
+    remaining_    = num_threads;
+    std::fill(busy_times_.begin(), busy_times_.begin() + num_threads, 0.0);
+    ++generation_;
+  }
+  start_cv_.notify_all();
+
+  std::exception_ptr error;
+  {
+    std::unique_lock<std::mutex> lock(mutex_);
+    done_cv_.wait(lock, [&]{return remaining_ == 0;});
+    task_ = nullptr;
+    error = error_;
+
+    const double wall_time = seconds_since(tic);
+    double busy_time = 0.0;
+    for (size_t i = 0; i < num_threads; ++i)
+    {
+      busy_time += busy_times_[i];
+    }
+
+    const size_t tasks     = (length + chunk_size - 1) / chunk_size;
+    const size_t last      = length - (tasks - 1) * chunk_size;
+    const size_t min_chunk = std::min(chunk_size, last);
+
+    auto &s = statistics_;
+    s.min_chunk = (s.evaluations == 0) ? min_chunk : std::min(s.min_chunk, min_chunk);
+    s.max_chunk = std::max(s.max_chunk, std::min(chunk_size, length));
+    s.evaluations += 1;
+    s.tasks       += tasks;
+    s.items       += length;
+    s.busy_time   += busy_time;
+    s.idle_time   += std::max(0.0, wall_time * num_threads - busy_time);
+    s.wall_time   += wall_time;
+  }
+
+  if (error)
+  {
+    std::rethrow_exception(error);
+  }
+}
+
+PoolStatistics ThreadPool::GetStatistics() const
+{
+  std::lock_guard<std::mutex> lock(mutex_);
+  return statistics_;
+}
+
+void ThreadPool::ResetStatistics()
+{
+  std::lock_guard<std::mutex> lock(mutex_);
+  const size_t threads = statistics_.threads;
+  statistics_ = PoolStatistics();
+  statistics_.threads = threads;
+}
+}
+
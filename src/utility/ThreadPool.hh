@@ -0,0 +1,84 @@
+/***
+DEVSIM
+Copyright 2026 DEVSIM LLC
+
+SPDX-License-Identifier: Apache-2.0
+***/
+
+#ifndef THREAD_POOL_HH
+#define THREAD_POOL_HH
+
+#include <atomic>
+#include <condition_variable>
+#include <cstddef>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace ThreadInfo {
+
+struct PoolStatistics {
+  size_t threads     = 0; // workers in the pool
+  size_t evaluations = 0; // calls to Run
+  size_t tasks       = 0; // chunks processed
+  size_t items       = 0; // entries processed
+  size_t min_chunk   = 0;
+  size_t max_chunk   = 0;
+  double busy_time   = 0.0; // summed over the workers
+  double idle_time   = 0.0; // time workers waited for the last one to finish
+  double wall_time   = 0.0;
+};
+
+//// Persistent workers shared by all of the threaded model evaluations.
+//// The range is split into chunks, and each worker claims the next chunk
+//// from a single shared counter when it finishes the previous one.  There
+//// are no per worker queues, so no work is stolen.
+class ThreadPool {
+  public:
+    typedef std::function<void(size_t /*worker*/, size_t /*beg*/, size_t /*end*/)> Task_t;
+
+    static ThreadPool &GetInstance();
+
+    //// Returns when all of the chunks in [0, length) are processed.
+    //// The calling thread only waits, so that its floating point exception
+    //// flags are not cleared by the task.  When called from a task, the
+    //// whole range is processed as worker 0 in the calling worker.
+    void Run(size_t num_threads, size_t length, size_t chunk_size, const Task_t &);
+
+    PoolStatistics GetStatistics() const;
+    void ResetStatistics();
+
+  private:
+    ThreadPool();
+    //// not called, so that workers are not joined during process exit
+    ~ThreadPool();
+    ThreadPool(const ThreadPool &) = delete;
+    ThreadPool &operator=(const ThreadPool &) = delete;
+
+    void Resize(size_t);
+    void WorkerLoop(size_t);
+
+    static ThreadPool *instance;
+
+    std::mutex                run_mutex_;
+    mutable std::mutex        mutex_;
+    std::condition_variable   start_cv_;
+    std::condition_variable   done_cv_;
+    std::vector<std::thread>  workers_;
+    std::vector<double>       busy_times_;
+    const Task_t             *task_;
+    std::exception_ptr        error_;
+    size_t                    generation_;
+    size_t                    participants_;
+    size_t                    remaining_;
+    size_t                    length_;
+    size_t                    chunk_size_;
+    std::atomic<size_t>       next_;
+    PoolStatistics            statistics_;
+};
+}
+
+#endif
+
@@ -8,8 +8,20 @@ SPDX-License-Identifier: Apache-2.0
 #include "dsTimer.hh"
 
 #include <sstream>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <vector>
+#include <algorithm>
 
-dsTimer::dsTimer(const std::string &msg, OutputStream::OutputType outtype) : msg_(msg), output_type_(outtype), tic_(std::chrono::system_clock::now())
+#if defined(_WIN32)
+#include <windows.h>
+#include <psapi.h>
+#else
+#include <sys/resource.h>
+#endif
+
+dsTimer::dsTimer(const std::string &msg, OutputStream::OutputType outtype) : msg_(msg), output_type_(outtype), tic_(std::chrono::steady_clock::now())
 {
   std::ostringstream os;
   os << "\nBEGIN " << msg_ << "\n";
@@ -18,11 +30,7 @@ dsTimer::dsTimer(const std::string &msg, OutputStream::OutputType outtype) : msg
 
 dsTimer::~dsTimer()
 {
-  auto toc = std::chrono::system_clock::now();
-
-  typedef std::chrono::duration<double> seconds;
-
-  auto timediff = std::chrono::duration_cast<seconds>(toc - tic_).count();
+  auto timediff = GetElapsedTime();
 
   try
   {
@@ -35,3 +43,118 @@ dsTimer::~dsTimer()
   }
 }
 
+double dsTimer::GetElapsedTime() const
+{
+  auto toc = std::chrono::steady_clock::now();
+
+  typedef std::chrono::duration<double> seconds;
+
+  return std::chrono::duration_cast<seconds>(toc - tic_).count();
+}
+
+size_t dsTimer::GetPeakMemory()
+{
+  size_t ret = 0;
+#if defined(_WIN32)
+  PROCESS_MEMORY_COUNTERS pmc;
+  if (K32GetProcessMemoryInfo(GetCurrentProcess(), &pmc, sizeof(pmc)))
+  {
+    ret = pmc.PeakWorkingSetSize;
+  }
+#else
+  struct rusage usage;
+  if (getrusage(RUSAGE_SELF, &usage) == 0)
+  {
+#if defined(__APPLE__)
+    //// bytes
+    ret = usage.ru_maxrss;
+#else
+    //// kilobytes
+    ret = static_cast<size_t>(usage.ru_maxrss) * 1024;
+#endif
+  }
+#endif
+  return ret;
+}
+
+namespace {
+//// totals with an outer section running on this thread
+thread_local std::vector<const dsTimerTotal *> active_totals;
+}
+
+dsTimerTotal::Section::Section(dsTimerTotal &total) : total_(total), outer_(false)
+{
+  outer_ = std::find(active_totals.begin(), active_totals.end(), &total_) == active_totals.end();
+  if (outer_)
+  {
+    active_totals.push_back(&total_);
+    tic_ = std::chrono::steady_clock::now();
+  }
+}
+
+dsTimerTotal::Section::~Section()
+{
+  if (outer_)
+  {
+    auto toc = std::chrono::steady_clock::now();
+    total_.nanoseconds_ += std::chrono::duration_cast<std::chrono::nanoseconds>(toc - tic_).count();
+    active_totals.erase(std::find(active_totals.begin(), active_totals.end(), &total_));
+  }
+}
+
+dsTimerTotal::dsTimerTotal() : nanoseconds_(0)
+{
+}
+
+dsTimerTotal &dsTimerTotal::GetInstance(const std::string &name)
+{
+  static std::mutex mutex;
+  //// not destroyed, so that sections may still close during process exit
+  static auto totals = new std::map<std::string, std::unique_ptr<dsTimerTotal>>();
+
+  std::lock_guard<std::mutex> lock(mutex);
+  auto &ret = (*totals)[name];
+  if (!ret)
+  {
+    ret.reset(new dsTimerTotal());
+  }
+  return *ret;
+}
+
+double dsTimerTotal::GetTime() const
+{
+  return 1.0e-9 * nanoseconds_.load();
+}
+
+void dsTimerTotal::Reset()
+{
+  nanoseconds_ = 0;
+}
+
+dsCounterTotal::dsCounterTotal() : count_(0)
+{
+}
+
+dsCounterTotal &dsCounterTotal::GetInstance(const std::string &name)
+{
+  static std::mutex mutex;
+  static auto totals = new std::map<std::string, std::unique_ptr<dsCounterTotal>>();
+
+  std::lock_guard<std::mutex> lock(mutex);
+  auto &ret = (*totals)[name];
+  if (!ret)
+  {
+    ret.reset(new dsCounterTotal());
+  }
+  return *ret;
+}
+
+size_t dsCounterTotal::GetCount() const
+{
+  return count_.load();
+}
+
+void dsCounterTotal::Reset()
+{
+  count_ = 0;
+}
@@ -10,18 +10,78 @@ SPDX-License-Identifier: Apache-2.0
 #include "OutputStream.hh"
 #include <string>
 #include <chrono>
+#include <atomic>
+#include <cstddef>
 
 class dsTimer {
   public:
     dsTimer(const std::string &/*token*/, OutputStream::OutputType outtype = OutputStream::OutputType::VERBOSE2);
     ~dsTimer();
+
+    //// seconds since construction
+    double GetElapsedTime() const;
+
+    //// peak resident memory of the process in bytes, 0 if not available
+    static size_t GetPeakMemory();
+
   private:
     dsTimer(const dsTimer &);
     dsTimer &operator=(const dsTimer &);
 
     const                    std::string msg_;
     OutputStream::OutputType output_type_;
-    std::chrono::time_point<std::chrono::system_clock> tic_;
+    std::chrono::time_point<std::chrono::steady_clock> tic_;
 };
-#endif
 
+//// Running total of the time spent in a section of code, which may run on several threads at once.
+//// The time is summed over the threads.  Nested sections of the same total on one thread are counted once.
+class dsTimerTotal {
+  public:
+    class Section {
+      public:
+        explicit Section(dsTimerTotal &);
+        ~Section();
+      private:
+        Section(const Section &);
+        Section &operator=(const Section &);
+
+        dsTimerTotal &total_;
+        bool          outer_;
+        std::chrono::time_point<std::chrono::steady_clock> tic_;
+    };
+
+    static dsTimerTotal &GetInstance(const std::string &/*name*/);
+
+    //// seconds
+    double GetTime() const;
+    void Reset();
+
+  private:
+    dsTimerTotal();
+    dsTimerTotal(const dsTimerTotal &);
+    dsTimerTotal &operator=(const dsTimerTotal &);
+
+    std::atomic<long long> nanoseconds_;
+};
+
+//// Running count of an event, which may happen on several threads at once.
+class dsCounterTotal {
+  public:
+    static dsCounterTotal &GetInstance(const std::string &/*name*/);
+
+    void Add(size_t n)
+    {
+      count_ += n;
+    }
+
+    size_t GetCount() const;
+    void Reset();
+
+  private:
+    dsCounterTotal();
+    dsCounterTotal(const dsCounterTotal &);
+    dsCounterTotal &operator=(const dsCounterTotal &);
+
+    std::atomic<size_t> count_;
+};
+#endif
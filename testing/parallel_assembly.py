@@ -0,0 +1,138 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# a diode split into three regions, solved with the regions assembled serially
+# and in parallel, which must give identical solutions
+
+import devsim
+
+from devsim.python_packages.model_create import CreateNodeModel, CreateSolution
+from devsim.python_packages.simple_physics import (
+    CreateSiliconDriftDiffusion,
+    CreateSiliconDriftDiffusionAtContact,
+    CreateSiliconOxideInterface,
+    CreateSiliconPotentialOnly,
+    CreateSiliconPotentialOnlyContact,
+    CreateSiliconSiliconInterface,
+    GetContactBiasName,
+    PrintCurrents,
+    SetSiliconParameters,
+)
+
+device = "dio3"
+# region, first tag, second tag, acceptors, donors
+regions = (
+    ("p", "top", "pn", 1e18, 0.0),
+    ("n", "pn", "nn", 0.0, 1e16),
+    ("nplus", "nn", "bot", 0.0, 1e18),
+)
+interfaces = ("pn", "nn")
+contacts = (("top", "p"), ("bot", "nplus"))
+
+devsim.create_1d_mesh(mesh=device)
+devsim.add_1d_mesh_line(mesh=device, pos=0, ps=1e-7, tag="top")
+devsim.add_1d_mesh_line(mesh=device, pos=0.5e-5, ps=1e-8, tag="pn")
+devsim.add_1d_mesh_line(mesh=device, pos=0.75e-5, ps=1e-8, tag="nn")
+devsim.add_1d_mesh_line(mesh=device, pos=1e-5, ps=1e-7, tag="bot")
+for c, r in contacts:
+    devsim.add_1d_contact(mesh=device, name=c, tag=c, material="metal")
+for i in interfaces:
+    devsim.add_1d_interface(mesh=device, name=i, tag=i)
+for r, tag1, tag2, _acceptors, _donors in regions:
+    devsim.add_1d_region(mesh=device, material="Si", region=r, tag1=tag1, tag2=tag2)
+devsim.finalize_mesh(mesh=device)
+devsim.create_device(mesh=device, device=device)
+
+for r, _tag1, _tag2, acceptors, donors in regions:
+    SetSiliconParameters(device, r, 300)
+    CreateNodeModel(device, r, "Acceptors", "%g" % acceptors)
+    CreateNodeModel(device, r, "Donors", "%g" % donors)
+    CreateNodeModel(device, r, "NetDoping", "Donors-Acceptors")
+    CreateSolution(device, r, "Potential")
+    CreateSiliconPotentialOnly(device, r)
+for c, r in contacts:
+    devsim.set_parameter(device=device, name=GetContactBiasName(c), value=0.0)
+    CreateSiliconPotentialOnlyContact(device, r, c)
+for i in interfaces:
+    CreateSiliconOxideInterface(device, i)
+
+
+def get_state(names):
+    return {
+        (r, n): list(devsim.get_node_model_values(device=device, region=r, name=n))
+        for r, _tag1, _tag2, _acceptors, _donors in regions
+        for n in names
+    }
+
+
+def set_state(state):
+    for (r, n), values in state.items():
+        devsim.set_node_values(device=device, region=r, name=n, values=values)
+
+
+def solve_both(label, names, **kwargs):
+    """
+    solves from the same starting state with serial and parallel assembly
+    """
+    start = get_state(names)
+    results = []
+    for threads, threaded_assembly in ((1, False), (2, True)):
+        set_state(start)
+        devsim.set_parameter(name="threads_available", value=threads)
+        devsim.set_parameter(name="threaded_region_assembly", value=threaded_assembly)
+        info = devsim.solve(type="dc", info=True, **kwargs)
+        if not info["converged"]:
+            raise RuntimeError("%s did not converge with %d threads" % (label, threads))
+        results.append((len(info["iterations"]), get_state(names)))
+
+    (serial_iterations, serial), (threaded_iterations, threaded) = results
+    if threaded_iterations != serial_iterations:
+        raise RuntimeError("%s iterations differ" % label)
+    for key, values in serial.items():
+        if threaded[key] != values:
+            raise RuntimeError("%s %s %s differs" % (label, key[0], key[1]))
+    print(
+        "%s %d iterations, parallel assembly matches serial"
+        % (label, serial_iterations)
+    )
+
+
+# a small task size, so that the model evaluations are also threaded
+devsim.set_parameter(name="threads_task_size", value=64)
+
+solve_both(
+    "potential",
+    ("Potential",),
+    absolute_error=1.0,
+    relative_error=1e-12,
+    maximum_iterations=30,
+)
+
+for r, _tag1, _tag2, _acceptors, _donors in regions:
+    CreateSolution(device, r, "Electrons")
+    CreateSolution(device, r, "Holes")
+    devsim.set_node_values(
+        device=device, region=r, name="Electrons", init_from="IntrinsicElectrons"
+    )
+    devsim.set_node_values(
+        device=device, region=r, name="Holes", init_from="IntrinsicHoles"
+    )
+    CreateSiliconDriftDiffusion(device, r)
+for c, r in contacts:
+    CreateSiliconDriftDiffusionAtContact(device, r, c)
+for i in interfaces:
+    CreateSiliconSiliconInterface(device, i)
+
+names = ("Potential", "Electrons", "Holes")
+for bias in (0.0, 0.3, 0.6):
+    devsim.set_parameter(device=device, name=GetContactBiasName("top"), value=bias)
+    solve_both(
+        "drift diffusion %g" % bias,
+        names,
+        absolute_error=1e10,
+        relative_error=1e-10,
+        maximum_iterations=30,
+    )
+    for c, _r in contacts:
+        PrintCurrents(device, c)
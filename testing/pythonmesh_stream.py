@@ -0,0 +1,164 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# stream_gmsh_file on gmsh 2.2 ascii and binary files with sparse node numbers,
+# element types mixed within the $Elements section, and $PhysicalNames after
+# $Elements
+
+from devsim import (
+    add_gmsh_contact,
+    add_gmsh_interface,
+    add_gmsh_region,
+    create_device,
+    create_gmsh_mesh,
+    finalize_mesh,
+    get_contact_list,
+    get_element_node_list,
+    get_interface_list,
+    get_node_model_values,
+    get_region_list,
+)
+
+from devsim.python_packages.pythonmesh import read_gmsh_file, stream_gmsh_file
+
+import array
+import struct
+
+nx = 4
+ny = 2
+
+
+def node(i, j):
+    # gmsh node numbers do not need to be contiguous
+    return 7 + 10 * (i + (nx + 1) * j)
+
+
+nodes = []
+for j in range(ny + 1):
+    for i in range(nx + 1):
+        nodes.append((node(i, j), 0.5 * i, 0.5 * j, 0.0))
+# reversed, so that the node order differs from the node numbers
+nodes.reverse()
+
+physical_names = [
+    (2, 1, "left"),
+    (2, 2, "right"),
+    (1, 3, "left_contact"),
+    (1, 4, "right_contact"),
+    (1, 5, "left_right"),
+]
+
+# (gmsh type, physical number, nodes)
+elements = []
+for j in range(ny):
+    for i in range(nx):
+        pnum = 1 if i < nx // 2 else 2
+        a, b = node(i, j), node(i + 1, j)
+        c, d = node(i, j + 1), node(i + 1, j + 1)
+        elements.append((2, pnum, (a, b, d)))
+        elements.append((2, pnum, (a, c, d)))
+    # lines are mixed with the triangles
+    elements.append((1, 3, (node(0, j), node(0, j + 1))))
+    elements.append((1, 4, (node(nx, j), node(nx, j + 1))))
+    elements.append((1, 5, (node(nx // 2, j), node(nx // 2, j + 1))))
+
+
+def write_gmsh_file(filename, binary):
+    with open(filename, "wb") as oh:
+        oh.write(b"$MeshFormat\n")
+        if binary:
+            oh.write(b"2.2 1 8\n")
+            oh.write(struct.pack("<i", 1))
+            oh.write(b"\n")
+        else:
+            oh.write(b"2.2 0 8\n")
+        oh.write(b"$EndMeshFormat\n")
+        oh.write(b"$Nodes\n%d\n" % len(nodes))
+        for n in nodes:
+            if binary:
+                oh.write(struct.pack("<iddd", *n))
+            else:
+                oh.write(b"%d %.17g %.17g %.17g\n" % n)
+        if binary:
+            oh.write(b"\n")
+        oh.write(b"$EndNodes\n")
+        oh.write(b"$Elements\n%d\n" % len(elements))
+        for i, (t, p, n) in enumerate(elements):
+            if binary:
+                # one block for each element
+                oh.write(struct.pack("<3i", t, 1, 2))
+                oh.write(array.array("i", (i + 1, p, p) + n).tobytes())
+            else:
+                oh.write(b"%d %d 2 %d %d " % (i + 1, t, p, p))
+                oh.write(b" ".join(b"%d" % x for x in n))
+                oh.write(b"\n")
+        if binary:
+            oh.write(b"\n")
+        oh.write(b"$EndElements\n")
+        oh.write(b"$PhysicalNames\n%d\n" % len(physical_names))
+        for dim, num, name in physical_names:
+            oh.write(b'%d %d "%s"\n' % (dim, num, name.encode()))
+        oh.write(b"$EndPhysicalNames\n")
+
+
+write_gmsh_file("pythonmesh_stream_ascii.msh", binary=False)
+write_gmsh_file("pythonmesh_stream_binary.msh", binary=True)
+
+reference = read_gmsh_file("pythonmesh_stream_ascii.msh")
+for filename in ("pythonmesh_stream_ascii.msh", "pythonmesh_stream_binary.msh"):
+    data = stream_gmsh_file(filename)
+    print(filename)
+    if data["physical_names"] != reference["physical_names"]:
+        raise RuntimeError("%s physical_names does not match read_gmsh_file" % filename)
+    print("physical_names", data["physical_names"])
+    for key in ("coordinates", "elements"):
+        values = data[key].tolist()
+        if values != reference[key]:
+            raise RuntimeError("%s %s does not match read_gmsh_file" % (filename, key))
+        print(key, values)
+    print()
+
+mesh = "pythonmesh_stream"
+create_gmsh_mesh(
+    mesh=mesh,
+    coordinates=data["coordinates"],
+    physical_names=data["physical_names"],
+    elements=data["elements"],
+)
+add_gmsh_region(mesh=mesh, gmsh_name="left", region="left", material="silicon")
+add_gmsh_region(mesh=mesh, gmsh_name="right", region="right", material="silicon")
+add_gmsh_contact(
+    mesh=mesh,
+    gmsh_name="left_contact",
+    name="left_contact",
+    region="left",
+    material="metal",
+)
+add_gmsh_contact(
+    mesh=mesh,
+    gmsh_name="right_contact",
+    name="right_contact",
+    region="right",
+    material="metal",
+)
+add_gmsh_interface(
+    mesh=mesh,
+    gmsh_name="left_right",
+    name="left_right",
+    region0="left",
+    region1="right",
+)
+finalize_mesh(mesh=mesh)
+create_device(mesh=mesh, device=mesh)
+
+for r in get_region_list(device=mesh):
+    print(r, "x", list(get_node_model_values(device=mesh, region=r, name="x")))
+    print(r, "y", list(get_node_model_values(device=mesh, region=r, name="y")))
+    print(r, "triangles", len(get_element_node_list(device=mesh, region=r)))
+for c in get_contact_list(device=mesh):
+    r = get_region_list(device=mesh, contact=c)[0]
+    print(c, get_element_node_list(device=mesh, region=r, contact=c))
+for i in get_interface_list(device=mesh):
+    for r in get_region_list(device=mesh, interface=i):
+        print(i, r, get_element_node_list(device=mesh, region=r, interface=i))
@@ -0,0 +1,125 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# rampbias_adaptive on a diode, compared with a fixed step ramp to the same bias
+
+import devsim
+import test_common
+
+from devsim.python_packages.ramp import (
+    get_solution_names,
+    get_solution_snapshot,
+    rampbias_adaptive,
+    set_solution_snapshot,
+)
+from devsim.python_packages.simple_physics import GetContactBiasName
+
+import numpy
+
+device = "diode"
+region = "diode"
+end_bias = 0.5
+step_size = 0.05
+
+test_common.CreateDiode(device, region)
+
+bias_name = GetContactBiasName("top")
+solution_names = get_solution_names(device)
+print(solution_names)
+equilibrium = get_solution_snapshot(device, solution_names)
+
+####
+#### the table commands used by the snapshots agree with the commands for each model
+####
+names = solution_names[region]
+table = numpy.asarray(
+    devsim.get_model_values_table(device=device, region=region, names=names)
+)
+for i, n in enumerate(names):
+    values = devsim.get_node_model_values(device=device, region=region, name=n)
+    if not numpy.array_equal(table[i], values):
+        raise RuntimeError("get_model_values_table differs for %s" % n)
+devsim.set_node_values_table(
+    device=device, region=region, names=names, values=2.0 * table
+)
+for i, n in enumerate(names):
+    values = devsim.get_node_model_values(device=device, region=region, name=n)
+    if not numpy.array_equal(2.0 * table[i], values):
+        raise RuntimeError("set_node_values_table differs for %s" % n)
+    devsim.set_node_values(device=device, region=region, name=n, values=table[i])
+print("table commands match the model commands")
+
+
+def get_current():
+    return sum(
+        devsim.get_contact_current(device=device, contact="top", equation=e)
+        for e in ("ElectronContinuityEquation", "HoleContinuityEquation")
+    )
+
+
+def no_callback(device):
+    pass
+
+
+####
+#### fixed step ramp
+####
+fixed_points = 0
+fixed_iterations = 0
+for i in range(1, round(end_bias / step_size) + 1):
+    devsim.set_parameter(device=device, name=bias_name, value=i * step_size)
+    info = devsim.solve(
+        type="dc",
+        absolute_error=1e10,
+        relative_error=1e-10,
+        maximum_iterations=30,
+        info=True,
+    )
+    fixed_points += 1
+    fixed_iterations += len(info["iterations"])
+fixed_current = get_current()
+fixed_solution = get_solution_snapshot(device, solution_names)
+print("fixed step %d bias points %d iterations" % (fixed_points, fixed_iterations))
+
+####
+#### adaptive ramps from equilibrium
+####
+for extrapolation in ("none", "linear", "quadratic"):
+    devsim.set_parameter(device=device, name=bias_name, value=0.0)
+    set_solution_snapshot(device, equilibrium)
+    statistics = rampbias_adaptive(
+        device,
+        "top",
+        end_bias,
+        step_size,
+        min_step=1e-3,
+        max_iter=30,
+        rel_error=1e-10,
+        abs_error=1e10,
+        callback=no_callback,
+        max_step=0.2,
+        extrapolation=extrapolation,
+    )
+    print(extrapolation, sorted(statistics.items()))
+
+    if abs(devsim.get_parameter(device=device, name=bias_name) - end_bias) > 1e-12:
+        raise RuntimeError("%s ramp did not reach %g" % (extrapolation, end_bias))
+    if statistics["failures"] != 0:
+        raise RuntimeError("%s ramp failed" % extrapolation)
+    if extrapolation != "none" and statistics["bias_points"] >= fixed_points:
+        raise RuntimeError("%s ramp did not grow the step" % extrapolation)
+    if extrapolation != "none" and statistics["newton_iterations"] >= fixed_iterations:
+        raise RuntimeError("%s ramp did not save iterations" % extrapolation)
+
+    current = get_current()
+    if abs(current - fixed_current) > 1e-8 * abs(fixed_current):
+        raise RuntimeError(
+            "%s current %g differs from %g" % (extrapolation, current, fixed_current)
+        )
+    solution = get_solution_snapshot(device, solution_names)
+    for r, (names, values) in solution.items():
+        reference = fixed_solution[r][1]
+        if not numpy.allclose(values, reference, rtol=1e-8, atol=1e-12):
+            raise RuntimeError("%s solution differs in region %s" % (extrapolation, r))
+    print(extrapolation, "matches the fixed step ramp")
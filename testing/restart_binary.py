@@ -0,0 +1,167 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# a device written in the devsim_binary format, with and without compression,
+# must write the same devsim file after it is loaded again, and restore the same
+# solution values as the devsim format
+
+import contextlib
+import filecmp
+import io
+
+import devsim
+
+from devsim.python_packages.model_create import CreateNodeModel, CreateSolution
+from devsim.python_packages.simple_physics import (
+    CreateSiliconDriftDiffusion,
+    CreateSiliconDriftDiffusionAtContact,
+    CreateSiliconPotentialOnly,
+    CreateSiliconPotentialOnlyContact,
+    CreateSiliconSiliconInterface,
+    GetContactBiasName,
+    SetSiliconParameters,
+)
+
+device = "restart_binary"
+# region, first tag, second tag, acceptors, donors
+regions = (
+    ("p", "top", "pn", 1e18, 0.0),
+    ("n", "pn", "bot", 0.0, 1e16),
+)
+contacts = (("top", "p"), ("bot", "n"))
+
+devsim.create_1d_mesh(mesh=device)
+devsim.add_1d_mesh_line(mesh=device, pos=0, ps=1e-7, tag="top")
+devsim.add_1d_mesh_line(mesh=device, pos=0.5e-5, ps=1e-8, tag="pn")
+devsim.add_1d_mesh_line(mesh=device, pos=1e-5, ps=1e-7, tag="bot")
+for c, r in contacts:
+    devsim.add_1d_contact(mesh=device, name=c, tag=c, material="metal")
+devsim.add_1d_interface(mesh=device, name="pn", tag="pn")
+for r, tag1, tag2, _acceptors, _donors in regions:
+    devsim.add_1d_region(mesh=device, material="Si", region=r, tag1=tag1, tag2=tag2)
+devsim.finalize_mesh(mesh=device)
+devsim.create_device(mesh=device, device=device)
+
+for r, _tag1, _tag2, acceptors, donors in regions:
+    SetSiliconParameters(device, r, 300)
+    CreateNodeModel(device, r, "Acceptors", "%g" % acceptors)
+    CreateNodeModel(device, r, "Donors", "%g" % donors)
+    CreateNodeModel(device, r, "NetDoping", "Donors-Acceptors")
+    CreateSolution(device, r, "Potential")
+    CreateSiliconPotentialOnly(device, r)
+for c, r in contacts:
+    devsim.set_parameter(device=device, name=GetContactBiasName(c), value=0.0)
+    CreateSiliconPotentialOnlyContact(device, r, c)
+devsim.solve(type="dc", absolute_error=1.0, relative_error=1e-12, maximum_iterations=30)
+
+for r, _tag1, _tag2, _acceptors, _donors in regions:
+    CreateSolution(device, r, "Electrons")
+    CreateSolution(device, r, "Holes")
+    devsim.set_node_values(
+        device=device, region=r, name="Electrons", init_from="IntrinsicElectrons"
+    )
+    devsim.set_node_values(
+        device=device, region=r, name="Holes", init_from="IntrinsicHoles"
+    )
+    CreateSiliconDriftDiffusion(device, r)
+for c, r in contacts:
+    CreateSiliconDriftDiffusionAtContact(device, r, c)
+CreateSiliconSiliconInterface(device, "pn")
+devsim.set_parameter(device=device, name=GetContactBiasName("top"), value=0.3)
+devsim.solve(
+    type="dc", absolute_error=1e10, relative_error=1e-10, maximum_iterations=30
+)
+
+
+solutions = ("Potential", "Electrons", "Holes")
+
+
+def get_values():
+    return {
+        (r, n): list(devsim.get_node_model_values(device=device, region=r, name=n))
+        for r, _tag1, _tag2, _acceptors, _donors in regions
+        for n in solutions
+    }
+
+
+def reload(filename):
+    """
+    loads the device again, with the loader output discarded, since it is the
+    same for each format
+    """
+    devsim.delete_device(device=device)
+    devsim.delete_mesh(mesh=device)
+    with contextlib.redirect_stdout(io.StringIO()):
+        devsim.load_devices(file=filename)
+
+
+def check_rewrite(label):
+    devsim.write_devices(
+        file="restart_binary_rewrite.msh", device=device, type="devsim"
+    )
+    if not filecmp.cmp(
+        "restart_binary.msh", "restart_binary_rewrite.msh", shallow=False
+    ):
+        raise RuntimeError("%s does not restore the same device" % label)
+    print("%s restores the same device" % label)
+
+
+def check_values(label, values, expected, reference, rtol):
+    """
+    the devsim format writes 15 significant digits, and the binary format
+    writes the values exactly
+    """
+    for key, evalues in expected.items():
+        if len(values[key]) != len(evalues):
+            raise RuntimeError("%s %s %s has the wrong size" % (label, key[0], key[1]))
+        for v, e in zip(values[key], evalues):
+            if abs(v - e) > rtol * max(abs(v), abs(e)):
+                raise RuntimeError(
+                    "%s %s %s %1.15e differs from %1.15e"
+                    % (label, key[0], key[1], v, e)
+                )
+    print("%s values match %s" % (label, reference))
+
+
+original = get_values()
+devsim.write_devices(file="restart_binary.msh", device=device, type="devsim")
+devsim.write_devices(file="restart_binary.dsb", device=device, type="devsim_binary")
+devsim.write_devices(
+    file="restart_binary_compressed.dsb",
+    device=device,
+    type="devsim_binary",
+    compress=True,
+)
+
+reload("restart_binary.msh")
+check_rewrite("devsim")
+ascii_values = get_values()
+check_values("devsim", ascii_values, original, "the original to 15 digits", 1e-14)
+
+for filename, label in (
+    ("restart_binary.dsb", "devsim_binary"),
+    ("restart_binary_compressed.dsb", "compressed devsim_binary"),
+):
+    reload(filename)
+    check_rewrite(label)
+    binary_values = get_values()
+    check_values(label, binary_values, original, "the original exactly", 0.0)
+    check_values(label, binary_values, ascii_values, "the devsim restart", 1e-14)
+
+#### the parameters are not in the files, and the restored device solves from where
+#### it was written
+for r, _tag1, _tag2, _acceptors, _donors in regions:
+    SetSiliconParameters(device, r, 300)
+for c, _r in contacts:
+    devsim.set_parameter(device=device, name=GetContactBiasName(c), value=0.0)
+devsim.set_parameter(device=device, name=GetContactBiasName("top"), value=0.3)
+with contextlib.redirect_stdout(io.StringIO()):
+    info = devsim.solve(
+        type="dc",
+        absolute_error=1e10,
+        relative_error=1e-10,
+        maximum_iterations=30,
+        info=True,
+    )
+print("restored device converged: %s" % info["converged"])
@@ -0,0 +1,136 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# run_sweep in a spawn pool, interrupted and resumed from its checkpoint file
+
+import contextlib
+import os
+import sys
+
+from devsim.python_packages.sweep import load_checkpoint, parameter_grid, run_sweep
+
+checkpoint = "sweep_checkpoint.jsonl"
+# points fail while this file exists
+fail_marker = "sweep_checkpoint.fail"
+fail_point = {"net_doping": 1e17, "bias": 0.2}
+
+
+@contextlib.contextmanager
+def quiet_workers():
+    """
+    The workers inherit the descriptors, and their output is not in a
+    deterministic order
+    """
+    sys.stdout.flush()
+    saved = [os.dup(1), os.dup(2)]
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    os.close(devnull)
+    try:
+        yield
+    finally:
+        for fd, s in zip((1, 2), saved):
+            os.dup2(s, fd)
+            os.close(s)
+
+
+def resistor_current(net_doping, bias):
+    import devsim
+    import test_common
+
+    point = {"net_doping": net_doping, "bias": bias}
+    if os.path.exists(fail_marker) and point == fail_point:
+        raise RuntimeError("point failed")
+
+    device = "MyDevice"
+    region = "MyRegion"
+    test_common.CreateSimpleMesh(device, region)
+    devsim.set_parameter(name="topbias", value=0.0)
+    devsim.set_parameter(name="botbias", value=0.0)
+    test_common.SetupResistorConstants(device, region)
+    test_common.SetupInitialResistorSystem(device, region, net_doping)
+    test_common.SetupInitialResistorContact(device=device, contact="top")
+    test_common.SetupInitialResistorContact(device=device, contact="bot")
+    devsim.solve(
+        type="dc", absolute_error=1.0, relative_error=1e-10, maximum_iterations=30
+    )
+    test_common.SetupCarrierResistorSystem(device, region)
+    test_common.SetupCarrierResistorContact(device=device, contact="top")
+    test_common.SetupCarrierResistorContact(device=device, contact="bot")
+    devsim.set_parameter(name="topbias", value=bias)
+    devsim.solve(
+        type="dc", absolute_error=1.0, relative_error=1e-10, maximum_iterations=30
+    )
+    return devsim.get_contact_current(
+        device=device, contact="top", equation="ElectronContinuityEquation"
+    )
+
+
+def by_point(entries):
+    return sorted(entries, key=lambda e: (e["point"]["net_doping"], e["point"]["bias"]))
+
+
+if __name__ == "__main__":
+    for f in (checkpoint, fail_marker):
+        if os.path.exists(f):
+            os.remove(f)
+
+    points = parameter_grid(net_doping=[1e16, 1e17, 1e18], bias=[0.1, 0.2])
+
+    with quiet_workers():
+        reference = by_point(run_sweep(resistor_current, points, processes=2))
+    for e in reference:
+        if e["error"] or e["checkpoint"]:
+            raise RuntimeError("reference %s failed" % e["point"])
+        print(e["point"], "%1.15e" % e["result"])
+
+    #### interrupt the sweep after two points are saved
+    with open(fail_marker, "w"):
+        pass
+    saved = 0
+    with quiet_workers():
+        for e in run_sweep(
+            resistor_current, points, processes=2, checkpoint=checkpoint
+        ):
+            if e["error"] is None:
+                saved += 1
+            elif e["point"] != fail_point:
+                raise RuntimeError("unexpected failure %s" % e["point"])
+            if saved == 2:
+                break
+    os.remove(fail_marker)
+    # a write cut off by the interruption
+    with open(checkpoint, "a") as oh:
+        oh.write('{"point": {"net_doping"')
+    print("interrupted with %d saved points" % len(load_checkpoint(checkpoint)))
+
+    #### resume
+    with quiet_workers():
+        resumed = by_point(
+            run_sweep(resistor_current, points, processes=2, checkpoint=checkpoint)
+        )
+    print(
+        "resumed with %d points from the checkpoint and %d new points"
+        % (
+            sum(1 for e in resumed if e["checkpoint"]),
+            sum(1 for e in resumed if not e["checkpoint"]),
+        )
+    )
+    for e, r in zip(resumed, reference):
+        if e["error"]:
+            raise RuntimeError("resumed %s failed" % e["point"])
+        if e["point"] != r["point"] or e["result"] != r["result"]:
+            raise RuntimeError("resumed %s differs from the reference" % e["point"])
+    print("resumed results match the reference")
+
+    #### every point is in the checkpoint, so nothing runs again
+    completed = load_checkpoint(checkpoint)
+    print("checkpoint has %d points" % len(completed))
+    with quiet_workers():
+        again = list(run_sweep(resistor_current, points, checkpoint=checkpoint))
+    if not all(e["checkpoint"] for e in again) or len(again) != len(points):
+        raise RuntimeError("completed sweep ran again")
+    print("completed sweep did not run again")
+    os.remove(checkpoint)
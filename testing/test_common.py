@@ -433,3 +433,65 @@ def SetupElectronSRVAtInterface(device, interface):
         interface_model="srvElectrons2",
         type="fluxterm",
     )
+
+
+####
+#### Diode
+####
+def CreateDiode(device, region, doping=1.0e18):
+    """
+    Drift diffusion pn diode solved at equilibrium, using simple_physics
+    device length: 1e-5
+    junction:      5e-6
+    contacts:      top (x=0), bot (x=1e-5)
+    """
+    from devsim.python_packages.model_create import CreateNodeModel, CreateSolution
+    from devsim.python_packages.simple_physics import (
+        CreateSiliconDriftDiffusion,
+        CreateSiliconDriftDiffusionAtContact,
+        CreateSiliconPotentialOnly,
+        CreateSiliconPotentialOnlyContact,
+        GetContactBiasName,
+        SetSiliconParameters,
+    )
+
+    devsim.create_1d_mesh(mesh="dio")
+    devsim.add_1d_mesh_line(mesh="dio", pos=0, ps=1e-7, tag="top")
+    devsim.add_1d_mesh_line(mesh="dio", pos=0.5e-5, ps=1e-8, tag="mid")
+    devsim.add_1d_mesh_line(mesh="dio", pos=1e-5, ps=1e-7, tag="bot")
+    devsim.add_1d_contact(mesh="dio", name="top", tag="top", material="metal")
+    devsim.add_1d_contact(mesh="dio", name="bot", tag="bot", material="metal")
+    devsim.add_1d_region(
+        mesh="dio", material="Si", region=region, tag1="top", tag2="bot"
+    )
+    devsim.finalize_mesh(mesh="dio")
+    devsim.create_device(mesh="dio", device=device)
+
+    SetSiliconParameters(device, region, 300)
+    CreateNodeModel(device, region, "Acceptors", "%g*step(0.5e-5-x)" % doping)
+    CreateNodeModel(device, region, "Donors", "%g*step(x-0.5e-5)" % doping)
+    CreateNodeModel(device, region, "NetDoping", "Donors-Acceptors")
+
+    CreateSolution(device, region, "Potential")
+    CreateSiliconPotentialOnly(device, region)
+    for c in devsim.get_contact_list(device=device):
+        devsim.set_parameter(device=device, name=GetContactBiasName(c), value=0.0)
+        CreateSiliconPotentialOnlyContact(device, region, c)
+    devsim.solve(
+        type="dc", absolute_error=1.0, relative_error=1e-10, maximum_iterations=30
+    )
+
+    CreateSolution(device, region, "Electrons")
+    CreateSolution(device, region, "Holes")
+    devsim.set_node_values(
+        device=device, region=region, name="Electrons", init_from="IntrinsicElectrons"
+    )
+    devsim.set_node_values(
+        device=device, region=region, name="Holes", init_from="IntrinsicHoles"
+    )
+    CreateSiliconDriftDiffusion(device, region)
+    for c in devsim.get_contact_list(device=device):
+        CreateSiliconDriftDiffusionAtContact(device, region, c)
+    devsim.solve(
+        type="dc", absolute_error=1e10, relative_error=1e-10, maximum_iterations=30
+    )
@@ -0,0 +1,112 @@
+# Copyright 2013 DEVSIM LLC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# the solve_batch action of the umfpack solver callback, compared with a
+# solve action for each right hand side
+
+import array
+
+import numpy
+
+from devsim.umfpack.umfshim import local_solver_callback
+
+# column compressed 4x4 nonsymmetric matrix
+n = 4
+Ap = array.array("i", [0, 2, 5, 7, 9])
+Ai = array.array("i", [0, 1, 0, 1, 2, 1, 3, 2, 3])
+values = [4.0, -1.0, 1.0, 5.0, -2.0, 2.0, 1.0, -1.0, 3.0]
+nrhs = 3
+
+
+def solve_each(so, b, is_complex):
+    """
+    solves each column of the Fortran ordered b separately
+    """
+    x = numpy.zeros(b.shape, dtype=b.dtype, order="F")
+    for i in range(nrhs):
+        if is_complex:
+            bi = array.array("d", b[:, i].view(numpy.float64))
+        else:
+            bi = array.array("d", b[:, i])
+        ret = local_solver_callback(action="solve", solver_object=so, b=bi)
+        if not ret["status"]:
+            raise RuntimeError(ret["message"])
+        x[:, i] = numpy.frombuffer(ret["x"], dtype=b.dtype)
+    return x
+
+
+def check(is_complex):
+    label = "complex" if is_complex else "real"
+    if is_complex:
+        Ax = array.array("d")
+        for i, v in enumerate(values):
+            Ax.extend((v, 0.5 * i - 1.0))
+        dtype = numpy.complex128
+    else:
+        Ax = array.array("d", values)
+        dtype = numpy.float64
+
+    so = local_solver_callback(action="init", n=n, transpose=False)["solver_object"]
+    ret = local_solver_callback(
+        action="factor",
+        solver_object=so,
+        Ap=Ap,
+        Ai=Ai,
+        Ax=Ax,
+        is_complex=is_complex,
+        is_same_symbolic=False,
+    )
+    if not ret["status"]:
+        raise RuntimeError(ret["message"])
+
+    b = numpy.asfortranarray(numpy.arange(1.0, n * nrhs + 1.0).reshape(n, nrhs))
+    if is_complex:
+        b = b + 1j * numpy.asfortranarray(b[::-1, :])
+    b = numpy.asfortranarray(b.astype(dtype))
+    expected = solve_each(so, b, is_complex)
+
+    #### Fortran ordered solution written into the caller buffer
+    x = numpy.zeros((n, nrhs), dtype=dtype, order="F")
+    ret = local_solver_callback(
+        action="solve_batch", solver_object=so, b=b, x=x, nrhs=nrhs
+    )
+    if not ret["status"] or ret["x"] is not x:
+        raise RuntimeError("%s solve_batch failed %s" % (label, ret["message"]))
+    if not numpy.array_equal(x, expected):
+        raise RuntimeError("%s solve_batch differs from single solves" % label)
+    print("%s Fortran ordered batch matches single solves" % label)
+
+    #### 1 dimensional read only input, solution allocated by the callback
+    flat = bytes(b.T.copy())
+    ret = local_solver_callback(
+        action="solve_batch", solver_object=so, b=flat, nrhs=nrhs
+    )
+    x = numpy.frombuffer(ret["x"], dtype=dtype).reshape(nrhs, n).T
+    if not numpy.array_equal(x, expected):
+        raise RuntimeError("%s 1 dimensional solve_batch differs" % label)
+    print("%s 1 dimensional batch matches single solves" % label)
+
+    #### a C ordered (n, nrhs) array is not column major
+    try:
+        local_solver_callback(
+            action="solve_batch",
+            solver_object=so,
+            b=numpy.ascontiguousarray(b),
+            nrhs=nrhs,
+        )
+    except ValueError as e:
+        print("%s C ordered input: %s" % (label, e))
+    else:
+        raise RuntimeError("%s C ordered input was accepted" % label)
+
+    for i in range(nrhs):
+        print(
+            label,
+            i,
+            " ".join("%1.15e" % abs(v) for v in expected[:, i]),
+        )
+
+
+check(False)
+check(True)
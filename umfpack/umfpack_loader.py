@@ -1,6 +1,12 @@
 from ctypes import *
 import platform
 import array
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 def debug_print(arg):
     pass
@@ -18,6 +24,13 @@ UMFPACK_FIXQ = 13                #/* -1: no fixQ, 0: default, 1: fixQ */
 UMFPACK_AMD_DENSE = 14           #/* for AMD ordering */
 UMFPACK_AGGRESSIVE = 19          #/* whether or not to use aggressive
 
+#/* used in UMFPACK_*numeric only: */
+UMFPACK_PIVOT_TOLERANCE = 3      #/* threshold partial pivoting setting */
+UMFPACK_SYM_PIVOT_TOLERANCE = 15 #/* threshold, only for diag. entries */
+
+#/* used in UMFPACK_*solve only: */
+UMFPACK_IRSTEP = 7               #/* max # of iterative refinements */
+
 #/* default values of Control may change in future versions of UMFPACK. */
 
 #/* -------------------------------------------------------------------------- */
@@ -90,6 +103,27 @@ UMFPACK_U_Qt = (9) #    /* UQ'x=b  */
 UMFPACK_INFO = 90
 UMFPACK_CONTROL = 20
 
+# /* -------------------------------------------------------------------------- */
+# /* Info array indices */
+# /* -------------------------------------------------------------------------- */
+
+UMFPACK_STATUS = 0               #/* UMFPACK_OK, or other result */
+UMFPACK_SIZE_OF_UNIT = 3         #/* sizeof (Unit) */
+UMFPACK_SYMBOLIC_SIZE = 14       #/* final size of Symbolic, in Units */
+
+#/* returned by UMFPACK_numeric: */
+UMFPACK_NUMERIC_SIZE = 40        #/* final size of Numeric, in Units */
+UMFPACK_PEAK_MEMORY = 41         #/* for symbolic & numeric, in Units */
+UMFPACK_FLOPS = 42               #/* flop count */
+UMFPACK_RCOND = 67               #/* est. reciprocal condition # */
+
+#/* returned by UMFPACK_solve: */
+UMFPACK_IR_TAKEN = 80            #/* # of iterative refinement steps taken */
+UMFPACK_IR_ATTEMPTED = 81        #/* # of iter. refinement steps attempted */
+UMFPACK_OMEGA1 = 82              #/* omega1, sparse backward error estimate */
+UMFPACK_OMEGA2 = 83              #/* omega2, sparse backward error estimate */
+UMFPACK_SOLVE_FLOPS = 84         #/* flop count for solve */
+
 def get_transpose(x):
     if x:
         return UMFPACK_Aat
@@ -151,6 +185,14 @@ def load_blas_functions(gdata, h):
     i = gdata.dll.blasw_load_functions(h._handle)
     return i
 
+def get_buffer_address(buf):
+    '''
+    returns the address of a writable contiguous buffer without copying it
+    '''
+    if isinstance(buf, array.array):
+        return buf.buffer_info()[0]
+    return addressof(c_char.from_buffer(buf))
+
 def myprintcb(msg):
     pmsg = msg.decode("utf-8")
     pmsg = pmsg.replace("\n", "\nUMF: ")
@@ -166,11 +208,12 @@ def set_python_print_callback(gdata):
     return dcb
 
 
-#TODO: handle same symbolic
 class di_symbolic:
     def __init__(self, uc):
         self.Symbolic = c_void_p()
         self.umf_control = uc
+        # size in bytes, set after the symbolic factorization
+        self.size = 0
 
     def __del__(self):
         if self.umf_control.is_complex:
@@ -197,6 +240,8 @@ class di_symbolic:
             self.umf_control.gdata.dll.umfpack_di_free_symbolic (byref(self.Symbolic))
             debug_print('umfpack_di_symbolic 196')
             self.status = self.umf_control.gdata.dll.umfpack_di_symbolic (matrix.n, matrix.n, matrix.AP, matrix.AI, matrix.AX, byref(self.Symbolic), self.umf_control.Control, self.umf_control.Info)
+        Info = self.umf_control.Info
+        self.size = max(0, int(Info[UMFPACK_SYMBOLIC_SIZE] * Info[UMFPACK_SIZE_OF_UNIT]))
         return self.status
 
 class di_numeric:
@@ -233,6 +278,11 @@ class di_numeric:
     def solve(self, matrix, x, b, transpose):
         X = c_void_p(x.buffer_info()[0])
         B = c_void_p(b.buffer_info()[0])
+        return self.solve_address(matrix, X, B, transpose)
+
+    def solve_address(self, matrix, X, B, transpose, workspace=None):
+        if workspace:
+            return self.wsolve_address(matrix, X, B, transpose, workspace)
         if self.umf_control.is_complex:
             NULL = c_void_p()
             self.status = self.umf_control.gdata.dll.umfpack_zi_solve (get_transpose(transpose), matrix.AP, matrix.AI, matrix.AX, NULL, X, NULL, B, NULL, self.Numeric, self.umf_control.Control, self.umf_control.Info)
@@ -240,6 +290,14 @@ class di_numeric:
             self.status = self.umf_control.gdata.dll.umfpack_di_solve (get_transpose(transpose), matrix.AP, matrix.AI, matrix.AX, X, B, self.Numeric, self.umf_control.Control, self.umf_control.Info)
         return self.status
 
+    def wsolve_address(self, matrix, X, B, transpose, workspace):
+        if self.umf_control.is_complex:
+            NULL = c_void_p()
+            self.status = self.umf_control.gdata.dll.umfpack_zi_wsolve (get_transpose(transpose), matrix.AP, matrix.AI, matrix.AX, NULL, X, NULL, B, NULL, self.Numeric, self.umf_control.Control, self.umf_control.Info, workspace.WI, workspace.WW)
+        else:
+            self.status = self.umf_control.gdata.dll.umfpack_di_wsolve (get_transpose(transpose), matrix.AP, matrix.AI, matrix.AX, X, B, self.Numeric, self.umf_control.Control, self.umf_control.Info, workspace.WI, workspace.WW)
+        return self.status
+
     def determinant(self, x, r):
         X = c_void_p(x.buffer_info()[0])
         R = c_void_p(r.buffer_info()[0])
@@ -268,17 +326,43 @@ class di_triplet:
 class matrix:
     def __init__(self, uc, Ap, Ai, Ax):
         self.umf_control = uc
+        self.AP = c_void_p()
+        self.AI = c_void_p()
+        self.AX = c_void_p()
+        self.set_arrays(Ap, Ai, Ax)
+
+    def set_arrays(self, Ap, Ai, Ax):
+        '''
+        reuses this wrapper and its pointers for new matrix data
+        '''
         self.n = len(Ap)-1
         self.Ap = Ap
         self.Ai = Ai
         self.Ax = Ax
-        self.AP = c_void_p(Ap.buffer_info()[0])
-        self.AI = c_void_p(Ai.buffer_info()[0])
-        self.AX = c_void_p(Ax.buffer_info()[0])
+        self.AP.value = Ap.buffer_info()[0]
+        self.AI.value = Ai.buffer_info()[0]
+        self.AX.value = Ax.buffer_info()[0]
 
     def __del__(self):
         pass
 
+class solve_workspace:
+    '''
+    work arrays for umfpack_*_wsolve, so that the solve does not allocate memory
+    '''
+    def __init__(self, n, is_complex):
+        self.n = n
+        self.is_complex = is_complex
+        self.Wi = array.array('i', [0]) * n
+        # large enough for iterative refinement
+        if is_complex:
+            self.W = array.array('d', [0.0]) * (10 * n)
+        else:
+            self.W = array.array('d', [0.0]) * (5 * n)
+        self.WI = c_void_p(self.Wi.buffer_info()[0])
+        self.WW = c_void_p(self.W.buffer_info()[0])
+        self.nbytes = self.Wi.itemsize * len(self.Wi) + self.W.itemsize * len(self.W)
+
 class global_data:
     def __init__(self):
         self.printcb = None
@@ -296,6 +380,10 @@ class umf_control:
         self.gdata = gdata
         self.Control = None
         self.Info = None
+        # diagnostics are only recorded when enabled
+        self.record_info = False
+        self.numeric_info = {}
+        self.solve_info = {}
         # expected attributes
         self.matrix_format = "csc"
         self.matrix_type = "real"
@@ -329,6 +417,44 @@ class umf_control:
             self.gdata.dll.umfpack_di_defaults(self.Control)
         self.Info = (c_double * UMFPACK_INFO)()
 
+    def enable_diagnostics(self, refinement_steps=None):
+        '''
+        records the Info fields after each factorization and solve
+        refinement_steps sets the maximum number of iterative refinement steps
+        '''
+        self.record_info = True
+        if refinement_steps is not None:
+            self.Control [UMFPACK_IRSTEP] = refinement_steps
+
+    def set_pivot_tolerance(self, tolerance):
+        self.Control [UMFPACK_PIVOT_TOLERANCE] = tolerance
+
+    def record_numeric_info(self):
+        Info = self.Info
+        unit = Info [UMFPACK_SIZE_OF_UNIT]
+        self.numeric_info = {
+          'rcond' : Info [UMFPACK_RCOND],
+          'factorization_flops' : Info [UMFPACK_FLOPS],
+          'peak_memory' : Info [UMFPACK_PEAK_MEMORY] * unit,
+          'numeric_size' : Info [UMFPACK_NUMERIC_SIZE] * unit,
+          'pivot_tolerance' : self.Control [UMFPACK_PIVOT_TOLERANCE],
+        }
+
+    def record_solve_info(self):
+        Info = self.Info
+        self.solve_info = {
+          'refinement_steps_taken' : int(Info [UMFPACK_IR_TAKEN]),
+          'refinement_steps_attempted' : int(Info [UMFPACK_IR_ATTEMPTED]),
+          'omega1' : Info [UMFPACK_OMEGA1],
+          'omega2' : Info [UMFPACK_OMEGA2],
+          'solve_flops' : Info [UMFPACK_SOLVE_FLOPS],
+        }
+
+    def get_info(self):
+        info = dict(self.numeric_info)
+        info.update(self.solve_info)
+        return info
+
     def init_verbose(self):
         #    /* change the default print level for this demo */
         #    /* (otherwise, nothing will print) */
@@ -432,6 +558,8 @@ class umf_control:
         Numeric = di_numeric(self)
         self.status = Numeric.factor_numeric(matrix, Symbolic)
         self.error_on_result("umfpack numeric")
+        if self.record_info:
+            self.record_numeric_info()
         return Numeric
 
     def print_numeric(self, Numeric):
@@ -448,6 +576,29 @@ class umf_control:
             self.status = Numeric.solve(matrix, x, b, transpose)
         self.error_on_result("umfpack solve")
 
+    def solve_address(self, matrix, X, B, Numeric, transpose, workspace=None):
+        self.status = Numeric.solve_address(matrix, X, B, transpose, workspace)
+        self.error_on_result("umfpack solve")
+        if self.record_info:
+            self.record_solve_info()
+
+    def solve_batch(self, matrix, x, b, nrhs, Numeric, transpose, workspace=None):
+        '''
+        solves nrhs right hand sides stored column major in b into x
+        '''
+        if self.is_complex:
+            stride = 2 * matrix.n * sizeof(c_double)
+        else:
+            stride = matrix.n * sizeof(c_double)
+        xaddress = get_buffer_address(x)
+        baddress = get_buffer_address(b)
+        X = c_void_p()
+        B = c_void_p()
+        for i in range(nrhs):
+            X.value = xaddress + i * stride
+            B.value = baddress + i * stride
+            self.solve_address(matrix, X, B, Numeric, transpose, workspace)
+
     def determinant(self, x, r, Numeric):
         self.status = Numeric.determinant(x, r)
         self.error_on_result("umfpack get_determinant")
@@ -459,7 +610,7 @@ class umf_control:
 
 
 #/* -------------------------------------------------------------------------- */
-#/* resid: compute the residual, r = Ax-b or r = A'x=b and return maxnorm (r) */
+#/* resid: compute the residual, r = Ax-b or r = A.'x-b and return maxnorm (r) */
 #/* -------------------------------------------------------------------------- */
 def real_resid ( transpose, matrix, x, r, b):
   Ap = matrix.Ap
@@ -479,13 +630,13 @@ def real_resid ( transpose, matrix, x, r, b):
         i = Ai [p]
         r [i] += Ax [p] * x [j]
   norm = 0.0
-  print(len(r))
   for i in range(n):
     if abs(r[i]) > norm:
       norm = abs(r[i])
   return norm
 
 def complex_resid ( transpose, matrix, x, r, b):
+  # packed complex storage, real and imaginary parts are interleaved
   Ap = matrix.Ap
   Ai = matrix.Ai
   Ax = matrix.Ax
@@ -493,25 +644,92 @@ def complex_resid ( transpose, matrix, x, r, b):
   n = len(b)//f
   for i in range(n):
     r[f*i] = -b[f*i]
+    r[f*i+1] = -b[f*i+1]
   if (transpose):
     for j in range(n):
       for p in range(Ap[j], Ap[j+1]):
         i = Ai [p]
-        r [f*j] += Ax [f*p] * x [f*i]
+        ar = Ax [f*p]
+        ai = Ax [f*p+1]
+        r [f*j] += ar * x [f*i] - ai * x [f*i+1]
+        r [f*j+1] += ar * x [f*i+1] + ai * x [f*i]
   else:
     for j in range(n):
       for p in range(Ap[j], Ap[j+1]):
         i = Ai [p]
-        r [f*i] += Ax [f*p] * x [f*j]
+        ar = Ax [f*p]
+        ai = Ax [f*p+1]
+        r [f*i] += ar * x [f*j] - ai * x [f*j+1]
+        r [f*i+1] += ar * x [f*j+1] + ai * x [f*j]
   norm = 0.0
-  print(len(r))
   for i in range(n):
-    if abs(r[2*i]) > norm:
-      norm = abs(r[2*i])
+    v = abs(complex(r[f*i], r[f*i+1]))
+    if v > norm:
+      norm = v
   return norm
 
+def numpy_resid ( transpose, is_complex, matrix, x, r, b):
+  '''
+  vectorized version of real_resid/complex_resid
+  the Ap, Ai, Ax, x, r, b buffers are used through zero-copy views
+  returns (maxnorm, l2norm)
+  '''
+  n = matrix.n
+  Ap = numpy.frombuffer(matrix.Ap, dtype=matrix.Ap.typecode)
+  nnz = int(Ap[n])
+  Ai = numpy.frombuffer(matrix.Ai, dtype=matrix.Ai.typecode)[:nnz]
+  if is_complex:
+    dtype = numpy.complex128
+  else:
+    dtype = numpy.float64
+  Ax = numpy.frombuffer(matrix.Ax, dtype=dtype)[:nnz]
+  X = numpy.frombuffer(x, dtype=dtype)[:n]
+  B = numpy.frombuffer(b, dtype=dtype)[:n]
+  R = numpy.frombuffer(r, dtype=dtype)[:n]
+  # column index of every stored entry
+  Aj = numpy.repeat(numpy.arange(n), numpy.diff(Ap))
+  if transpose:
+    v = Ax * X[Ai]
+    dest = Aj
+  else:
+    v = Ax * X[Aj]
+    dest = Ai
+  if is_complex:
+    R.real = numpy.bincount(dest, weights=v.real, minlength=n)
+    R.imag = numpy.bincount(dest, weights=v.imag, minlength=n)
+  else:
+    R[:] = numpy.bincount(dest, weights=v, minlength=n)
+  R -= B
+  if n == 0:
+    return (0.0, 0.0)
+  a = numpy.abs(R)
+  return (float(numpy.max(a)), float(numpy.linalg.norm(a)))
+
+def python_resid ( transpose, is_complex, matrix, x, r, b):
+  '''
+  fallback for numpy_resid
+  returns (maxnorm, l2norm)
+  '''
+  if is_complex:
+    maxnorm = complex_resid(transpose, matrix, x, r, b)
+  else:
+    maxnorm = real_resid(transpose, matrix, x, r, b)
+  l2norm = math.sqrt(sum(v*v for v in r[:len(b)]))
+  return (maxnorm, l2norm)
+
+def resid_norms ( transpose, is_complex, matrix, x, b, r=None):
+  '''
+  computes the full residual vector and its norms
+  r is allocated when it is not provided
+  returns (r, maxnorm, l2norm)
+  '''
+  if r is None:
+    r = array.array('d', [0.0]) * len(b)
+  if numpy is not None:
+    maxnorm, l2norm = numpy_resid(transpose, is_complex, matrix, x, r, b)
+  else:
+    maxnorm, l2norm = python_resid(transpose, is_complex, matrix, x, r, b)
+  return (r, maxnorm, l2norm)
+
 def resid ( transpose, is_complex, matrix, x, r, b):
-    if is_complex:
-        return complex_resid(transpose, matrix, x, r, b)
-    else:
-        return real_resid(transpose, matrix, x, r, b)
+    return resid_norms(transpose, is_complex, matrix, x, b, r)[1]
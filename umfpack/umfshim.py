@@ -3,6 +3,111 @@ from . import umfpack_loader as umf
 import sys
 import os
 import array
+import collections
+import hashlib
+
+class symbolic_cache:
+    '''
+    LRU cache of symbolic factorizations keyed by the matrix sparsity pattern
+    '''
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.entries = collections.OrderedDict()
+
+    @staticmethod
+    def get_key(n, Ap, Ai, is_complex):
+        h = hashlib.sha256()
+        h.update(b'%d %d ' % (n, is_complex))
+        h.update(memoryview(Ap).cast('B'))
+        # Ai may be padded past the number of nonzeros
+        h.update(memoryview(Ai)[:Ap[n]].cast('B'))
+        return h.digest()
+
+    def get(self, key):
+        symbolic = self.entries.get(key)
+        if symbolic is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return symbolic
+
+    def add(self, key, symbolic):
+        if key in self.entries:
+            self.current_bytes -= self.entries.pop(key).size
+        if symbolic.size > self.max_bytes:
+            return
+        self.entries[key] = symbolic
+        self.current_bytes += symbolic.size
+        self.evict()
+
+    def evict(self):
+        while self.current_bytes > self.max_bytes:
+            _, symbolic = self.entries.popitem(last=False)
+            self.current_bytes -= symbolic.size
+
+    def clear(self):
+        self.entries.clear()
+        self.current_bytes = 0
+
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.evict()
+
+    def get_statistics(self):
+        return {
+          'hits' : self.hits,
+          'misses' : self.misses,
+          'entries' : len(self.entries),
+          'current_bytes' : self.current_bytes,
+          'max_bytes' : self.max_bytes,
+        }
+
+# shared by all solver objects in the process
+global_symbolic_cache = symbolic_cache(max_bytes=256*1024*1024)
+
+def set_symbolic_cache_size(max_bytes):
+    '''
+    sets the memory limit of the symbolic cache, 0 disables caching
+    '''
+    global_symbolic_cache.set_max_bytes(max_bytes)
+
+def get_symbolic_cache_statistics():
+    return global_symbolic_cache.get_statistics()
+
+# bytes allocated by the solver objects while solving
+allocation_statistics = {
+  'solves' : 0,
+  'bytes_allocated' : 0,
+  'last_solve_bytes' : 0,
+}
+
+def record_solve_allocation(nbytes):
+    allocation_statistics['solves'] += 1
+    allocation_statistics['bytes_allocated'] += nbytes
+    allocation_statistics['last_solve_bytes'] = nbytes
+
+def get_allocation_statistics():
+    return dict(allocation_statistics)
+
+# options applied to each new solver object
+solver_options = {
+  'diagnostics' : False,
+  'refinement_steps' : None,
+  'pivot_tolerance' : None,
+}
+
+def set_solver_diagnostics(enable=True, refinement_steps=None, pivot_tolerance=None):
+    '''
+    when enabled, UMFPACK statistics are returned as "solver_info" for each
+    iteration of devsim.solve(info=True)
+    '''
+    solver_options['diagnostics'] = enable
+    solver_options['refinement_steps'] = refinement_steps
+    solver_options['pivot_tolerance'] = pivot_tolerance
 
 class dsobject:
     def __init__(self, n, transpose):
@@ -15,7 +120,13 @@ class dsobject:
         self.gdata = None
         self.initialize_umfpack()
         self.umf_control = None
+        # persistent buffers, reallocated when n or complex changes
         self.x = None
+        self.X = None
+        self.B = None
+        self.workspace = None
+        self.bytes_allocated = 0
+        self.batch_x = None
 
     def __del__(self):
         self.matrix=None
@@ -44,27 +155,111 @@ class dsobject:
             else:
                 self.umf_control = umf.umf_control(self.gdata, 'real')
             #self.umf_control.init_verbose()
+            if solver_options['diagnostics']:
+                self.umf_control.enable_diagnostics(refinement_steps=solver_options['refinement_steps'])
+            if solver_options['pivot_tolerance'] is not None:
+                self.umf_control.set_pivot_tolerance(solver_options['pivot_tolerance'])
         # test same symbolic
-        self.matrix = umf.matrix(uc=self.umf_control, Ap=kwargs['Ap'], Ai=kwargs["Ai"], Ax=kwargs["Ax"])
+        if self.matrix:
+            self.matrix.set_arrays(Ap=kwargs['Ap'], Ai=kwargs["Ai"], Ax=kwargs["Ax"])
+        else:
+            self.matrix = umf.matrix(uc=self.umf_control, Ap=kwargs['Ap'], Ai=kwargs["Ai"], Ax=kwargs["Ax"])
         if not kwargs['is_same_symbolic']:
-          self.symbolic = self.umf_control.symbolic(matrix=self.matrix)
+          key = symbolic_cache.get_key(self.matrix.n, kwargs['Ap'], kwargs['Ai'], is_complex)
+          self.symbolic = global_symbolic_cache.get(key)
+          if self.symbolic is None:
+            self.symbolic = self.umf_control.symbolic(matrix=self.matrix)
+            global_symbolic_cache.add(key, self.symbolic)
         self.numeric = self.umf_control.numeric(matrix=self.matrix, Symbolic=self.symbolic)
         self.status = True
         self.message = ''
 
+    def allocate_buffers(self):
+        n = self.matrix.n
+        is_complex = self.umf_control.is_complex
+        if self.workspace and (self.workspace.n == n) and (self.workspace.is_complex == is_complex):
+            return
+        self.workspace = umf.solve_workspace(n, is_complex)
+        if is_complex:
+            self.x = array.array('d', [0.0]) * (2 * n)
+        else:
+            self.x = array.array('d', [0.0]) * n
+        self.X = umf.c_void_p(self.x.buffer_info()[0])
+        self.B = umf.c_void_p()
+        self.bytes_allocated += self.workspace.nbytes + self.x.itemsize * len(self.x)
+
     def solve(self, **kwargs):
         self.status = False
         self.message = ''
-        if self.umf_control.is_complex:
-            #print(kwargs.keys())
-            #raise RuntimeError("COMPLEX!")
-            self.x = array.array('d', [0.0])*len(kwargs['b'])
-            self.umf_control.solve(matrix=self.matrix, Numeric=self.numeric, b=kwargs['b'], transpose=self.transpose, x=self.x)
-        else:
-            self.x = array.array('d', kwargs['b'])
-            self.umf_control.solve(matrix=self.matrix, Numeric=self.numeric, b=kwargs['b'], transpose=self.transpose, x=self.x)
+        self.bytes_allocated = 0
+        self.allocate_buffers()
+        b = kwargs['b']
+        if memoryview(b).nbytes != self.x.itemsize * len(self.x):
+            self.message = 'b has size inconsistent with n=%d\n' % (self.matrix.n,)
+            return
+        self.B.value = umf.get_buffer_address(b)
+        self.umf_control.solve_address(matrix=self.matrix, Numeric=self.numeric, B=self.B, X=self.X, transpose=self.transpose, workspace=self.workspace)
+        record_solve_allocation(self.bytes_allocated)
+        self.status = True
+
+    def solve_batch(self, **kwargs):
+        '''
+        b contains nrhs right hand sides stored column major
+        the solutions are written into x when it is provided
+        '''
+        self.status = False
+        self.message = ''
+        self.bytes_allocated = 0
+        self.allocate_buffers()
+        nrhs = kwargs['nrhs']
+        b = kwargs['b']
+        x = kwargs.get('x', None)
+        is_complex = self.umf_control.is_complex
+        bview = get_column_major_view(b, 'b', self.matrix.n, nrhs, is_complex)
+        try:
+            umf.get_buffer_address(bview)
+        except TypeError:
+            # read only input is copied once for the whole batch
+            bcopy = array.array('d')
+            bcopy.frombytes(memoryview(bview))
+            bview = bcopy
+            self.bytes_allocated += bcopy.itemsize * len(bcopy)
+        if x is None:
+            if is_complex:
+                x = array.array('d', [0.0]) * (2 * self.matrix.n * nrhs)
+            else:
+                x = array.array('d', [0.0]) * (self.matrix.n * nrhs)
+            self.bytes_allocated += x.itemsize * len(x)
+        xview = get_column_major_view(x, 'x', self.matrix.n, nrhs, is_complex)
+        try:
+            umf.get_buffer_address(xview)
+        except TypeError:
+            raise ValueError('x must be a writable buffer')
+        self.umf_control.solve_batch(matrix=self.matrix, Numeric=self.numeric, b=bview, x=xview, nrhs=nrhs, transpose=self.transpose, workspace=self.workspace)
+        record_solve_allocation(self.bytes_allocated)
+        self.batch_x = x
         self.status = True
 
+def get_column_major_view(buf, name, n, nrhs, is_complex):
+    '''
+    returns buf, or a C contiguous view of its memory, after checking that it
+    holds nrhs right hand sides of n values one after the other.  buf is either
+    1 dimensional, or a Fortran ordered (n, nrhs) array.
+    '''
+    view = memoryview(buf)
+    if is_complex:
+        nbytes = 16 * n * nrhs
+    else:
+        nbytes = 8 * n * nrhs
+    if view.nbytes != nbytes:
+        raise ValueError('%s has size inconsistent with n=%d nrhs=%d' % (name, n, nrhs))
+    if view.ndim <= 1 and view.contiguous:
+        return buf
+    if view.ndim == 2 and view.shape[1] == nrhs and view.f_contiguous and umf.numpy is not None:
+        # the transpose is C ordered and shares the memory
+        return umf.numpy.asarray(buf).T
+    raise ValueError('%s must be 1 dimensional or a Fortran ordered (n, nrhs) array, found shape %s and strides %s' % (name, view.shape, view.strides))
+
 def local_solver_callback(**kwargs):
     #print(kwargs['action'])
     if (kwargs['action'] == 'init'):
@@ -88,18 +283,22 @@ def local_solver_callback(**kwargs):
     elif kwargs['action'] == 'solve':
         so = kwargs['solver_object']
         so.solve(**kwargs)
-        if kwargs['is_complex']:
-            return {
-              'status' : so.status,
-              'message' : so.message,
-              'x' : so.x,
-            }
-        else:
-            return {
-              'status' : so.status,
-              'message' : so.message,
-              'x' : so.x,
-            }
+        ret = {
+          'status' : so.status,
+          'message' : so.message,
+          'x' : so.x,
+        }
+        if so.umf_control.record_info:
+            ret['info'] = so.umf_control.get_info()
+        return ret
+    elif kwargs['action'] == 'solve_batch':
+        so = kwargs['solver_object']
+        so.solve_batch(**kwargs)
+        return {
+          'status' : so.status,
+          'message' : so.message,
+          'x' : so.batch_x,
+        }
     else:
         raise RuntimeError('Unsupported action, ' + kwargs['action'])
     return False